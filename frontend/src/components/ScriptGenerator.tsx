@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
 import { FaMagic, FaSpinner } from 'react-icons/fa';
+import type { ScriptScene } from '../types';
 
 interface ScriptGeneratorProps {
   onScriptGenerated: (script: any) => void;
@@ -21,13 +22,32 @@ const ScriptGenerator: React.FC<ScriptGeneratorProps> = ({ onScriptGenerated })
     setIsGenerating(true);
 
     try {
-      // Call the actual API
+      // Stream the generation so scenes appear as soon as they are written
       const { scriptService } = await import('../services/api');
-      const script = await scriptService.generateScript({
+      const request = {
         prompt,
         duration_preference: duration,
         genre: genre || undefined,
         tone: tone || undefined,
+      };
+      let content = '';
+      const scenes: ScriptScene[] = [];
+
+      const script = await scriptService.generateScriptStream(request, (event) => {
+        if (event.type === 'token') {
+          content += event.text;
+        } else if (event.type === 'scene') {
+          scenes.push(event.scene);
+        } else {
+          return;
+        }
+        onScriptGenerated({
+          title: prompt.split(/\s+/).slice(0, 5).join(' '),
+          author: 'AI Generated',
+          content,
+          scenes: [...scenes],
+          status: 'processing',
+        });
       });
 
       onScriptGenerated(script);
@@ -1,5 +1,11 @@
 import axios from 'axios';
-import type { Script, ScriptCreateRequest, ScriptGenerateRequest, ScriptResponse } from '../types';
+import type {
+  Script,
+  ScriptCreateRequest,
+  ScriptGenerateRequest,
+  ScriptResponse,
+  ScriptStreamEvent,
+} from '../types';
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || '/api/v1';
 
@@ -18,6 +24,49 @@ export const scriptService = {
     return response.data;
   },
 
+  // Generate script from prompt, receiving tokens and parsed scenes as they arrive
+  async generateScriptStream(
+    request: ScriptGenerateRequest,
+    onEvent: (event: ScriptStreamEvent) => void
+  ): Promise<Script> {
+    const response = await fetch(`${API_BASE_URL}/scripts/generate/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(request),
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Script generation failed with status ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let script = null as Script | null;
+
+    const handleLine = (line: string) => {
+      if (!line.trim()) return;
+      const event = JSON.parse(line) as ScriptStreamEvent;
+      if (event.type === 'error') throw new Error(event.detail);
+      if (event.type === 'script') script = event.script;
+      onEvent(event);
+    };
+
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop() ?? '';
+      lines.forEach(handleLine);
+    }
+    handleLine(buffer);
+
+    if (!script) {
+      throw new Error('Script stream ended before the script was complete');
+    }
+    return script;
+  },
+
   // Create/parse an existing script
   async createScript(request: ScriptCreateRequest): Promise<ScriptResponse> {
     const response = await api.post('/scripts', request);
@@ -34,8 +34,15 @@ export interface ScriptGenerateRequest {
   duration_preference?: number;
   genre?: string;
   tone?: string;
+  bypass_cache?: boolean;
 }
 
+export type ScriptStreamEvent =
+  | { type: 'token'; text: string }
+  | { type: 'scene'; scene: ScriptScene }
+  | { type: 'script'; script: Script }
+  | { type: 'error'; detail: string };
+
 export interface ScriptResponse {
   id: string;
   title: string;
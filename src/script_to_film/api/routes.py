@@ -1,9 +1,19 @@
 """API routes for the script-to-film platform."""
 
-from typing import List
-
-from fastapi import APIRouter, HTTPException, status
-
+import asyncio
+import json
+import logging
+import tarfile
+import uuid
+from dataclasses import asdict
+from typing import Any, AsyncIterator, List, Optional
+
+import anthropic
+from fastapi import APIRouter, File, HTTPException, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+
+from script_to_film.config.settings import settings
+from script_to_film.db import InvalidCursorError, ScriptRepository, VideoRepository, get_engine
 from script_to_film.models.script import (
     Script,
     ScriptCreateRequest,
@@ -12,19 +22,40 @@ from script_to_film.models.script import (
 )
 from script_to_film.models.video import (
     SceneVideoGenerateRequest,
+    Video,
     VideoGenerateRequest,
     VideoResponse,
     VideoScene,
     VideoStatus,
 )
 from script_to_film.services.ai_service import AIService
+from script_to_film.services.ingest import (
+    ScriptImporter,
+    expand_archive,
+    is_tarball,
+    new_script_id,
+)
+from script_to_film.services.job_queue import create_job_queue, new_job_id
+from script_to_film.services.rate_limiter import get_rate_limiter
+from script_to_film.services.resilience import circuit_states
 from script_to_film.services.script_parser import ScriptParser
 from script_to_film.services.video_generator import VideoGenerator
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 script_parser = ScriptParser()
 video_generator = VideoGenerator()
-ai_service = AIService()
+ai_service = AIService(speech=video_generator.speech)
+script_repository = ScriptRepository(get_engine())
+video_repository = VideoRepository(get_engine())
+job_queue = create_job_queue(script_repository, video_repository, video_generator)
+script_importer = ScriptImporter(
+    script_repository,
+    max_workers=settings.ingest_max_workers,
+    batch_size=settings.ingest_batch_size,
+    max_script_bytes=settings.ingest_max_script_bytes,
+)
 
 
 @router.get("/")
@@ -34,9 +65,27 @@ async def root() -> dict[str, str]:
 
 
 @router.get("/health")
-async def health_check() -> dict[str, str]:
-    """Health check endpoint."""
-    return {"status": "healthy"}
+async def health_check() -> dict[str, Any]:
+    """
+    Health check endpoint.
+
+    Reports ``degraded`` while any provider's circuit is open, with the state of
+    each provider circuit (``closed``, ``open`` or ``half_open``).
+    """
+    circuits = circuit_states()
+    degraded = any(state == "open" for state in circuits.values())
+    return {"status": "degraded" if degraded else "healthy", "circuits": circuits}
+
+
+@router.get("/rate-limits")
+async def rate_limits() -> dict[str, dict[str, int]]:
+    """
+    Queue depth and in-flight requests per provider quota scope on this worker.
+
+    Returns:
+        Counters by scope (``waiting``, ``in_flight``, ``throttled``)
+    """
+    return {scope: asdict(stats) for scope, stats in get_rate_limiter().stats().items()}
 
 
 # Script endpoints
@@ -56,8 +105,8 @@ async def create_script(request: ScriptCreateRequest) -> ScriptResponse:
         script_content=request.content, title=request.title, author=request.author
     )
 
-    # In production, save to database here
-    script.id = "script_123"  # Placeholder
+    script.id = new_script_id()
+    await script_repository.add(script)
 
     return ScriptResponse(
         id=script.id,
@@ -71,6 +120,92 @@ async def create_script(request: ScriptCreateRequest) -> ScriptResponse:
     )
 
 
+@router.post("/scripts/batch")
+async def import_scripts(files: List[UploadFile] = File(...)) -> StreamingResponse:
+    """
+    Import many screenplays at once.
+
+    Each uploaded file is one script titled after its file name; ``.tar``,
+    ``.tar.gz`` and ``.tgz`` uploads are expanded into the scripts they contain.
+    Scripts are parsed in a process pool and inserted in batches, and one NDJSON
+    line is streamed per script as soon as its batch is stored:
+
+    - ``{"type": "script", "name", "id", "title", "scene_count"}``
+    - ``{"type": "error", "name", "detail"}`` for a script that was not imported
+    - ``{"type": "summary", "imported", "failed"}`` last
+
+    The uploaded files together may not exceed ``ingest_max_upload_bytes``, nor
+    may the scripts in any one archive once expanded.
+
+    Args:
+        files: Script files and tarballs (multipart form field ``files``)
+
+    Returns:
+        Streaming NDJSON response
+
+    Raises:
+        HTTPException: 413 if the uploads are too large
+    """
+    sources: list[tuple[str, bytes]] = []
+    rejected: list[dict[str, Any]] = []
+    remaining = settings.ingest_max_upload_bytes
+    for upload in files:
+        name = upload.filename or "script"
+        content = await upload.read(remaining + 1)
+        remaining -= len(content)
+        if remaining < 0:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Uploads exceed {settings.ingest_max_upload_bytes} bytes",
+            )
+        if not is_tarball(name):
+            sources.append((name, content))
+            continue
+        try:
+            # Decompressing is CPU-bound: keep it off the event loop
+            members, oversized = await asyncio.to_thread(
+                expand_archive,
+                name,
+                content,
+                settings.ingest_max_script_bytes,
+                settings.ingest_max_upload_bytes,
+            )
+        except ValueError as e:
+            rejected.append({"type": "error", "name": name, "detail": str(e)})
+            continue
+        except (tarfile.TarError, EOFError, OSError) as e:
+            rejected.append({"type": "error", "name": name, "detail": f"Unreadable archive: {e}"})
+            continue
+        sources.extend(members)
+        rejected.extend(
+            {"type": "error", "name": result.name, "detail": result.error} for result in oversized
+        )
+
+    async def events() -> AsyncIterator[str]:
+        imported = 0
+        failed = len(rejected)
+        for event in rejected:
+            yield _ndjson(event)
+        async for result in script_importer.ingest(sources):
+            if result.error is not None:
+                failed += 1
+                yield _ndjson({"type": "error", "name": result.name, "detail": result.error})
+                continue
+            imported += 1
+            yield _ndjson(
+                {
+                    "type": "script",
+                    "name": result.name,
+                    "id": result.script_id,
+                    "title": result.title,
+                    "scene_count": result.scene_count,
+                }
+            )
+        yield _ndjson({"type": "summary", "imported": imported, "failed": failed})
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 @router.get("/scripts/{script_id}", response_model=ScriptResponse)
 async def get_script(script_id: str) -> ScriptResponse:
     """
@@ -82,24 +217,44 @@ async def get_script(script_id: str) -> ScriptResponse:
     Returns:
         Script response
     """
-    # In production, fetch from database
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Script not found")
+    script = await script_repository.get_summary(script_id)
+    if script is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Script not found")
+    return script
 
 
 @router.get("/scripts", response_model=List[ScriptResponse])
-async def list_scripts(skip: int = 0, limit: int = 100) -> List[ScriptResponse]:
+async def list_scripts(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    script_status: Optional[str] = Query(None, alias="status"),
+) -> List[ScriptResponse]:
     """
-    List all scripts.
+    List scripts, newest first.
+
+    Pages are keyset-paginated: when more results exist the ``X-Next-Cursor``
+    response header holds the cursor to pass for the next page.
 
     Args:
-        skip: Number of records to skip
+        response: Outgoing response (for the pagination header)
         limit: Maximum number of records to return
+        cursor: Cursor from the previous page's ``X-Next-Cursor`` header
+        script_status: Only return scripts with this status
 
     Returns:
         List of script responses
     """
-    # In production, fetch from database
-    return []
+    try:
+        scripts, next_cursor = await script_repository.list_page(
+            limit=limit, cursor=cursor, status=script_status
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return scripts
 
 
 @router.post("/scripts/generate", response_model=Script, status_code=status.HTTP_201_CREATED)
@@ -112,31 +267,113 @@ async def generate_script(request: ScriptGenerateRequest) -> Script:
 
     Returns:
         Generated and parsed script
+
+    Raises:
+        ProviderUnavailableError: If Anthropic is down (answered with 503)
     """
     # Generate script content using AI
-    script_content = await ai_service.generate_script(
-        prompt=request.prompt,
-        duration_preference=request.duration_preference,
-        genre=request.genre,
-        tone=request.tone,
+    try:
+        script_content = await ai_service.generate_script(
+            prompt=request.prompt,
+            duration_preference=request.duration_preference,
+            genre=request.genre,
+            tone=request.tone,
+            use_cache=not request.bypass_cache,
+        )
+    except anthropic.APIStatusError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY, detail="Script generation was rejected"
+        ) from e
+
+    # Parse the generated script
+    script = script_parser.parse(
+        script_content=script_content,
+        title=_title_from_prompt(request.prompt),
+        author="AI Generated",
     )
 
-    # Extract title from prompt (first few words)
-    title = " ".join(request.prompt.split()[:5])
-    if len(request.prompt.split()) > 5:
-        title += "..."
+    script.id = new_script_id()
+    await script_repository.add(script)
 
-    # Parse the generated script
-    script = script_parser.parse(script_content=script_content, title=title, author="AI Generated")
+    return script
 
-    # Generate a unique ID
-    import uuid
 
-    script.id = f"script_{uuid.uuid4().hex[:12]}"
+@router.post("/scripts/generate/stream")
+async def generate_script_stream(request: ScriptGenerateRequest) -> StreamingResponse:
+    """
+    Generate a script from a prompt, streaming progress as newline-delimited JSON.
 
-    # In production, save to database here
+    Each line is one event: ``token`` events forward generated text as it arrives,
+    ``scene`` events carry each parsed scene as soon as the next scene heading closes
+    it, and a final ``script`` event carries the complete parsed script. An ``error``
+    event is sent if generation fails part-way through.
 
-    return script
+    Args:
+        request: Script generation request with prompt and preferences
+
+    Returns:
+        Streaming NDJSON response
+
+    Raises:
+        ProviderUnavailableError: If Anthropic is down before streaming starts
+            (answered with 503)
+    """
+    title = _title_from_prompt(request.prompt)
+    chunks = ai_service.stream_script(
+        prompt=request.prompt,
+        duration_preference=request.duration_preference,
+        genre=request.genre,
+        tone=request.tone,
+        use_cache=not request.bypass_cache,
+    )
+    # Wait for the first chunk so an unavailable provider gets a real error status
+    try:
+        first: Optional[str] = await anext(chunks)
+    except StopAsyncIteration:
+        first = None
+    except anthropic.APIStatusError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY, detail="Script generation was rejected"
+        ) from e
+
+    async def generated() -> AsyncIterator[str]:
+        if first is not None:
+            yield first
+            async for text in chunks:
+                yield text
+
+    async def events() -> AsyncIterator[str]:
+        parser = script_parser.incremental(keep_content=True)
+        scenes = []
+
+        try:
+            async for text in generated():
+                yield _ndjson({"type": "token", "text": text})
+                for scene in parser.feed(text):
+                    scenes.append(scene)
+                    yield _ndjson({"type": "scene", "scene": scene.model_dump(mode="json")})
+
+            for scene in parser.close():
+                scenes.append(scene)
+                yield _ndjson({"type": "scene", "scene": scene.model_dump(mode="json")})
+
+            script = script_parser.build_script(
+                script_content=parser.content, title=title, author="AI Generated", scenes=scenes
+            )
+            script.id = new_script_id()
+            await script_repository.add(script)
+
+            yield _ndjson({"type": "script", "script": script.model_dump(mode="json")})
+
+        except Exception as e:
+            logger.exception("Error streaming script generation: %s", e)
+            yield _ndjson({"type": "error", "detail": "Script generation failed"})
+
+    return StreamingResponse(
+        events(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/scripts/{script_id}/video-prompts", response_model=Script)
@@ -150,31 +387,56 @@ async def generate_video_prompts(script_id: str) -> Script:
     Returns:
         Script with video prompts added to each scene
     """
-    # In production, fetch script from database
-    # For now, return mock data
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Video prompt generation endpoint - fetch script from DB and generate prompts",
-    )
+    script = await script_repository.get(script_id)
+    if script is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Script not found")
+
+    if any(scene.video_prompt is None for scene in script.scenes):
+        # Re-parse scenes stored without prompts; the parser builds one per scene
+        reparsed = script_parser.parse(
+            script_content=script.content, title=script.title, author=script.author
+        )
+        script.scenes = reparsed.scenes
+        script.total_duration = reparsed.total_duration
+        await script_repository.update_scenes(script)
+
+    return script
 
 
 # Video endpoints
-@router.post("/videos", response_model=VideoResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/videos", response_model=VideoResponse, status_code=status.HTTP_202_ACCEPTED)
 async def generate_video(request: VideoGenerateRequest) -> VideoResponse:
     """
-    Generate a video from a script.
+    Queue a background job that renders a video from a script.
+
+    Returns immediately; poll ``GET /videos/{id}`` for overall and per-scene status.
 
     Args:
         request: Video generation request
 
     Returns:
-        Video generation response
+        The pending video, including its job ID
     """
-    # In production, fetch script from database and queue video generation task
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Video generation not yet implemented",
+    script = await script_repository.get(request.script_id)
+    if script is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Script not found")
+
+    video = Video(
+        id=f"video_{uuid.uuid4().hex[:12]}",
+        script_id=script.id,
+        job_id=new_job_id(),
+        title=script.title,
+        resolution=request.resolution,
+        fps=request.fps,
+        scenes=[
+            VideoScene(scene_number=index, duration=scene.duration_seconds or 0)
+            for index, scene in enumerate(script.scenes)
+        ],
     )
+    await video_repository.add(video)
+    await job_queue.enqueue(video.id, video.job_id)
+
+    return _video_response(video)
 
 
 @router.get("/videos/{video_id}", response_model=VideoResponse)
@@ -188,24 +450,46 @@ async def get_video(video_id: str) -> VideoResponse:
     Returns:
         Video response
     """
-    # In production, fetch from database
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
+    video = await video_repository.get(video_id)
+    if video is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
+    return _video_response(video)
 
 
 @router.get("/videos", response_model=List[VideoResponse])
-async def list_videos(skip: int = 0, limit: int = 100) -> List[VideoResponse]:
+async def list_videos(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    video_status: Optional[VideoStatus] = Query(None, alias="status"),
+    script_id: Optional[str] = None,
+) -> List[VideoResponse]:
     """
-    List all videos.
+    List videos, newest first.
+
+    Pages are keyset-paginated: when more results exist the ``X-Next-Cursor``
+    response header holds the cursor to pass for the next page.
 
     Args:
-        skip: Number of records to skip
+        response: Outgoing response (for the pagination header)
         limit: Maximum number of records to return
+        cursor: Cursor from the previous page's ``X-Next-Cursor`` header
+        video_status: Only return videos with this status
+        script_id: Only return videos of this script
 
     Returns:
         List of video responses
     """
-    # In production, fetch from database
-    return []
+    try:
+        videos, next_cursor = await video_repository.list_page(
+            limit=limit, cursor=cursor, status=video_status, script_id=script_id
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return [_video_response(video) for video in videos]
 
 
 @router.post("/videos/scene", response_model=VideoScene, status_code=status.HTTP_201_CREATED)
@@ -218,9 +502,15 @@ async def generate_scene_video(request: SceneVideoGenerateRequest) -> VideoScene
 
     Returns:
         VideoScene with generation status and video path
+
+    Raises:
+        ProviderUnavailableError: If Runway is down (answered with 503)
     """
     from script_to_film.models.script import ScriptScene
 
+    # Fail fast rather than let the scene run into an open circuit
+    video_generator.runway.resilience.check()
+
     # Convert request to ScriptScene
     scene = ScriptScene(
         scene_number=request.scene_number,
@@ -238,7 +528,42 @@ async def generate_scene_video(request: SceneVideoGenerateRequest) -> VideoScene
     if video_scene is None or video_scene.status == VideoStatus.FAILED:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to generate video for scene. Check backend logs for details.",
+            detail=(
+                video_scene.error
+                if video_scene is not None and video_scene.error
+                else "Failed to generate video for scene. Check backend logs for details."
+            ),
         )
 
     return video_scene
+
+
+def _title_from_prompt(prompt: str) -> str:
+    """Extract a script title from the prompt (first few words)."""
+    title = " ".join(prompt.split()[:5])
+    if len(prompt.split()) > 5:
+        title += "..."
+    return title
+
+
+def _video_response(video: Video) -> VideoResponse:
+    """Build the API response for a stored video."""
+    return VideoResponse(
+        id=video.id,
+        script_id=video.script_id,
+        job_id=video.job_id,
+        status=video.status.value,
+        url=video.output_path if video.status == VideoStatus.COMPLETED else None,
+        preview_url=video.playlist_path,
+        duration=video.duration,
+        resolution=video.resolution,
+        fps=video.fps,
+        scenes=video.scenes,
+        created_at=video.created_at,
+        updated_at=video.updated_at,
+    )
+
+
+def _ndjson(event: dict[str, Any]) -> str:
+    """Serialize one streaming event as a line of NDJSON."""
+    return json.dumps(event) + "\n"
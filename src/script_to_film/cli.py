@@ -0,0 +1,125 @@
+"""Command-line entry points."""
+
+import argparse
+import asyncio
+import json
+import sys
+import tarfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterator, Optional
+
+from script_to_film.config.settings import settings
+from script_to_film.db import ScriptRepository, close_db, get_engine, init_db
+from script_to_film.services.ingest import (
+    IngestResult,
+    ScriptImporter,
+    expand_archive,
+    is_tarball,
+    path_sources,
+)
+from script_to_film.utils.logger import setup_logger
+
+
+async def import_scripts(paths: list[Path], importer: ScriptImporter) -> int:
+    """
+    Import scripts, writing one NDJSON result per script to stdout.
+
+    Archives are expanded within the same size limits as API uploads.
+
+    Args:
+        paths: Directories, tarballs or script files
+        importer: Importer bound to the database
+
+    Returns:
+        Number of scripts that were not imported
+    """
+    failed = 0
+
+    def report(result: IngestResult) -> None:
+        nonlocal failed
+        failed += result.error is not None
+        print(json.dumps(asdict(result)), flush=True)
+
+    def sources() -> Iterator[tuple[str, bytes]]:
+        for path in paths:
+            if not is_tarball(path.name):
+                yield from path_sources(path)
+                continue
+            try:
+                members, oversized = expand_archive(
+                    path.name,
+                    path.read_bytes(),
+                    settings.ingest_max_script_bytes,
+                    settings.ingest_max_upload_bytes,
+                )
+            except ValueError as e:
+                report(IngestResult(name=path.name, error=str(e)))
+                continue
+            except (tarfile.TarError, EOFError, OSError) as e:
+                report(IngestResult(name=path.name, error=f"Unreadable archive: {e}"))
+                continue
+            for result in oversized:
+                report(result)
+            yield from members
+
+    try:
+        async for result in importer.ingest(sources()):
+            report(result)
+    finally:
+        importer.shutdown()
+    return failed
+
+
+async def _import_main(args: argparse.Namespace) -> int:
+    await init_db()
+    importer = ScriptImporter(
+        ScriptRepository(get_engine()),
+        max_workers=args.workers,
+        batch_size=args.batch_size,
+        max_script_bytes=settings.ingest_max_script_bytes,
+    )
+    try:
+        return await import_scripts(args.paths, importer)
+    finally:
+        await close_db()
+
+
+def import_main(argv: Optional[list[str]] = None) -> int:
+    """
+    Bulk-import screenplays into the database (``script-to-film-import``).
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv``)
+
+    Returns:
+        Exit status: 0 if every script was imported, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(
+        prog="script-to-film-import",
+        description="Parse screenplays in parallel and store them; prints NDJSON results.",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="script directories (searched recursively), .tar/.tar.gz/.tgz archives or files",
+    )
+    parser.add_argument("--workers", type=int, default=settings.ingest_max_workers)
+    parser.add_argument("--batch-size", type=int, default=settings.ingest_batch_size)
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        if not path.exists():
+            parser.error(f"{path} does not exist")
+
+    # stdout carries the NDJSON results
+    setup_logger("script_to_film", settings.log_level, settings.log_format, stream=sys.stderr)
+    failed = asyncio.run(_import_main(args))
+    if failed:
+        print(f"{failed} script(s) were not imported", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(import_main())
@@ -14,6 +14,10 @@ class Settings(BaseSettings):
     api_env: str = "development"
     debug: bool = False
 
+    # Logging ("text" lines or one JSON object per line) and Prometheus metrics at GET /metrics
+    log_level: str = "INFO"
+    log_format: str = "text"
+
     # Database
     database_url: str
     database_pool_size: int = 10
@@ -27,6 +31,37 @@ class Settings(BaseSettings):
     runway_api_key: str
     runwayml_api_secret: str
 
+    # Anthropic API client
+    anthropic_base_url: str = "https://api.anthropic.com"
+    anthropic_model: str = "claude-sonnet-4-5"
+    anthropic_max_tokens: int = 8192
+    anthropic_timeout: float = 120.0
+    anthropic_connect_timeout: float = 10.0
+    anthropic_max_connections: int = 20
+    anthropic_max_concurrent_requests: int = 10
+
+    # Script cache
+    script_cache_enabled: bool = True
+    script_cache_max_entries: int = 256
+    script_cache_ttl_seconds: int = 86400
+    script_cache_redis_enabled: bool = False
+
+    # Runway API client
+    runway_api_base_url: str = "https://api.dev.runwayml.com"
+    runway_api_version: str = "2024-11-06"
+    runway_request_timeout: float = 30.0
+    runway_max_connections: int = 20
+    download_chunk_size: int = 1024 * 1024
+    download_max_attempts: int = 3
+
+    # Runway task polling (exponential backoff with jitter, one deadline per scene)
+    runway_poll_initial_interval: float = 1.0
+    runway_poll_max_interval: float = 15.0
+    runway_poll_multiplier: float = 1.5
+    runway_poll_jitter: float = 0.2
+    runway_poll_max_concurrent_checks: int = 10
+    runway_scene_deadline: float = 420.0
+
     # Storage (AWS S3)
     aws_access_key_id: str
     aws_secret_access_key: str
@@ -36,6 +71,24 @@ class Settings(BaseSettings):
     # Celery
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
+    job_queue_backend: str = "celery"  # "celery" or "inprocess" (single process, no Redis)
+
+    # Provider quotas shared by every call (scopes: "<provider>", "<provider>:<model>",
+    # "<provider>@<tenant>"; rate in requests/s, burst in requests, optional concurrency)
+    rate_limits: dict[str, dict[str, float]] = {
+        "runway": {"rate": 10, "burst": 20},
+        "anthropic": {"rate": 0.8, "burst": 5},
+        "openai": {"rate": 5, "burst": 10, "concurrency": 8},
+    }
+    rate_limit_redis_enabled: bool = False  # share quotas across workers through Redis
+
+    # Provider resilience: transient errors (timeouts, 429, 5xx) are retried with jittered
+    # backoff; consecutive failures open a per-provider circuit that fails calls fast
+    retry_max_attempts: int = 4
+    retry_initial_delay: float = 0.5
+    retry_max_delay: float = 8.0
+    circuit_failure_threshold: int = 5
+    circuit_reset_seconds: float = 30.0
 
     # Application Settings
     max_script_length: int = 10000
@@ -44,6 +97,46 @@ class Settings(BaseSettings):
     output_video_resolution: str = "1920x1080"
     output_video_fps: int = 30
 
+    # Rendering concurrency
+    max_concurrent_scenes: int = 6
+    max_concurrent_scenes_per_job: int = 3
+    max_concurrent_keyframes: int = 16  # text-to-image stage, ahead of the scene limits
+
+    # Render cache (under the output directory)
+    render_cache_enabled: bool = True
+    render_cache_max_bytes: int = 10 * 1024**3
+    render_cache_image_ttl_seconds: int = 12 * 3600
+
+    # Final film composition (ffmpeg)
+    composite_enabled: bool = True
+    composite_max_workers: int = 2
+    ffmpeg_path: str = "ffmpeg"
+    ffprobe_path: str = "ffprobe"
+    progressive_assembly_enabled: bool = True
+    hls_segment_seconds: float = 4.0
+    thumbnails_enabled: bool = True
+    thumbnail_width: int = 480
+    preview_strip_frames: int = 4
+    preview_strip_tile_width: int = 240
+
+    # Dialogue speech synthesis (line cache under the render cache directory); opt-in
+    # because the OpenAI backend bills every line
+    speech_enabled: bool = False
+    speech_backend: str = "openai"  # "openai" or "stub" (offline tones, for tests and demos)
+    openai_base_url: str = "https://api.openai.com/v1"
+    openai_tts_model: str = "gpt-4o-mini-tts"
+    speech_max_concurrent_requests: int = 8
+    speech_line_gap_seconds: float = 0.25
+
+    # Bulk script import (POST /scripts/batch and the script-to-film-import command)
+    ingest_max_workers: int = 4  # parser processes
+    ingest_batch_size: int = 100  # scripts per insert transaction
+    ingest_max_script_bytes: int = 5 * 1024**2
+    ingest_max_upload_bytes: int = 100 * 1024**2  # per request, and per archive once expanded
+
+    # Per-job output directories (under the output directory)
+    artifact_gc_max_age_seconds: int = 6 * 3600
+
     # Security
     secret_key: str
     jwt_algorithm: str = "HS256"
@@ -0,0 +1,18 @@
+"""Database access layer."""
+
+from script_to_film.db.repository import (
+    InvalidCursorError,
+    ScriptRepository,
+    VideoRepository,
+)
+from script_to_film.db.session import close_db, create_engine, get_engine, init_db
+
+__all__ = [
+    "InvalidCursorError",
+    "ScriptRepository",
+    "VideoRepository",
+    "close_db",
+    "create_engine",
+    "get_engine",
+    "init_db",
+]
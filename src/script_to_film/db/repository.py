@@ -0,0 +1,473 @@
+"""Repositories for persisting scripts and videos."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import Table, and_, delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from script_to_film.db.tables import script_scenes, scripts, video_scenes, videos
+from script_to_film.models.script import Script, ScriptResponse, ScriptScene
+from script_to_film.models.video import Video, VideoScene, VideoStatus
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """
+    Encode the position after a row as an opaque pagination cursor.
+
+    Args:
+        created_at: Creation timestamp of the last row returned
+        row_id: ID of the last row returned
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([created_at.isoformat(), row_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a pagination cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (created_at, id)
+    """
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+def _page(table: Table, query: Any, limit: int, cursor: Optional[str]) -> Any:
+    """Apply newest-first keyset pagination on (created_at, id) to ``query``."""
+    if cursor is not None:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(
+            or_(
+                table.c.created_at < created_at,
+                and_(table.c.created_at == created_at, table.c.id < row_id),
+            )
+        )
+    return query.order_by(table.c.created_at.desc(), table.c.id.desc()).limit(limit)
+
+
+def _next_cursor(rows: list[Any], limit: int) -> Optional[str]:
+    """Cursor for the page after ``rows``, or None when this was the last page."""
+    if len(rows) < limit:
+        return None
+    return encode_cursor(rows[-1].created_at, rows[-1].id)
+
+
+class ScriptRepository:
+    """Stores scripts and their parsed scenes."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            engine: Async database engine
+        """
+        self.engine = engine
+
+    async def add(self, script: Script) -> Script:
+        """
+        Insert a script and its scenes in one transaction.
+
+        Args:
+            script: Script with an assigned ID
+
+        Returns:
+            The stored script
+        """
+        await self.add_many([script])
+        return script
+
+    async def add_many(self, items: list[Script]) -> None:
+        """
+        Insert several scripts in one transaction, batching all scene rows.
+
+        Args:
+            items: Scripts with assigned IDs
+        """
+        if not items:
+            return
+
+        async with self.engine.begin() as conn:
+            await conn.execute(insert(scripts), [_script_row(script) for script in items])
+            scene_rows = [
+                _scene_row(script.id, scene) for script in items for scene in script.scenes
+            ]
+            if scene_rows:
+                await conn.execute(insert(script_scenes), scene_rows)
+
+    async def get(self, script_id: str) -> Optional[Script]:
+        """
+        Fetch a script with its scenes.
+
+        Args:
+            script_id: Script ID
+
+        Returns:
+            Script, or None if it does not exist
+        """
+        async with self.engine.connect() as conn:
+            row = (
+                await conn.execute(select(scripts).where(scripts.c.id == script_id))
+            ).one_or_none()
+            if row is None:
+                return None
+
+            scene_rows = await conn.execute(
+                select(script_scenes)
+                .where(script_scenes.c.script_id == script_id)
+                .order_by(script_scenes.c.scene_number)
+            )
+            scenes = [
+                ScriptScene(
+                    scene_number=scene.scene_number,
+                    location=scene.location,
+                    time_of_day=scene.time_of_day,
+                    description=scene.description,
+                    dialogue=scene.dialogue,
+                    duration_seconds=scene.duration_seconds,
+                    video_prompt=scene.video_prompt,
+                )
+                for scene in scene_rows
+            ]
+
+        return Script(
+            id=row.id,
+            title=row.title,
+            author=row.author,
+            content=row.content,
+            scenes=scenes,
+            total_duration=row.total_duration,
+            status=row.status,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    async def get_summary(self, script_id: str) -> Optional[ScriptResponse]:
+        """
+        Fetch script metadata without loading content or scenes.
+
+        Args:
+            script_id: Script ID
+
+        Returns:
+            Script response, or None if it does not exist
+        """
+        async with self.engine.connect() as conn:
+            row = (
+                await conn.execute(_summary_query().where(scripts.c.id == script_id))
+            ).one_or_none()
+        return _script_response(row) if row is not None else None
+
+    async def list_page(
+        self, limit: int = 100, cursor: Optional[str] = None, status: Optional[str] = None
+    ) -> tuple[list[ScriptResponse], Optional[str]]:
+        """
+        List scripts newest first using keyset pagination.
+
+        Args:
+            limit: Maximum number of scripts to return
+            cursor: Cursor returned with the previous page
+            status: Only return scripts with this status
+
+        Returns:
+            Tuple of (scripts, cursor for the next page or None)
+        """
+        query = _summary_query()
+        if status is not None:
+            query = query.where(scripts.c.status == status)
+
+        async with self.engine.connect() as conn:
+            rows = (await conn.execute(_page(scripts, query, limit, cursor))).all()
+        return [_script_response(row) for row in rows], _next_cursor(rows, limit)
+
+    async def update_scenes(self, script: Script) -> None:
+        """
+        Replace the stored scenes of a script (e.g. after adding video prompts).
+
+        Args:
+            script: Script with updated scenes
+        """
+        script.updated_at = datetime.utcnow()
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                update(scripts)
+                .where(scripts.c.id == script.id)
+                .values(total_duration=script.total_duration, updated_at=script.updated_at)
+            )
+            await conn.execute(delete(script_scenes).where(script_scenes.c.script_id == script.id))
+            if script.scenes:
+                await conn.execute(
+                    insert(script_scenes), [_scene_row(script.id, s) for s in script.scenes]
+                )
+
+
+class VideoRepository:
+    """Stores videos and per-scene render state."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            engine: Async database engine
+        """
+        self.engine = engine
+
+    async def add(self, video: Video) -> Video:
+        """
+        Insert a video and its scenes in one transaction.
+
+        Args:
+            video: Video with an assigned ID
+
+        Returns:
+            The stored video
+        """
+        async with self.engine.begin() as conn:
+            await conn.execute(insert(videos).values(**_video_row(video)))
+            await _insert_video_scenes(conn, video.id, video.scenes)
+        return video
+
+    async def get(self, video_id: str) -> Optional[Video]:
+        """
+        Fetch a video with its scenes.
+
+        Args:
+            video_id: Video ID
+
+        Returns:
+            Video, or None if it does not exist
+        """
+        async with self.engine.connect() as conn:
+            row = (await conn.execute(select(videos).where(videos.c.id == video_id))).one_or_none()
+            if row is None:
+                return None
+
+            scene_rows = await conn.execute(
+                select(video_scenes)
+                .where(video_scenes.c.video_id == video_id)
+                .order_by(video_scenes.c.scene_number)
+            )
+            scenes = [
+                VideoScene(
+                    scene_number=scene.scene_number,
+                    visual_path=scene.visual_path,
+                    audio_path=scene.audio_path,
+                    thumbnail_path=scene.thumbnail_path,
+                    preview_path=scene.preview_path,
+                    duration=scene.duration,
+                    status=VideoStatus(scene.status),
+                    error=scene.error,
+                )
+                for scene in scene_rows
+            ]
+
+        return _video(row, scenes)
+
+    async def list_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        status: Optional[VideoStatus] = None,
+        script_id: Optional[str] = None,
+    ) -> tuple[list[Video], Optional[str]]:
+        """
+        List videos newest first using keyset pagination (scenes are not loaded).
+
+        Args:
+            limit: Maximum number of videos to return
+            cursor: Cursor returned with the previous page
+            status: Only return videos with this status
+            script_id: Only return videos of this script
+
+        Returns:
+            Tuple of (videos, cursor for the next page or None)
+        """
+        query = select(videos)
+        if status is not None:
+            query = query.where(videos.c.status == VideoStatus(status).value)
+        if script_id is not None:
+            query = query.where(videos.c.script_id == script_id)
+
+        async with self.engine.connect() as conn:
+            rows = (await conn.execute(_page(videos, query, limit, cursor))).all()
+        return [_video(row, []) for row in rows], _next_cursor(rows, limit)
+
+    async def save(self, video: Video) -> None:
+        """
+        Update a video's metadata and replace its scenes.
+
+        Args:
+            video: Video with updated fields
+        """
+        video.updated_at = datetime.utcnow()
+        row = _video_row(video)
+        del row["id"], row["created_at"]
+        async with self.engine.begin() as conn:
+            # Scenes first, so a reader never sees a finished video with missing scenes
+            await conn.execute(delete(video_scenes).where(video_scenes.c.video_id == video.id))
+            await _insert_video_scenes(conn, video.id, video.scenes)
+            await conn.execute(update(videos).where(videos.c.id == video.id).values(**row))
+
+    async def save_scene(self, video_id: str, scene: VideoScene) -> None:
+        """
+        Insert or replace the state of one scene.
+
+        Args:
+            video_id: Video ID
+            scene: Scene state
+        """
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                delete(video_scenes).where(
+                    video_scenes.c.video_id == video_id,
+                    video_scenes.c.scene_number == scene.scene_number,
+                )
+            )
+            await _insert_video_scenes(conn, video_id, [scene])
+            await conn.execute(
+                update(videos).where(videos.c.id == video_id).values(updated_at=datetime.utcnow())
+            )
+
+
+def _summary_query() -> Any:
+    """Select script metadata with a scene count."""
+    scene_count = (
+        select(func.count())
+        .where(script_scenes.c.script_id == scripts.c.id)
+        .correlate(scripts)
+        .scalar_subquery()
+    )
+    return select(
+        scripts.c.id,
+        scripts.c.title,
+        scripts.c.author,
+        scripts.c.status,
+        scripts.c.total_duration,
+        scripts.c.created_at,
+        scripts.c.updated_at,
+        scene_count.label("scene_count"),
+    )
+
+
+def _script_row(script: Script) -> dict[str, Any]:
+    """Row values for a script."""
+    return {
+        "id": script.id,
+        "title": script.title,
+        "author": script.author,
+        "content": script.content,
+        "total_duration": script.total_duration,
+        "status": script.status,
+        "created_at": script.created_at,
+        "updated_at": script.updated_at,
+    }
+
+
+def _scene_row(script_id: str, scene: ScriptScene) -> dict[str, Any]:
+    """Row values for a script scene."""
+    return {
+        "script_id": script_id,
+        "scene_number": scene.scene_number,
+        "location": scene.location,
+        "time_of_day": scene.time_of_day,
+        "description": scene.description,
+        "dialogue": scene.dialogue,
+        "duration_seconds": scene.duration_seconds,
+        "video_prompt": scene.video_prompt,
+    }
+
+
+def _script_response(row: Any) -> ScriptResponse:
+    """Build a script response from a summary row."""
+    return ScriptResponse(
+        id=row.id,
+        title=row.title,
+        author=row.author,
+        status=row.status,
+        scene_count=row.scene_count,
+        total_duration=row.total_duration,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+def _video_row(video: Video) -> dict[str, Any]:
+    """Row values for a video."""
+    return {
+        "id": video.id,
+        "script_id": video.script_id,
+        "job_id": video.job_id,
+        "title": video.title,
+        "resolution": video.resolution,
+        "fps": video.fps,
+        "status": VideoStatus(video.status).value,
+        "output_path": video.output_path,
+        "playlist_path": video.playlist_path,
+        "thumbnail_path": video.thumbnail_path,
+        "duration": video.duration,
+        "created_at": video.created_at,
+        "updated_at": video.updated_at,
+    }
+
+
+def _video(row: Any, scenes: list[VideoScene]) -> Video:
+    """Build a video model from a row."""
+    return Video(
+        id=row.id,
+        script_id=row.script_id,
+        job_id=row.job_id,
+        title=row.title,
+        scenes=scenes,
+        resolution=row.resolution,
+        fps=row.fps,
+        status=VideoStatus(row.status),
+        output_path=row.output_path,
+        playlist_path=row.playlist_path,
+        thumbnail_path=row.thumbnail_path,
+        duration=row.duration,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+async def _insert_video_scenes(
+    conn: AsyncConnection, video_id: str, scenes: list[VideoScene]
+) -> None:
+    """Batch-insert scene rows for a video."""
+    if not scenes:
+        return
+    await conn.execute(
+        insert(video_scenes),
+        [
+            {
+                "video_id": video_id,
+                "scene_number": scene.scene_number,
+                "visual_path": scene.visual_path,
+                "audio_path": scene.audio_path,
+                "thumbnail_path": scene.thumbnail_path,
+                "preview_path": scene.preview_path,
+                "duration": scene.duration,
+                "status": VideoStatus(scene.status).value,
+                "error": scene.error,
+            }
+            for scene in scenes
+        ],
+    )
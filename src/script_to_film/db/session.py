@@ -0,0 +1,115 @@
+"""Database engine and connection pool management."""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateColumn
+
+from script_to_film.config.settings import settings
+from script_to_film.db.tables import metadata
+
+logger = logging.getLogger(__name__)
+
+# Async drivers used for URLs that name only the database backend
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+_engine: Optional[AsyncEngine] = None
+
+
+def create_engine(url: Optional[str] = None, pool_size: Optional[int] = None) -> AsyncEngine:
+    """
+    Create an async engine with a connection pool.
+
+    Plain ``postgresql://`` and ``sqlite://`` URLs are upgraded to their async
+    drivers. In-memory SQLite shares a single connection so every session sees
+    the same database.
+
+    Args:
+        url: Database URL (defaults to settings)
+        pool_size: Connection pool size (defaults to settings)
+
+    Returns:
+        Async SQLAlchemy engine
+    """
+    database_url = make_url(url or settings.database_url)
+    if "+" not in database_url.drivername and database_url.drivername in ASYNC_DRIVERS:
+        database_url = database_url.set(
+            drivername=f"{database_url.drivername}+{ASYNC_DRIVERS[database_url.drivername]}"
+        )
+
+    if database_url.get_backend_name() == "sqlite":
+        if database_url.database in (None, "", ":memory:"):
+            return create_async_engine(
+                database_url,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+            )
+        return create_async_engine(database_url)
+
+    return create_async_engine(
+        database_url,
+        pool_size=pool_size or settings.database_pool_size,
+        max_overflow=pool_size or settings.database_pool_size,
+        pool_pre_ping=True,
+    )
+
+
+def get_engine() -> AsyncEngine:
+    """Process-wide engine, created on first use."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine()
+    return _engine
+
+
+def _add_missing_columns(conn: Connection) -> None:
+    """
+    Add columns that are in the schema but missing from existing tables.
+
+    ``create_all`` never alters a table that already exists, so a database
+    created by an earlier release would lack columns added since. Only nullable
+    columns can be added in place.
+
+    Args:
+        conn: Connection inside the schema transaction
+
+    Raises:
+        RuntimeError: If a missing column is NOT NULL (recreate the database)
+    """
+    inspector = inspect(conn)
+    preparer = conn.dialect.identifier_preparer
+    for table in metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                raise RuntimeError(
+                    f"Column {table.name}.{column.name} is missing and NOT NULL; "
+                    "recreate the database"
+                )
+            ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.exec_driver_sql(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {ddl}")
+            logger.info("Added column %s.%s", table.name, column.name)
+
+
+async def init_db(engine: Optional[AsyncEngine] = None) -> None:
+    """Create any missing tables and indexes, and add columns missing from older tables."""
+    async with (engine or get_engine()).begin() as conn:
+        await conn.run_sync(metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+
+
+async def close_db() -> None:
+    """
+    Close every pooled connection of the process-wide engine.
+
+    The engine itself stays usable (repositories keep a reference to it) and
+    opens a fresh pool on next use.
+    """
+    if _engine is not None:
+        await _engine.dispose()
@@ -0,0 +1,80 @@
+"""Database schema."""
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+)
+
+metadata = MetaData()
+
+scripts = Table(
+    "scripts",
+    metadata,
+    Column("id", String(64), primary_key=True),
+    Column("title", String(512), nullable=False),
+    Column("author", String(256)),
+    Column("content", Text, nullable=False),
+    Column("total_duration", Float),
+    Column("status", String(32), nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    # Keyset pagination walks (created_at, id) newest first
+    Index("ix_scripts_created_at_id", "created_at", "id"),
+    Index("ix_scripts_status_created_at_id", "status", "created_at", "id"),
+)
+
+script_scenes = Table(
+    "script_scenes",
+    metadata,
+    Column("script_id", String(64), ForeignKey("scripts.id", ondelete="CASCADE"), primary_key=True),
+    Column("scene_number", Integer, primary_key=True),
+    Column("location", String(512), nullable=False),
+    Column("time_of_day", String(64), nullable=False),
+    Column("description", Text, nullable=False),
+    Column("dialogue", JSON, nullable=False),
+    Column("duration_seconds", Float),
+    Column("video_prompt", Text),
+)
+
+videos = Table(
+    "videos",
+    metadata,
+    Column("id", String(64), primary_key=True),
+    Column("script_id", String(64), ForeignKey("scripts.id"), nullable=False, index=True),
+    Column("job_id", String(64)),
+    Column("title", String(512), nullable=False),
+    Column("resolution", String(32), nullable=False),
+    Column("fps", Integer, nullable=False),
+    Column("status", String(32), nullable=False),
+    Column("output_path", Text),
+    Column("playlist_path", Text),
+    Column("thumbnail_path", Text),
+    Column("duration", Float),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Index("ix_videos_created_at_id", "created_at", "id"),
+    Index("ix_videos_status_created_at_id", "status", "created_at", "id"),
+)
+
+video_scenes = Table(
+    "video_scenes",
+    metadata,
+    Column("video_id", String(64), ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True),
+    Column("scene_number", Integer, primary_key=True),
+    Column("visual_path", Text),
+    Column("audio_path", Text),
+    Column("thumbnail_path", Text),
+    Column("preview_path", Text),
+    Column("duration", Float, nullable=False),
+    Column("status", String(32), nullable=False),
+    Column("error", Text),
+)
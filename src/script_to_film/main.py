@@ -1,11 +1,27 @@
 """Main application entry point."""
 
-from fastapi import FastAPI
+import math
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 
 from script_to_film import __version__
-from script_to_film.api.routes import router
+from script_to_film.api.routes import (
+    ai_service,
+    job_queue,
+    router,
+    script_importer,
+    video_generator,
+)
 from script_to_film.config.settings import settings
+from script_to_film.db import close_db, init_db
+from script_to_film.services.rate_limiter import get_rate_limiter
+from script_to_film.services.resilience import ProviderUnavailableError
+from script_to_film.utils.logger import setup_logger
+from script_to_film.utils.metrics import render_metrics
+
+logger = setup_logger("script_to_film", settings.log_level, settings.log_format)
 
 app = FastAPI(
     title="Script to Film Platform",
@@ -27,18 +43,50 @@ app.add_middleware(
 app.include_router(router, prefix="/api/v1", tags=["api"])
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus metrics: parse, LLM, Runway and download timings, cache hits, jobs."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
+@app.exception_handler(ProviderUnavailableError)
+async def provider_unavailable_handler(
+    request: Request, exc: ProviderUnavailableError
+) -> JSONResponse:
+    """Degraded mode: tell the client which provider is down and when to retry."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "detail": f"{exc.provider} is temporarily unavailable, please retry later",
+            "provider": exc.provider,
+        },
+        headers={"Retry-After": str(math.ceil(exc.retry_after or 1))},
+    )
+
+
 @app.on_event("startup")
 async def startup_event() -> None:
     """Run on application startup."""
-    print(f"Starting Script to Film Platform v{__version__}")
-    print(f"Environment: {settings.api_env}")
-    print(f"Debug mode: {settings.debug}")
+    logger.info(
+        "Starting Script to Film Platform v%s",
+        __version__,
+        extra={"environment": settings.api_env, "debug": settings.debug},
+    )
+    await init_db()
+    video_generator.collect_garbage()
 
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     """Run on application shutdown."""
-    print("Shutting down Script to Film Platform")
+    logger.info("Shutting down Script to Film Platform")
+    await job_queue.aclose()
+    script_importer.shutdown()
+    await video_generator.aclose()
+    await ai_service.aclose()
+    await get_rate_limiter().aclose()
+    await close_db()
 
 
 if __name__ == "__main__":
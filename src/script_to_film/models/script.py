@@ -66,6 +66,9 @@ class ScriptGenerateRequest(BaseModel):
     )
     genre: Optional[str] = Field(None, description="Genre (e.g., drama, comedy, thriller)")
     tone: Optional[str] = Field(None, description="Tone (e.g., serious, lighthearted, dark)")
+    bypass_cache: bool = Field(
+        False, description="Always call the model instead of reusing a cached script"
+    )
 
     class Config:
         """Pydantic config."""
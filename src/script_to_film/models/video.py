@@ -22,8 +22,11 @@ class VideoScene(BaseModel):
     scene_number: int = Field(..., description="Scene number")
     visual_path: Optional[str] = Field(None, description="Path to visual file")
     audio_path: Optional[str] = Field(None, description="Path to audio file")
+    thumbnail_path: Optional[str] = Field(None, description="Path to scene thumbnail")
+    preview_path: Optional[str] = Field(None, description="Path to scene preview strip")
     duration: float = Field(..., description="Scene duration in seconds")
     status: VideoStatus = Field(VideoStatus.PENDING, description="Scene generation status")
+    error: Optional[str] = Field(None, description="Why the scene failed, if it did")
 
 
 class Video(BaseModel):
@@ -31,12 +34,16 @@ class Video(BaseModel):
 
     id: Optional[str] = Field(None, description="Video ID")
     script_id: str = Field(..., description="Associated script ID")
+    job_id: Optional[str] = Field(None, description="Background render job ID")
     title: str = Field(..., description="Video title")
     scenes: list[VideoScene] = Field(default_factory=list, description="Video scenes")
     resolution: str = Field(..., description="Video resolution")
     fps: int = Field(..., description="Frames per second")
     status: VideoStatus = Field(VideoStatus.PENDING, description="Video generation status")
     output_path: Optional[str] = Field(None, description="Path to final video file")
+    playlist_path: Optional[str] = Field(
+        None, description="Path to the HLS playlist of the scenes assembled so far"
+    )
     thumbnail_path: Optional[str] = Field(None, description="Path to thumbnail file")
     duration: Optional[float] = Field(None, description="Total duration in seconds")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
@@ -67,10 +74,15 @@ class VideoResponse(BaseModel):
 
     id: str = Field(..., description="Video ID")
     script_id: str = Field(..., description="Associated script ID")
+    job_id: Optional[str] = Field(None, description="Background render job ID")
     status: str = Field(..., description="Video generation status")
     url: Optional[str] = Field(None, description="Video URL if completed")
+    preview_url: Optional[str] = Field(
+        None, description="HLS playlist of the film's opening, playable while rendering"
+    )
     duration: Optional[float] = Field(None, description="Video duration in seconds")
     resolution: str = Field(..., description="Video resolution")
     fps: int = Field(..., description="Frames per second")
+    scenes: list[VideoScene] = Field(default_factory=list, description="Per-scene render status")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Update timestamp")
@@ -1,19 +1,204 @@
 """AI service for generating visual and audio content."""
 
-from typing import Optional
+import asyncio
+import hashlib
+import json
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Optional
 
 import anthropic
+import httpx
 
 from script_to_film.config.settings import settings
+from script_to_film.services.cache import LRUCache, RedisCache, TieredCache
+from script_to_film.services.rate_limiter import RateLimiter, get_rate_limiter, parse_retry_after
+from script_to_film.services.resilience import Resilience, get_resilience
+from script_to_film.services.speech import SpeechSynthesizer, build_speech_synthesizer, wav_bytes
+from script_to_film.utils.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS, record_cache
+
+SCRIPT_SYSTEM_PROMPT = (
+    "You are a professional screenwriter. Generate short film scripts in proper screenplay "
+    "format with scene headings (INT./EXT.), action lines, and dialogue. CRITICAL REQUIREMENT: "
+    "Always create scripts with AT LEAST 3-5 DISTINCT SCENES with different locations or time "
+    "periods. Each scene must have its own scene heading. Never create single-scene scripts. "
+    "Keep it concise and cinematic."
+)
 
 
 class AIService:
     """Service for interacting with AI models to generate content."""
 
-    def __init__(self) -> None:
-        """Initialize the AI service."""
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        max_concurrent_requests: Optional[int] = None,
+        script_cache: Optional[TieredCache] = None,
+        speech: Optional[SpeechSynthesizer] = None,
+        limiter: Optional[RateLimiter] = None,
+        resilience: Optional[Resilience] = None,
+    ) -> None:
+        """
+        Initialize the AI service.
+
+        Args:
+            transport: Optional httpx transport for the Anthropic client (used by tests)
+            max_concurrent_requests: Cap on in-flight Anthropic requests (defaults to settings)
+            script_cache: Cache for generated scripts (defaults to one built from settings)
+            speech: Speech synthesizer, usually shared with the video generator so both
+                draw on one rate-limited pool (created on first use if omitted)
+            limiter: Quota governor every Anthropic call acquires from (defaults to
+                the process-wide limiter)
+            resilience: Retry policy and circuit breaker for Anthropic calls (defaults
+                to the process-wide Anthropic policy)
+        """
         self.openai_api_key = settings.openai_api_key
         self.anthropic_api_key = settings.anthropic_api_key
+        self.anthropic_model = settings.anthropic_model
+        self._transport = transport
+        self._anthropic: Optional[anthropic.AsyncAnthropic] = None
+        self._anthropic_limit = asyncio.Semaphore(
+            max_concurrent_requests or settings.anthropic_max_concurrent_requests
+        )
+        self.script_cache = script_cache or self._build_script_cache()
+        self._speech = speech
+        self.limiter = limiter or get_rate_limiter()
+        self.resilience = resilience or get_resilience("anthropic")
+        self._owns_speech = speech is None
+
+    @staticmethod
+    def _build_script_cache() -> Optional[TieredCache]:
+        """Build the script cache tiers from settings."""
+        if not settings.script_cache_enabled:
+            return None
+
+        memory = LRUCache(
+            max_entries=settings.script_cache_max_entries,
+            ttl_seconds=settings.script_cache_ttl_seconds,
+        )
+        remote = None
+        if settings.script_cache_redis_enabled:
+            remote = RedisCache(
+                settings.redis_url,
+                ttl_seconds=settings.script_cache_ttl_seconds,
+                prefix="script-to-film:script:",
+            )
+        return TieredCache(memory, remote)
+
+    @property
+    def anthropic_client(self) -> anthropic.AsyncAnthropic:
+        """
+        Process-wide async Anthropic client, created on first use.
+
+        All requests share one pooled HTTP client so concurrent generations reuse
+        keep-alive connections instead of paying connection and TLS setup per call.
+        """
+        if self._anthropic is None:
+            timeout = httpx.Timeout(
+                settings.anthropic_timeout, connect=settings.anthropic_connect_timeout
+            )
+            http_client = httpx.AsyncClient(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.anthropic_max_connections,
+                    max_keepalive_connections=settings.anthropic_max_connections,
+                ),
+                transport=self._transport,
+            )
+            self._anthropic = anthropic.AsyncAnthropic(
+                api_key=self.anthropic_api_key,
+                base_url=settings.anthropic_base_url,
+                timeout=timeout,
+                max_retries=0,  # retries are jittered and circuit-broken by self.resilience
+                http_client=http_client,
+            )
+        return self._anthropic
+
+    @property
+    def speech(self) -> SpeechSynthesizer:
+        """Speech synthesizer, created from settings on first use unless one was injected."""
+        if self._speech is None:
+            self._speech = build_speech_synthesizer()
+        return self._speech
+
+    async def aclose(self) -> None:
+        """Close the pooled Anthropic client, cache connections and an owned synthesizer."""
+        if self._anthropic is not None:
+            await self._anthropic.close()
+            self._anthropic = None
+        if self._owns_speech and self._speech is not None:
+            await self._speech.aclose()
+            self._speech = None
+        if self.script_cache is not None:
+            await self.script_cache.aclose()
+
+    def _script_cache_key(
+        self,
+        prompt: str,
+        duration_preference: Optional[int],
+        genre: Optional[str],
+        tone: Optional[str],
+    ) -> str:
+        """
+        Content-address a script request.
+
+        The key covers everything that determines the completion: the user prompt
+        rendered from the normalized request (surrounding whitespace stripped, genre
+        and tone case-folded), the model, the system prompt and the token limit.
+        """
+        user_prompt = self._build_script_prompt(
+            prompt.strip(),
+            duration_preference,
+            genre.strip().casefold() if genre else None,
+            tone.strip().casefold() if tone else None,
+        )
+        payload = json.dumps(
+            {
+                "model": self.anthropic_model,
+                "max_tokens": settings.anthropic_max_tokens,
+                "system": SCRIPT_SYSTEM_PROMPT,
+                "user": user_prompt,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @asynccontextmanager
+    async def _quota(self) -> AsyncIterator[None]:
+        """Hold Anthropic quota for one request, reporting 429s to the shared limiter."""
+        async with self.limiter.acquire("anthropic", model=self.anthropic_model):
+            try:
+                yield
+            except anthropic.RateLimitError as e:
+                retry_after = parse_retry_after(e.response.headers.get("retry-after"))
+                await self.limiter.throttle(
+                    "anthropic", model=self.anthropic_model, retry_after=retry_after
+                )
+                raise
+
+    async def _cached_script(self, key: str, use_cache: bool) -> Optional[str]:
+        if not use_cache or self.script_cache is None:
+            return None
+        script_content = await self.script_cache.get(key)
+        record_cache("script", hit=script_content is not None)
+        return script_content
+
+    def _record_request(self, operation: str, started: float, usage: Any) -> None:
+        """Observe the latency and token usage of a completed Anthropic request."""
+        LLM_REQUEST_SECONDS.labels(operation=operation, model=self.anthropic_model).observe(
+            time.perf_counter() - started
+        )
+        if usage is not None:
+            LLM_TOKENS.labels(direction="input", model=self.anthropic_model).observe(
+                usage.input_tokens
+            )
+            LLM_TOKENS.labels(direction="output", model=self.anthropic_model).observe(
+                usage.output_tokens
+            )
+
+    async def _store_script(self, key: str, script_content: str, use_cache: bool) -> None:
+        if use_cache and self.script_cache is not None:
+            await self.script_cache.set(key, script_content)
 
     async def generate_script(
         self,
@@ -21,19 +206,127 @@ class AIService:
         duration_preference: Optional[int] = None,
         genre: Optional[str] = None,
         tone: Optional[str] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         Generate a script from a prompt using AI.
 
+        Identical requests are served from the script cache unless ``use_cache``
+        is False, in which case the cache is neither read nor written.
+
         Args:
             prompt: User's script idea
             duration_preference: Target duration in seconds
             genre: Desired genre
             tone: Desired tone
+            use_cache: Whether to consult and populate the script cache
 
         Returns:
             Generated script content
+
+        Raises:
+            ProviderUnavailableError: If Anthropic is down (circuit open or retries
+                exhausted); nothing is returned in place of a real script
+            anthropic.APIStatusError: If Anthropic rejected the request
+        """
+        user_prompt = self._build_script_prompt(prompt, duration_preference, genre, tone)
+        cache_key = self._script_cache_key(prompt, duration_preference, genre, tone)
+        cached = await self._cached_script(cache_key, use_cache)
+        if cached is not None:
+            return cached
+
+        async def request() -> str:
+            # Use Anthropic Claude API; the semaphore caps in-flight requests per process
+            async with self._anthropic_limit, self._quota():
+                started = time.perf_counter()
+                message = await self.anthropic_client.messages.create(
+                    model=self.anthropic_model,
+                    max_tokens=settings.anthropic_max_tokens,
+                    system=SCRIPT_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": user_prompt}],
+                )
+                self._record_request("generate", started, message.usage)
+            # Extract the text content from the response
+            return message.content[0].text
+
+        script_content = await self.resilience.call(request)
+        await self._store_script(cache_key, script_content, use_cache)
+        return script_content
+
+    async def stream_script(
+        self,
+        prompt: str,
+        duration_preference: Optional[int] = None,
+        genre: Optional[str] = None,
+        tone: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        Generate a script from a prompt, yielding text as the model produces it.
+
+        A cached script is yielded as a single chunk; a completed stream is cached.
+
+        Args:
+            prompt: User's script idea
+            duration_preference: Target duration in seconds
+            genre: Desired genre
+            tone: Desired tone
+            use_cache: Whether to consult and populate the script cache
+
+        Yields:
+            Chunks of generated script content
+
+        Raises:
+            ProviderUnavailableError: If Anthropic is down; raised before the first
+                chunk, since opening the stream is retried like any other request
+            anthropic.APIStatusError: If Anthropic rejected the request
         """
+        user_prompt = self._build_script_prompt(prompt, duration_preference, genre, tone)
+        cache_key = self._script_cache_key(prompt, duration_preference, genre, tone)
+        cached = await self._cached_script(cache_key, use_cache)
+        if cached is not None:
+            yield cached
+            return
+
+        started = 0.0
+        async with AsyncExitStack() as stack:
+
+            async def open_stream() -> anthropic.AsyncMessageStream:
+                nonlocal started
+                async with AsyncExitStack() as attempt:
+                    await attempt.enter_async_context(self._anthropic_limit)
+                    await attempt.enter_async_context(self._quota())
+                    started = time.perf_counter()
+                    stream = await attempt.enter_async_context(
+                        self.anthropic_client.messages.stream(
+                            model=self.anthropic_model,
+                            max_tokens=settings.anthropic_max_tokens,
+                            system=SCRIPT_SYSTEM_PROMPT,
+                            messages=[{"role": "user", "content": user_prompt}],
+                        )
+                    )
+                    # The stream is open: keep the slot and quota until it is consumed
+                    stack.push_async_exit(attempt.pop_all())
+                    return stream
+
+            stream = await self.resilience.call(open_stream)
+            parts: list[str] = []
+            async for text in stream.text_stream:
+                parts.append(text)
+                yield text
+            self._record_request("stream", started, stream.current_message_snapshot.usage)
+
+        if parts:
+            await self._store_script(cache_key, "".join(parts), use_cache)
+
+    def _build_script_prompt(
+        self,
+        prompt: str,
+        duration_preference: Optional[int] = None,
+        genre: Optional[str] = None,
+        tone: Optional[str] = None,
+    ) -> str:
+        """Build the user prompt for script generation from the request parameters."""
         # Build the user prompt with all parameters
         user_prompt = f"Write a short film script based on this idea: {prompt}"
         if genre:
@@ -59,92 +352,11 @@ class AIService:
             "\n- Action lines"
             "\n- Character names in ALL CAPS before dialogue"
             "\n- Dialogue beneath character names"
-            "\n\nEnsure the script tells a complete story with clear progression across multiple distinct scenes and locations. Keep it concise, cinematic, and appropriate for the target duration."
+            "\n\nEnsure the script tells a complete story with clear progression across multiple "
+            "distinct scenes and locations. Keep it concise, cinematic, and appropriate for the "
+            "target duration."
         )
-
-        try:
-            # Use Anthropic Claude API
-            client = anthropic.Anthropic(api_key=self.anthropic_api_key)
-
-            message = client.messages.create(
-                model="claude-sonnet-4-5",
-                max_tokens=8192,
-                system="You are a professional screenwriter. Generate short film scripts in proper screenplay format with scene headings (INT./EXT.), action lines, and dialogue. CRITICAL REQUIREMENT: Always create scripts with AT LEAST 3-5 DISTINCT SCENES with different locations or time periods. Each scene must have its own scene heading. Never create single-scene scripts. Keep it concise and cinematic.",
-                messages=[{"role": "user", "content": user_prompt}],
-            )
-
-            # Extract the text content from the response
-            script_content = message.content[0].text
-            return script_content
-
-        except Exception as e:
-            # Fallback to mock script if API fails
-            print(f"Error calling Anthropic API: {e}")
-            return """INT. COFFEE SHOP - DAY
-
-A young woman, SARAH, sits at a corner table, typing on her laptop.
-
-SARAH
-(to herself)
-This deadline is impossible.
-
-JOHN enters and waves.
-
-JOHN
-Hey! Mind if I join you?
-
-SARAH
-Of course not! How have you been?
-
-They sit and talk about their shared project.
-
-INT. SARAH'S APARTMENT - NIGHT
-
-Sarah reviews her notes from the meeting. Her phone RINGS.
-
-SARAH
-(answering)
-Hello?
-
-She listens intently, then smiles.
-
-SARAH (CONT'D)
-That's perfect! I'll send it over tonight.
-
-She hangs up and gets back to work with renewed energy.
-
-EXT. PARK - MORNING
-
-Sarah and John meet again, this time in a sunny park.
-
-JOHN
-You did it! The project is approved!
-
-SARAH
-We did it together.
-
-They high-five and walk off together as the sun shines brightly.
-
-EXT. PARK - EVENING
-
-The two walk through a scenic park at sunset, the sky painted orange and pink.
-
-JOHN
-I've been thinking about that idea we discussed.
-
-SARAH
-Really? I thought you'd moved on from it.
-
-JOHN
-Never. Some ideas are worth pursuing.
-
-Sarah smiles, inspired by his determination.
-
-INT. SARAH'S APARTMENT - NIGHT
-
-Sarah sits at her desk, working late. She looks at a photo of her and John from the park. Motivated, she types furiously, bringing their idea to life.
-
-FADE OUT."""
+        return user_prompt
 
     async def generate_scene_prompt(
         self, location: str, time_of_day: str, description: str, style: str = "realistic"
@@ -207,10 +419,12 @@ FADE OUT."""
             emotion: Emotional tone
 
         Returns:
-            Audio data as bytes
+            Audio data as bytes (WAV)
         """
-        # Placeholder - implement with ElevenLabs, OpenAI TTS, or other model
-        raise NotImplementedError("Audio generation not yet implemented")
+        if voice == "default":
+            voice = self.speech.backend.voices[0]
+        pcm = await self.speech.synthesize_line(text, voice, emotion)
+        return wav_bytes(pcm)
 
     async def generate_music(
         self, description: str, duration: float = 10.0, genre: Optional[str] = None
@@ -0,0 +1,242 @@
+"""Per-job output directories for rendered media."""
+
+import json
+import logging
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from script_to_film.models.video import VideoScene, VideoStatus
+from script_to_film.utils.files import atomic_write
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+# Jobs in these states are never garbage collected
+FINISHED_STATUSES = frozenset({VideoStatus.COMPLETED.value})
+
+
+class JobArtifacts:
+    """
+    The output directory of one render job.
+
+    Layout::
+
+        <root>/manifest.json
+        <root>/scenes/scene_000.mp4
+
+    The manifest records the job, its video, the state of every scene and each
+    scene's render checkpoint (see :class:`SceneCheckpoint`). It is rewritten
+    atomically on each update, and its ``updated_at`` doubles as the job's
+    heartbeat for garbage collection.
+    """
+
+    def __init__(self, root: Path, clock: Callable[[], float] = time.time) -> None:
+        """
+        Initialize the job directory, creating it and its manifest if needed.
+
+        Args:
+            root: Job directory
+            clock: Wall-clock time source
+        """
+        self.root = Path(root)
+        self.job_id = self.root.name
+        self._clock = clock
+        (self.root / "scenes").mkdir(parents=True, exist_ok=True)
+        self.manifest = self._load()
+
+    @property
+    def manifest_path(self) -> Path:
+        """Location of the job manifest."""
+        return self.root / MANIFEST_NAME
+
+    def scene_path(self, scene_number: int, suffix: str = ".mp4") -> Path:
+        """Location of a scene's clip within the job."""
+        return self.root / "scenes" / f"scene_{scene_number:03d}{suffix}"
+
+    def update(self, **fields: Any) -> None:
+        """
+        Set top-level manifest fields and persist the manifest.
+
+        Args:
+            **fields: Manifest fields (e.g. ``video_id``, ``status``)
+        """
+        self.manifest.update(fields)
+        self._save()
+
+    def record_scene(self, scene: VideoScene) -> None:
+        """
+        Record the state of one scene and persist the manifest.
+
+        Args:
+            scene: Scene state
+        """
+        self.manifest["scenes"][str(scene.scene_number)] = scene.model_dump(mode="json")
+        self._save()
+
+    def checkpoint(self, scene_number: int, clip_key: str) -> "SceneCheckpoint":
+        """
+        Durable render progress of one scene.
+
+        Args:
+            scene_number: Scene number
+            clip_key: Content address of the scene's clip; progress recorded for a
+                different clip (the scene was edited) is discarded
+
+        Returns:
+            Scene checkpoint
+        """
+        return SceneCheckpoint(self, scene_number, clip_key)
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.manifest_path.read_text())
+        except FileNotFoundError:
+            now = self._clock()
+            manifest = {
+                "job_id": self.job_id,
+                "video_id": None,
+                "status": VideoStatus.PENDING.value,
+                "created_at": now,
+                "updated_at": now,
+                "scenes": {},
+                "checkpoints": {},
+            }
+            atomic_write(self.manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+            return manifest
+
+    def _save(self) -> None:
+        self.manifest["updated_at"] = self._clock()
+        atomic_write(self.manifest_path, json.dumps(self.manifest, indent=2).encode("utf-8"))
+
+
+class SceneCheckpoint:
+    """
+    Progress of one scene's render, persisted in the job manifest.
+
+    Records the Runway task IDs, keyframe image URL and finished clip path as the
+    render advances, so a job restarted after its worker died re-attaches to
+    tasks still running on Runway and skips scenes that already finished.
+    """
+
+    def __init__(self, job: JobArtifacts, scene_number: int, clip_key: str) -> None:
+        """
+        Initialize the checkpoint.
+
+        Args:
+            job: Job whose manifest holds the checkpoint
+            scene_number: Scene number
+            clip_key: Content address of the clip being rendered
+        """
+        self.job = job
+        self.scene_number = scene_number
+        self.clip_key = clip_key
+
+    def _entry(self) -> Optional[dict[str, Any]]:
+        entry = self.job.manifest.get("checkpoints", {}).get(str(self.scene_number))
+        if entry is None or entry.get("clip_key") != self.clip_key:
+            return None
+        return entry
+
+    def get(self, field: str) -> Optional[Any]:
+        """
+        Recorded value of a field (``image_task_id``, ``image_url``, ``image_at``,
+        ``video_task_id`` or ``clip_path``), or None if not reached yet.
+        """
+        entry = self._entry()
+        return entry.get(field) if entry is not None else None
+
+    def update(self, **fields: Any) -> None:
+        """
+        Record progress and persist the manifest.
+
+        Args:
+            **fields: Checkpoint fields
+        """
+        entry = self._entry()
+        if entry is None:
+            entry = {"clip_key": self.clip_key}
+            self.job.manifest.setdefault("checkpoints", {})[str(self.scene_number)] = entry
+        entry.update(fields)
+        self.job.update()
+
+    def finished_clip(self) -> Optional[Path]:
+        """The scene's clip, if a previous run finished it and it is still on disk."""
+        clip_path = self.get("clip_path")
+        if clip_path is None or not Path(clip_path).exists():
+            return None
+        return Path(clip_path)
+
+
+class ArtifactStore:
+    """Allocates job directories under ``<root>/jobs`` and collects abandoned ones."""
+
+    def __init__(self, root: Path, clock: Callable[[], float] = time.time) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            root: Output directory
+            clock: Wall-clock time source
+        """
+        self.root = Path(root)
+        self.jobs_dir = self.root / "jobs"
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+
+    def job(self, job_id: str) -> JobArtifacts:
+        """
+        Open (or create) the directory of a job.
+
+        Args:
+            job_id: Job ID (used as the directory name)
+
+        Returns:
+            Job artifacts
+        """
+        if not job_id or Path(job_id).name != job_id or job_id.startswith("."):
+            raise ValueError(f"Invalid job ID: {job_id!r}")
+        return JobArtifacts(self.jobs_dir / job_id, clock=self._clock)
+
+    def collect_garbage(
+        self, max_age_seconds: float, active: Optional[set[str]] = None
+    ) -> list[str]:
+        """
+        Delete directories of unfinished jobs whose manifest has not been updated recently.
+
+        Args:
+            max_age_seconds: Idle time after which an unfinished job counts as abandoned
+            active: Job IDs known to be running in this process (always kept)
+
+        Returns:
+            IDs of the removed jobs
+        """
+        cutoff = self._clock() - max_age_seconds
+        removed = []
+        for job_dir in self.jobs_dir.iterdir():
+            if not job_dir.is_dir() or (active and job_dir.name in active):
+                continue
+
+            try:
+                manifest = json.loads((job_dir / MANIFEST_NAME).read_text())
+                status, updated_at = manifest["status"], float(manifest["updated_at"])
+            except (FileNotFoundError, ValueError, KeyError, TypeError):
+                # No readable manifest: fall back to the directory's own age
+                status, updated_at = None, job_dir.stat().st_mtime
+
+            if status in FINISHED_STATUSES or updated_at > cutoff:
+                continue
+
+            shutil.rmtree(job_dir, ignore_errors=True)
+            removed.append(job_dir.name)
+            logger.info(
+                "Removed abandoned job %s (idle since %s)",
+                job_dir.name,
+                datetime.fromtimestamp(updated_at).isoformat(),
+                extra={"job_id": job_dir.name},
+            )
+
+        return removed
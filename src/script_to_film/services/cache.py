@@ -0,0 +1,209 @@
+"""Caching tiers for generated content."""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters for a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    remote_hits: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from any tier."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """In-memory LRU cache with per-entry TTL."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries before the least recently used is evicted
+            ttl_seconds: Entry lifetime in seconds (None for no expiry)
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a value, refreshing its recency.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss or expired entry
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return value
+            del self._entries[key]
+
+        self.stats.misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries when full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+class RedisCache:
+    """Redis-backed string cache shared by every worker."""
+
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: Optional[int] = None,
+        prefix: str = "script-to-film:",
+        client: Optional[Any] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            url: Redis connection URL
+            ttl_seconds: Entry lifetime in seconds (None for no expiry)
+            prefix: Namespace prepended to every key
+            client: Optional pre-built ``redis.asyncio`` compatible client
+        """
+        if client is None:
+            from redis import asyncio as aioredis
+
+            client = aioredis.from_url(url, decode_responses=True)
+
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self._client = client
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a value."""
+        return await self._client.get(self.prefix + key)
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a value with the configured TTL."""
+        await self._client.set(self.prefix + key, value, ex=self.ttl_seconds)
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self._client.aclose()
+
+
+class TieredCache:
+    """
+    Two-tier cache: a per-process LRU in front of an optional shared Redis tier.
+
+    Remote errors are logged and treated as misses so an unavailable Redis never
+    fails the request that consulted the cache.
+    """
+
+    def __init__(self, memory: LRUCache, remote: Optional[RedisCache] = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            memory: In-process tier
+            remote: Optional shared tier
+        """
+        self.memory = memory
+        self.remote = remote
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters across both tiers (remote hits also count as hits)."""
+        return self.memory.stats
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up a value in memory, then in the remote tier.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        value = self.memory.get(key)
+        if value is not None or self.remote is None:
+            return value
+
+        try:
+            value = await self.remote.get(key)
+        except Exception as e:
+            logger.warning("Cache lookup failed: %s", e)
+            return None
+
+        if value is not None:
+            # Promote into the local tier; the memory lookup above already counted a miss
+            self.memory.stats.misses -= 1
+            self.memory.stats.hits += 1
+            self.memory.stats.remote_hits += 1
+            self.memory.set(key, value)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """
+        Store a value in every tier.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self.memory.set(key, value)
+        if self.remote is None:
+            return
+
+        try:
+            await self.remote.set(key, value)
+        except Exception as e:
+            logger.warning("Cache store failed: %s", e)
+
+    async def aclose(self) -> None:
+        """Close the remote tier."""
+        if self.remote is not None:
+            await self.remote.aclose()
@@ -0,0 +1,285 @@
+"""Concatenation of scene clips into a finished film with ffmpeg."""
+
+import asyncio
+import json
+import os
+import subprocess
+import tempfile
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from fractions import Fraction
+from pathlib import Path
+from typing import Optional
+
+
+class CompositionError(Exception):
+    """Raised when clips cannot be composited."""
+
+
+@dataclass(frozen=True)
+class ClipInfo:
+    """Stream parameters that decide whether clips can be joined without re-encoding."""
+
+    video_codec: str
+    width: int
+    height: int
+    frame_rate: Fraction
+    pixel_format: str
+    audio_codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+
+    @property
+    def has_audio(self) -> bool:
+        """Whether the clip has an audio stream."""
+        return self.audio_codec is not None
+
+
+def probe(path: Path, ffprobe: str = "ffprobe") -> ClipInfo:
+    """
+    Read the stream parameters of a clip.
+
+    Args:
+        path: Clip file
+        ffprobe: ffprobe executable
+
+    Returns:
+        Clip stream parameters
+    """
+    result = _run(
+        [ffprobe, "-v", "error", "-show_streams", "-of", "json", str(path)],
+        f"Could not probe {path}",
+    )
+    streams = json.loads(result.stdout).get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    if video is None:
+        raise CompositionError(f"{path} has no video stream")
+
+    return ClipInfo(
+        video_codec=video["codec_name"],
+        width=int(video["width"]),
+        height=int(video["height"]),
+        frame_rate=Fraction(video.get("r_frame_rate", "0/1")),
+        pixel_format=video.get("pix_fmt", ""),
+        audio_codec=audio["codec_name"] if audio else None,
+        sample_rate=int(audio["sample_rate"]) if audio and "sample_rate" in audio else None,
+        channels=int(audio["channels"]) if audio and "channels" in audio else None,
+    )
+
+
+def can_stream_copy(clips: list[ClipInfo]) -> bool:
+    """
+    Whether clips share every parameter the concat demuxer needs for a stream copy.
+
+    Args:
+        clips: Stream parameters of each clip
+
+    Returns:
+        True if the clips can be joined without re-encoding
+    """
+    return bool(clips) and all(clip == clips[0] for clip in clips[1:])
+
+
+def parse_resolution(resolution: str) -> tuple[int, int]:
+    """Parse a ``WIDTHxHEIGHT`` resolution string."""
+    try:
+        width, height = (int(part) for part in resolution.lower().split("x"))
+    except ValueError as e:
+        raise CompositionError(f"Invalid resolution: {resolution!r}") from e
+    return width, height
+
+
+def concat_command(
+    inputs: list[Path],
+    output: Path,
+    list_file: Path,
+    clips: list[ClipInfo],
+    resolution: str,
+    fps: int,
+    ffmpeg: str = "ffmpeg",
+) -> list[str]:
+    """
+    Build the ffmpeg command joining ``inputs`` into ``output``.
+
+    Uniform clips are joined with the concat demuxer and ``-c copy``. Otherwise every
+    clip is scaled and padded to ``resolution``, resampled to ``fps`` and encoded in
+    one pass through the concat filter.
+
+    Args:
+        inputs: Clip files in playback order
+        output: File to write
+        list_file: Concat demuxer list (only used for a stream copy)
+        clips: Stream parameters of each input
+        resolution: Target resolution for the transcode path
+        fps: Target frame rate for the transcode path
+        ffmpeg: ffmpeg executable
+
+    Returns:
+        Command line
+    """
+    if can_stream_copy(clips):
+        return [
+            ffmpeg, "-y", "-v", "error",
+            "-f", "concat", "-safe", "0", "-i", str(list_file),
+            "-c", "copy", "-movflags", "+faststart",
+            str(output),
+        ]  # fmt: skip
+
+    width, height = parse_resolution(resolution)
+    # Audio is kept only when every clip has some; Runway clips are silent
+    with_audio = all(clip.has_audio for clip in clips)
+    filters = []
+    for index in range(len(inputs)):
+        filters.append(
+            f"[{index}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps},format=yuv420p[v{index}]"
+        )
+        if with_audio:
+            filters.append(f"[{index}:a]aresample=48000,aformat=channel_layouts=stereo[a{index}]")
+    streams = "".join(f"[v{i}][a{i}]" if with_audio else f"[v{i}]" for i in range(len(inputs)))
+    filters.append(
+        f"{streams}concat=n={len(inputs)}:v=1:a={int(with_audio)}"
+        + ("[v][a]" if with_audio else "[v]")
+    )
+
+    command = [ffmpeg, "-y", "-v", "error"]
+    for path in inputs:
+        command += ["-i", str(path)]
+    command += ["-filter_complex", ";".join(filters), "-map", "[v]"]
+    if with_audio:
+        command += ["-map", "[a]", "-c:a", "aac", "-b:a", "192k"]
+    command += [
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", "20",
+        "-movflags", "+faststart",
+        str(output),
+    ]  # fmt: skip
+    return command
+
+
+def composite_clips(
+    inputs: list[str],
+    output: str,
+    resolution: str,
+    fps: int,
+    ffmpeg: str = "ffmpeg",
+    ffprobe: str = "ffprobe",
+) -> str:
+    """
+    Join clips into one file, stream-copying when possible.
+
+    Runs synchronously (meant for a worker process) and writes through a temporary
+    file that is renamed into place, so ``output`` never holds a partial film.
+
+    Args:
+        inputs: Clip files in playback order
+        output: File to write
+        resolution: Target resolution if a transcode is needed
+        fps: Target frame rate if a transcode is needed
+        ffmpeg: ffmpeg executable
+        ffprobe: ffprobe executable
+
+    Returns:
+        ``"copy"`` or ``"transcode"``, the method that was used
+    """
+    if not inputs:
+        raise CompositionError("No clips to composite")
+
+    paths = [Path(path).resolve() for path in inputs]
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    clips = [probe(path, ffprobe) for path in paths]
+    temp = output_path.with_name(f".{output_path.stem}.{uuid.uuid4().hex}{output_path.suffix}")
+
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", dir=output_path.parent, delete=False
+    ) as list_file:
+        for path in paths:
+            escaped = str(path).replace("'", "'\\''")
+            list_file.write(f"file '{escaped}'\n")
+
+    try:
+        command = concat_command(paths, temp, Path(list_file.name), clips, resolution, fps, ffmpeg)
+        _run(command, f"Could not composite {len(paths)} clips")
+        os.replace(temp, output_path)
+    finally:
+        Path(list_file.name).unlink(missing_ok=True)
+        temp.unlink(missing_ok=True)
+
+    return "copy" if can_stream_copy(clips) else "transcode"
+
+
+def _run(command: list[str], message: str) -> subprocess.CompletedProcess:
+    try:
+        return subprocess.run(command, check=True, capture_output=True, text=True)
+    except FileNotFoundError as e:
+        raise CompositionError(f"{message}: {command[0]} is not installed") from e
+    except subprocess.CalledProcessError as e:
+        raise CompositionError(f"{message}: {e.stderr.strip()}") from e
+
+
+class Compositor:
+    """Runs clip composition off the event loop in a worker pool."""
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        use_processes: bool = True,
+        ffmpeg: str = "ffmpeg",
+        ffprobe: str = "ffprobe",
+    ) -> None:
+        """
+        Initialize the compositor.
+
+        Args:
+            max_workers: Maximum compositions running at once
+            use_processes: Use a process pool (a thread pool if False, e.g. inside
+                daemonic worker processes that cannot fork children)
+            ffmpeg: ffmpeg executable
+            ffprobe: ffprobe executable
+        """
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.ffmpeg = ffmpeg
+        self.ffprobe = ffprobe
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        """Worker pool, created on first use."""
+        if self._executor is None:
+            pool = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            self._executor = pool(max_workers=self.max_workers)
+        return self._executor
+
+    async def composite(self, inputs: list[str], output: str, resolution: str, fps: int) -> str:
+        """
+        Join clips into ``output`` in the worker pool.
+
+        Args:
+            inputs: Clip files in playback order
+            output: File to write
+            resolution: Target resolution if a transcode is needed
+            fps: Target frame rate if a transcode is needed
+
+        Returns:
+            ``"copy"`` or ``"transcode"``, the method that was used
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            composite_clips,
+            inputs,
+            output,
+            resolution,
+            fps,
+            self.ffmpeg,
+            self.ffprobe,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
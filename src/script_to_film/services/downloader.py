@@ -0,0 +1,172 @@
+"""Streaming, resumable downloads of generated media."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+import aiofiles
+import httpx
+
+from script_to_film.utils.metrics import DOWNLOAD_BYTES, DOWNLOAD_SECONDS
+
+logger = logging.getLogger(__name__)
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+# Error responses worth retrying: the CDN is overloaded or briefly unavailable
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class DownloadError(Exception):
+    """Raised when a download cannot be completed or fails verification."""
+
+
+class _IncompleteBodyError(Exception):
+    """The server closed the body before sending every byte."""
+
+
+@dataclass
+class _Progress:
+    """Bytes already on disk for a download, and their running hash."""
+
+    written: int = 0
+    hasher: Any = field(default_factory=hashlib.sha256)
+
+
+@dataclass
+class DownloadResult:
+    """A completed download."""
+
+    path: Path
+    size: int
+    sha256: str
+
+
+class Downloader:
+    """
+    Stream HTTP downloads to disk in fixed-size chunks.
+
+    Bytes go to a hidden ``.part`` file next to the destination, which is renamed
+    into place only once the body is complete and verified, so readers never see a
+    partial file and memory use stays at one chunk per download. An interrupted
+    transfer is resumed with an HTTP ``Range`` request from the bytes already on
+    disk (restarting from zero if the server ignores the range), and 429 and 5xx
+    responses are retried the same way; other error responses fail at once.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        chunk_size: int = 1024 * 1024,
+        max_attempts: int = 3,
+        retry_delay: float = 0.5,
+    ) -> None:
+        """
+        Initialize the downloader.
+
+        Args:
+            client: Pooled HTTP client (shared across downloads)
+            chunk_size: Bytes read and written per step
+            max_attempts: Attempts per download, including resumed ones
+            retry_delay: Base delay before a retry, multiplied by the attempt number
+        """
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    async def download(
+        self, url: str, destination: Path, expected_sha256: Optional[str] = None
+    ) -> DownloadResult:
+        """
+        Download ``url`` to ``destination``.
+
+        Args:
+            url: Source URL
+            destination: Final file path (parent directories are created)
+            expected_sha256: Optional hex digest the content must match
+
+        Returns:
+            Size and SHA-256 of the downloaded file
+
+        Raises:
+            DownloadError: If every attempt failed or verification did not pass
+        """
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        part = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.part")
+        progress = _Progress()
+        started = time.perf_counter()
+
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                try:
+                    await self._transfer(url, part, progress)
+                    break
+                except (httpx.HTTPStatusError, httpx.TransportError, _IncompleteBodyError) as e:
+                    if (
+                        isinstance(e, httpx.HTTPStatusError)
+                        and e.response.status_code not in RETRYABLE_STATUS_CODES
+                    ):
+                        raise DownloadError(f"Download of {url} failed: {e}") from e
+                    if attempt == self.max_attempts:
+                        raise DownloadError(
+                            f"Download of {url} failed after {attempt} attempts: {e}"
+                        ) from e
+                    logger.warning(
+                        "Download of %s interrupted at %d bytes, resuming: %s",
+                        url,
+                        progress.written,
+                        e,
+                    )
+                    await asyncio.sleep(self.retry_delay * attempt)
+
+            digest = progress.hasher.hexdigest()
+            if expected_sha256 is not None and digest != expected_sha256.lower():
+                raise DownloadError(f"Checksum mismatch for {url}")
+
+            os.replace(part, destination)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+
+        DOWNLOAD_SECONDS.observe(time.perf_counter() - started)
+        DOWNLOAD_BYTES.observe(progress.written)
+        return DownloadResult(path=destination, size=progress.written, sha256=digest)
+
+    async def _transfer(self, url: str, part: Path, progress: _Progress) -> None:
+        """Run one attempt, appending to ``part`` after the bytes already written."""
+        headers = {"Range": f"bytes={progress.written}-"} if progress.written else {}
+        async with self.client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+
+            total: Optional[int] = None
+            if progress.written and response.status_code == 206:
+                match = _CONTENT_RANGE.match(response.headers.get("content-range", ""))
+                if match is None or int(match.group(1)) != progress.written:
+                    raise _IncompleteBodyError("Server returned an unexpected range")
+                if match.group(2) != "*":
+                    total = int(match.group(2))
+            else:
+                # Fresh transfer, or the server ignored the range: start over
+                progress.written, progress.hasher = 0, hashlib.sha256()
+                if "content-length" in response.headers:
+                    total = int(response.headers["content-length"])
+
+            async with aiofiles.open(part, "ab" if progress.written else "wb") as file:
+                async for chunk in response.aiter_bytes(self.chunk_size):
+                    await file.write(chunk)
+                    progress.hasher.update(chunk)
+                    progress.written += len(chunk)
+
+        if total is not None and progress.written < total:
+            raise _IncompleteBodyError(f"Received {progress.written} of {total} bytes")
+        if total is not None and progress.written > total:
+            raise DownloadError(f"Received {progress.written} bytes, expected {total}")
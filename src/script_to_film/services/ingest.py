@@ -0,0 +1,282 @@
+"""Bulk import of existing screenplays."""
+
+import asyncio
+import io
+import logging
+import tarfile
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Iterator, Optional, Union
+
+from script_to_film.db.repository import ScriptRepository
+from script_to_film.models.script import Script
+from script_to_film.services.script_parser import ScriptParser
+
+logger = logging.getLogger(__name__)
+
+# Archive names expanded into the scripts they contain
+TARBALL_SUFFIXES = (".tar", ".tar.gz", ".tgz")
+
+# Files in a directory or archive that are imported as scripts
+SCRIPT_SUFFIXES = frozenset({".txt", ".fountain", ".md", ".text", ""})
+
+
+@dataclass
+class IngestResult:
+    """Outcome of importing one script."""
+
+    name: str
+    script_id: Optional[str] = None
+    title: Optional[str] = None
+    scene_count: int = 0
+    error: Optional[str] = None
+
+
+def new_script_id() -> str:
+    """Generate a unique script ID."""
+    return f"script_{uuid.uuid4().hex[:12]}"
+
+
+def is_tarball(name: str) -> bool:
+    """Whether a file name denotes a tar archive of scripts."""
+    return name.lower().endswith(TARBALL_SUFFIXES)
+
+
+def _is_script(name: str) -> bool:
+    path = Path(name)
+    return not path.name.startswith(".") and path.suffix.lower() in SCRIPT_SUFFIXES
+
+
+def expand_archive(
+    name: str, data: bytes, max_script_bytes: int, max_total_bytes: int
+) -> tuple[list[tuple[str, bytes]], list[IngestResult]]:
+    """
+    Extract the scripts of an uploaded tar archive within size limits.
+
+    Member sizes are checked against the limits from the archive headers before
+    anything is extracted, so a decompression bomb is rejected without being
+    expanded. CPU-bound; run it off the event loop.
+
+    Args:
+        name: Upload file name (prefixed to member names)
+        data: Archive content
+        max_script_bytes: Largest member accepted; larger ones are reported as failed
+        max_total_bytes: Limit on the combined size of the extracted scripts
+
+    Returns:
+        ``(name, content)`` of each script, and a failed result per oversized member
+
+    Raises:
+        ValueError: If the scripts add up to more than ``max_total_bytes``
+        tarfile.TarError: If the archive cannot be read
+    """
+    sources: list[tuple[str, bytes]] = []
+    rejected: list[IngestResult] = []
+    total = 0
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:*") as archive:
+        for member in archive:
+            if not member.isfile() or not _is_script(member.name):
+                continue
+            member_name = f"{name}/{member.name}"
+            if member.size > max_script_bytes:
+                rejected.append(
+                    IngestResult(
+                        name=member_name, error=f"Script is larger than {max_script_bytes} bytes"
+                    )
+                )
+                continue
+            total += member.size
+            if total > max_total_bytes:
+                raise ValueError(f"Archive expands to more than {max_total_bytes} bytes")
+            extracted = archive.extractfile(member)
+            if extracted is not None:
+                sources.append((member_name, extracted.read()))
+    return sources, rejected
+
+
+def path_sources(path: Path) -> Iterator[tuple[str, bytes]]:
+    """
+    Scripts in a directory (recursively) or a single file.
+
+    Archives inside a directory are skipped; expand an archive with
+    :func:`expand_archive`.
+
+    Args:
+        path: Directory or script file
+
+    Yields:
+        ``(name, content)`` for each script, named relative to a directory
+    """
+    path = Path(path)
+    if path.is_dir():
+        for child in sorted(path.rglob("*")):
+            relative = child.relative_to(path)
+            if child.is_file() and not is_tarball(child.name) and _is_script(str(relative)):
+                yield str(relative), child.read_bytes()
+    else:
+        yield path.name, path.read_bytes()
+
+
+_parser: Optional[ScriptParser] = None
+
+
+def parse_source(name: str, content: bytes, max_bytes: int) -> Script:
+    """
+    Parse one script file; runs in a pool worker.
+
+    Args:
+        name: File name (its stem becomes the title)
+        content: UTF-8 script text
+        max_bytes: Size limit of a script
+
+    Returns:
+        Parsed script without an ID
+
+    Raises:
+        ValueError: If the file is too large, not UTF-8 or has no scenes
+    """
+    global _parser
+    if len(content) > max_bytes:
+        raise ValueError(f"Script is larger than {max_bytes} bytes")
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise ValueError("Script is not UTF-8 text") from e
+
+    if _parser is None:
+        _parser = ScriptParser()
+    script = _parser.parse(script_content=text, title=Path(name).stem.replace("_", " "))
+    if not script.scenes:
+        raise ValueError("No scene headings found")
+    return script
+
+
+class ScriptImporter:
+    """
+    Parse screenplays in a worker pool and bulk-insert them.
+
+    Parsing is CPU-bound, so it runs in a process pool, which spreads it over the
+    machine's cores and keeps the event loop responsive while it runs. Parsed
+    scripts are inserted in batches with one transaction each. Results are yielded
+    in completion order as each batch lands.
+    """
+
+    def __init__(
+        self,
+        repository: ScriptRepository,
+        max_workers: int = 4,
+        batch_size: int = 100,
+        max_script_bytes: int = 5 * 1024**2,
+        use_processes: bool = True,
+    ) -> None:
+        """
+        Initialize the importer.
+
+        Args:
+            repository: Repository the scripts are inserted into
+            max_workers: Parser pool size
+            batch_size: Scripts per insert transaction
+            max_script_bytes: Largest script file accepted
+            use_processes: Use a process pool (a thread pool if False, e.g. inside
+                daemonic worker processes)
+        """
+        if max_workers < 1 or batch_size < 1:
+            raise ValueError("max_workers and batch_size must be at least 1")
+        self.repository = repository
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_script_bytes = max_script_bytes
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        """Parser pool, created on first use."""
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def _parse(self, name: str, content: bytes) -> tuple[str, Union[Script, Exception]]:
+        loop = asyncio.get_running_loop()
+        try:
+            script = await loop.run_in_executor(
+                self.executor, parse_source, name, content, self.max_script_bytes
+            )
+        except Exception as e:
+            return name, e
+        return name, script
+
+    async def _insert(self, batch: list[tuple[str, Script]]) -> list[IngestResult]:
+        try:
+            await self.repository.add_many([script for _, script in batch])
+        except Exception as e:
+            logger.error("Inserting %d imported scripts failed: %s", len(batch), e)
+            return [IngestResult(name=name, error=f"Insert failed: {e}") for name, _ in batch]
+        return [
+            IngestResult(
+                name=name, script_id=script.id, title=script.title, scene_count=len(script.scenes)
+            )
+            for name, script in batch
+        ]
+
+    async def ingest(self, sources: Iterable[tuple[str, bytes]]) -> AsyncIterator[IngestResult]:
+        """
+        Import scripts.
+
+        At most a few files per worker are submitted ahead of the parsers, so large
+        imports are read lazily instead of all at once.
+
+        Args:
+            sources: ``(name, content)`` pairs, e.g. from :func:`path_sources`
+
+        Yields:
+            One result per script: its new ID, or why it was rejected
+        """
+        pending: set[asyncio.Task] = set()
+        batch: list[tuple[str, Script]] = []
+        window = self.max_workers * 2
+        iterator = iter(sources)
+        exhausted = False
+
+        try:
+            while pending or not exhausted:
+                while not exhausted and len(pending) < window:
+                    source = next(iterator, None)
+                    if source is None:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.create_task(self._parse(*source)))
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name, parsed = task.result()
+                    if isinstance(parsed, Exception):
+                        yield IngestResult(name=name, error=str(parsed))
+                        continue
+                    parsed.id = new_script_id()
+                    batch.append((name, parsed))
+
+                if len(batch) >= self.batch_size:
+                    for result in await self._insert(batch):
+                        yield result
+                    batch = []
+
+            if batch:
+                for result in await self._insert(batch):
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the parser pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
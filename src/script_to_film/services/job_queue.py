@@ -0,0 +1,201 @@
+"""Background render jobs for full-film video generation."""
+
+import asyncio
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from script_to_film.config.settings import settings
+from script_to_film.db.repository import ScriptRepository, VideoRepository
+from script_to_film.models.video import Video, VideoScene, VideoStatus
+from script_to_film.services.scene_scheduler import SceneProgress
+from script_to_film.services.video_generator import VideoGenerator
+from script_to_film.utils.metrics import RENDER_JOBS_IN_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+
+async def render_video_job(
+    video_id: str,
+    script_repository: ScriptRepository,
+    video_repository: VideoRepository,
+    generator: VideoGenerator,
+) -> Optional[Video]:
+    """
+    Render a queued video and persist its progress.
+
+    Each scene's status is written as soon as that scene finishes, so
+    ``GET /videos/{id}`` reflects partial progress while the job runs. Running
+    the same video again (a redelivered job) resumes from the checkpoints in the
+    job's manifest rather than re-rendering finished scenes.
+
+    Args:
+        video_id: ID of a stored video in the ``pending`` state
+        script_repository: Repository holding the video's script
+        video_repository: Repository holding the video
+        generator: Video generator used to render scenes
+
+    Returns:
+        The final stored video, or None if the video does not exist
+    """
+    video = await video_repository.get(video_id)
+    if video is None:
+        logger.warning("Render job for unknown video %s", video_id, extra={"video_id": video_id})
+        return None
+
+    script = await script_repository.get(video.script_id)
+    if script is None:
+        logger.warning(
+            "Render job %s: script %s no longer exists",
+            video_id,
+            video.script_id,
+            extra={"video_id": video_id},
+        )
+        video.status = VideoStatus.FAILED
+        await video_repository.save(video)
+        return video
+
+    # Expose the preview playlist location before the first scene lands in it
+    playlist_path = generator.playlist_path(video.job_id) if video.job_id else None
+    video.status = VideoStatus.PROCESSING
+    video.playlist_path = str(playlist_path) if playlist_path else None
+    await video_repository.save(video)
+
+    async def persist(progress: SceneProgress) -> None:
+        scene = progress.result or VideoScene(
+            scene_number=progress.index,
+            duration=script.scenes[progress.index].duration_seconds or 0,
+            status=VideoStatus.FAILED,
+        )
+        await video_repository.save_scene(video_id, scene)
+
+    RENDER_JOBS_IN_FLIGHT.inc()
+    try:
+        rendered = await generator.generate_from_script(
+            script,
+            resolution=video.resolution,
+            fps=video.fps,
+            on_progress=persist,
+            job_id=video.job_id,
+            video_id=video.id,
+        )
+        video.scenes = rendered.scenes
+        video.status = rendered.status
+        video.duration = rendered.duration
+        video.output_path = rendered.output_path
+        video.thumbnail_path = rendered.thumbnail_path
+        video.playlist_path = rendered.playlist_path
+    except Exception as e:
+        logger.exception("Render job %s failed: %s", video_id, e, extra={"video_id": video_id})
+        video.status = VideoStatus.FAILED
+    finally:
+        RENDER_JOBS_IN_FLIGHT.dec()
+
+    await video_repository.save(video)
+    return video
+
+
+class JobQueue(ABC):
+    """Interface for enqueueing render jobs."""
+
+    @abstractmethod
+    async def enqueue(self, video_id: str, job_id: str) -> None:
+        """
+        Queue a render job for a stored video.
+
+        Args:
+            video_id: Video to render
+            job_id: ID to track the job by (see :func:`new_job_id`)
+        """
+
+    async def aclose(self) -> None:
+        """Release queue resources."""
+
+
+class InProcessJobQueue(JobQueue):
+    """
+    Run render jobs as tasks on the API's own event loop.
+
+    Intended for tests and single-process development: jobs do not survive a
+    restart and share the API worker's resources.
+    """
+
+    def __init__(
+        self,
+        script_repository: ScriptRepository,
+        video_repository: VideoRepository,
+        generator: VideoGenerator,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            script_repository: Repository holding scripts
+            video_repository: Repository holding videos
+            generator: Video generator used to render scenes
+        """
+        self.script_repository = script_repository
+        self.video_repository = video_repository
+        self.generator = generator
+        self.jobs: dict[str, asyncio.Task] = {}
+
+    async def enqueue(self, video_id: str, job_id: str) -> None:
+        """Start the render job as a background task."""
+        task = asyncio.create_task(
+            render_video_job(
+                video_id, self.script_repository, self.video_repository, self.generator
+            )
+        )
+        self.jobs[job_id] = task
+        task.add_done_callback(lambda _: self.jobs.pop(job_id, None))
+
+    async def join(self) -> None:
+        """Wait for every running job to finish."""
+        while self.jobs:
+            await asyncio.gather(*self.jobs.values(), return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Cancel running jobs."""
+        for task in list(self.jobs.values()):
+            task.cancel()
+        await asyncio.gather(*self.jobs.values(), return_exceptions=True)
+
+
+class CeleryJobQueue(JobQueue):
+    """Send render jobs to Celery workers (``celery -A script_to_film.tasks worker``)."""
+
+    async def enqueue(self, video_id: str, job_id: str) -> None:
+        """Publish the render task to the broker."""
+        from script_to_film.tasks import render_video
+
+        # Publishing talks to the broker synchronously; keep it off the event loop
+        await asyncio.to_thread(render_video.apply_async, args=[video_id], task_id=job_id)
+
+
+def create_job_queue(
+    script_repository: ScriptRepository,
+    video_repository: VideoRepository,
+    generator: VideoGenerator,
+) -> JobQueue:
+    """
+    Build the job queue selected by ``settings.job_queue_backend``.
+
+    Args:
+        script_repository: Repository holding scripts
+        video_repository: Repository holding videos
+        generator: Video generator used by the in-process backend
+
+    Returns:
+        Job queue
+    """
+    if settings.job_queue_backend == "inprocess":
+        return InProcessJobQueue(script_repository, video_repository, generator)
+    if settings.job_queue_backend == "celery":
+        return CeleryJobQueue()
+    raise ValueError(f"Unknown job queue backend: {settings.job_queue_backend}")
+
+
+def new_job_id() -> str:
+    """Generate a unique job ID."""
+    return f"job_{uuid.uuid4().hex[:12]}"
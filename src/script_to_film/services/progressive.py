@@ -0,0 +1,208 @@
+"""Progressive assembly of a film into an HLS playlist while scenes render."""
+
+import asyncio
+import logging
+import math
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from script_to_film.services.compositor import CompositionError, Compositor
+from script_to_film.utils.files import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Segment:
+    """One media segment in the film playlist."""
+
+    uri: str
+    duration: float
+    discontinuity: bool = False
+
+
+def segment_clip(
+    clip: str, output_dir: str, prefix: str, segment_seconds: float, ffmpeg: str = "ffmpeg"
+) -> list[tuple[str, float]]:
+    """
+    Split a clip into MPEG-TS segments without re-encoding.
+
+    Runs synchronously (meant for a worker pool).
+
+    Args:
+        clip: Clip file
+        output_dir: Directory for the segments
+        prefix: Segment file name prefix (unique per scene)
+        segment_seconds: Target segment duration
+        ffmpeg: ffmpeg executable
+
+    Returns:
+        ``(file name, duration)`` of each segment in playback order
+    """
+    directory = Path(output_dir)
+    playlist = directory / f".{prefix}.m3u8"
+    command = [
+        ffmpeg, "-y", "-v", "error", "-i", clip,
+        "-c", "copy", "-f", "hls",
+        "-hls_time", str(segment_seconds), "-hls_list_size", "0",
+        "-hls_segment_filename", str(directory / f"{prefix}_%03d.ts"),
+        str(playlist),
+    ]  # fmt: skip
+    try:
+        subprocess.run(command, check=True, capture_output=True, text=True)
+    except FileNotFoundError as e:
+        raise CompositionError(f"Could not segment {clip}: {ffmpeg} is not installed") from e
+    except subprocess.CalledProcessError as e:
+        raise CompositionError(f"Could not segment {clip}: {e.stderr.strip()}") from e
+
+    try:
+        return parse_media_playlist(playlist.read_text())
+    finally:
+        playlist.unlink(missing_ok=True)
+
+
+def parse_media_playlist(text: str) -> list[tuple[str, float]]:
+    """
+    Read the segments of an HLS media playlist.
+
+    Args:
+        text: Playlist contents
+
+    Returns:
+        ``(uri, duration)`` of each segment
+    """
+    segments = []
+    duration: Optional[float] = None
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("#EXTINF:"):
+            duration = float(line[len("#EXTINF:") :].split(",")[0])
+        elif line and not line.startswith("#") and duration is not None:
+            segments.append((line, duration))
+            duration = None
+    return segments
+
+
+def render_playlist(segments: list[Segment], ended: bool) -> str:
+    """
+    Build an HLS ``EVENT`` media playlist.
+
+    Args:
+        segments: Segments in playback order
+        ended: Whether the film is complete (adds ``#EXT-X-ENDLIST``)
+
+    Returns:
+        Playlist text
+    """
+    target = max((math.ceil(segment.duration) for segment in segments), default=1)
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:3",
+        "#EXT-X-PLAYLIST-TYPE:EVENT",
+        f"#EXT-X-TARGETDURATION:{target}",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+    ]
+    for segment in segments:
+        if segment.discontinuity:
+            lines.append("#EXT-X-DISCONTINUITY")
+        lines.append(f"#EXTINF:{segment.duration:.3f},")
+        lines.append(segment.uri)
+    if ended:
+        lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
+
+
+class ProgressiveAssembler:
+    """
+    Grow a playable HLS playlist as scenes finish.
+
+    Scenes may finish in any order; a scene is appended only once it and every
+    earlier scene are done, so the playlist always holds a gap-free opening of
+    the film. Each scene is segmented with a stream copy, and scene boundaries are
+    marked as discontinuities because every clip starts its own timeline.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        scene_count: int,
+        compositor: Compositor,
+        segment_seconds: float = 4.0,
+    ) -> None:
+        """
+        Initialize the assembler.
+
+        Args:
+            output_dir: Directory for the playlist and its segments
+            scene_count: Number of scenes in the film
+            compositor: Supplies the worker pool and ffmpeg executable
+            segment_seconds: Target HLS segment duration
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.scene_count = scene_count
+        self.compositor = compositor
+        self.segment_seconds = segment_seconds
+        self.segments: list[Segment] = []
+        self.assembled = 0
+        self._ready: dict[int, str] = {}
+        self._lock = asyncio.Lock()
+        self._failed = False
+
+    @property
+    def playlist_path(self) -> Path:
+        """Location of the film playlist."""
+        return self.output_dir / "film.m3u8"
+
+    @property
+    def complete(self) -> bool:
+        """Whether every scene has been appended."""
+        return self.assembled == self.scene_count
+
+    async def add(self, index: int, clip: str) -> None:
+        """
+        Mark a scene as rendered and append every scene that is now in order.
+
+        Args:
+            index: Scene position in the film
+            clip: Rendered clip file
+        """
+        self._ready[index] = clip
+        async with self._lock:
+            while not self._failed and self.assembled in self._ready:
+                await self._append(self.assembled, self._ready.pop(self.assembled))
+
+    async def _append(self, index: int, clip: str) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            parts = await loop.run_in_executor(
+                self.compositor.executor,
+                segment_clip,
+                clip,
+                str(self.output_dir),
+                f"scene_{index:03d}",
+                self.segment_seconds,
+                self.compositor.ffmpeg,
+            )
+        except CompositionError as e:
+            # Keep the playable prefix; later scenes can no longer follow in order
+            logger.warning("Progressive assembly stopped at scene %d: %s", index, e)
+            self._failed = True
+            return
+
+        for position, (uri, duration) in enumerate(parts):
+            self.segments.append(
+                Segment(uri=uri, duration=duration, discontinuity=index > 0 and position == 0)
+            )
+        self.assembled += 1
+        atomic_write(
+            self.playlist_path, render_playlist(self.segments, self.complete).encode("utf-8")
+        )
+        logger.info(
+            "Preview playlist now covers %d/%d scenes",
+            self.assembled,
+            self.scene_count,
+            extra={"playlist": str(self.playlist_path)},
+        )
@@ -0,0 +1,415 @@
+"""Provider-wide rate limiting and concurrency governance for external APIs."""
+
+import asyncio
+import contextvars
+import email.utils
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from script_to_film.config.settings import settings
+
+# Tenant charged for calls made in the current context (None: no per-tenant quota)
+current_tenant: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_tenant", default=None
+)
+
+
+@dataclass(frozen=True)
+class Quota:
+    """Limits for one scope: a token bucket and an optional concurrency cap."""
+
+    rate: float  # requests per second (tokens refilled per second)
+    burst: int  # bucket size
+    concurrency: Optional[int] = None  # requests in flight at once
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "Quota":
+        """Build a quota from a ``{"rate", "burst", "concurrency"}`` mapping."""
+        concurrency = config.get("concurrency")
+        return cls(
+            rate=float(config["rate"]),
+            burst=int(config.get("burst", 1)),
+            concurrency=int(concurrency) if concurrency else None,
+        )
+
+
+@dataclass
+class ScopeStats:
+    """Live counters for one scope on this worker."""
+
+    waiting: int = 0
+    in_flight: int = 0
+    throttled: int = 0  # 429 responses reported
+
+
+def scope_names(provider: str, model: Optional[str], tenant: Optional[str]) -> list[str]:
+    """
+    Scopes a call is charged to, broadest first.
+
+    ``<provider>`` covers every call to the provider, ``<provider>:<model>`` one
+    model and ``<provider>@<tenant>`` one tenant's share.
+    """
+    scopes = [provider]
+    if model:
+        scopes.append(f"{provider}:{model}")
+    if tenant:
+        scopes.append(f"{provider}@{tenant}")
+    return scopes
+
+
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """
+    Seconds to wait according to a ``Retry-After`` header.
+
+    Args:
+        value: Header value (delay in seconds or an HTTP date)
+        default: Delay when the header is missing or unparsable
+
+    Returns:
+        Delay in seconds (never negative)
+    """
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+class _Bucket:
+    """Token bucket that can also be paused until a point in time."""
+
+    def __init__(self, quota: Quota, now: float) -> None:
+        self.quota = quota
+        self.tokens = float(quota.burst)
+        self.updated = now
+        self.blocked_until = 0.0
+
+    def wait_time(self, now: float, cost: float) -> float:
+        self.tokens = min(self.quota.burst, self.tokens + (now - self.updated) * self.quota.rate)
+        self.updated = now
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.tokens >= cost:
+            return 0.0
+        return (cost - self.tokens) / self.quota.rate
+
+
+class LocalBackend:
+    """Quota state kept in this process (coordinates coroutines, not workers)."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._buckets: dict[str, _Bucket] = {}
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    def _bucket(self, scope: str, quota: Quota) -> _Bucket:
+        bucket = self._buckets.get(scope)
+        if bucket is None:
+            bucket = self._buckets[scope] = _Bucket(quota, self._clock())
+        return bucket
+
+    async def take(self, scopes: list[tuple[str, Quota]], cost: float) -> float:
+        """Take ``cost`` tokens from every scope at once, or return how long to wait."""
+        now = self._clock()
+        buckets = [self._bucket(scope, quota) for scope, quota in scopes]
+        wait = max(bucket.wait_time(now, cost) for bucket in buckets)
+        if wait == 0:
+            for bucket in buckets:
+                bucket.tokens -= cost
+        return wait
+
+    async def pause(self, scope: str, quota: Quota, delay: float) -> None:
+        """Stop handing out tokens for ``scope`` for ``delay`` seconds."""
+        bucket = self._bucket(scope, quota)
+        bucket.blocked_until = max(bucket.blocked_until, self._clock() + delay)
+
+    async def enter(self, scope: str, limit: int) -> str:
+        """Wait for a concurrency slot in ``scope``."""
+        slots = self._slots.get(scope)
+        if slots is None:
+            slots = self._slots[scope] = asyncio.Semaphore(limit)
+        await slots.acquire()
+        return scope
+
+    async def leave(self, scope: str, lease: str) -> None:
+        """Release a concurrency slot."""
+        self._slots[scope].release()
+
+    async def aclose(self) -> None:
+        """Nothing to release."""
+
+
+# Atomically refill and take from several buckets; returns the wait in seconds (as a string,
+# since Redis truncates Lua numbers to integers)
+_TAKE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local cost = tonumber(ARGV[1])
+local wait = 0
+local tokens = {}
+for i, key in ipairs(KEYS) do
+  local rate = tonumber(ARGV[2 * i])
+  local burst = tonumber(ARGV[2 * i + 1])
+  local state = redis.call('HMGET', key, 'tokens', 'updated', 'blocked_until')
+  local available = tonumber(state[1]) or burst
+  local updated = tonumber(state[2]) or now
+  local blocked_until = tonumber(state[3]) or 0
+  available = math.min(burst, available + math.max(now - updated, 0) * rate)
+  tokens[i] = available
+  if blocked_until > now then
+    wait = math.max(wait, blocked_until - now)
+  elseif available < cost then
+    wait = math.max(wait, (cost - available) / rate)
+  end
+end
+for i, key in ipairs(KEYS) do
+  if wait == 0 then tokens[i] = tokens[i] - cost end
+  redis.call('HSET', key, 'tokens', tostring(tokens[i]), 'updated', tostring(now))
+  redis.call('EXPIRE', key, 3600)
+end
+return tostring(wait)
+"""
+
+_PAUSE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local until_time = now + tonumber(ARGV[1])
+local current = tonumber(redis.call('HGET', KEYS[1], 'blocked_until')) or 0
+if until_time > current then
+  redis.call('HSET', KEYS[1], 'blocked_until', tostring(until_time))
+end
+redis.call('EXPIRE', KEYS[1], 3600)
+return 1
+"""
+
+# Concurrency slots are leases in a sorted set scored by expiry, so a crashed worker's
+# slots free themselves
+_ENTER_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[1]) then
+  redis.call('ZADD', KEYS[1], now + tonumber(ARGV[2]), ARGV[3])
+  redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[2])))
+  return 1
+end
+return 0
+"""
+
+
+class RedisBackend:
+    """Quota state shared by every worker through Redis."""
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "script-to-film:ratelimit:",
+        lease_seconds: float = 600.0,
+        poll_interval: float = 0.05,
+        client: Optional[Any] = None,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            url: Redis connection URL
+            prefix: Namespace prepended to every key
+            lease_seconds: Lifetime of a concurrency slot not released by its holder
+            poll_interval: Delay between attempts to get a concurrency slot
+            client: Optional pre-built ``redis.asyncio`` compatible client
+        """
+        if client is None:
+            from redis import asyncio as aioredis
+
+            client = aioredis.from_url(url, decode_responses=True)
+
+        self.prefix = prefix
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._client = client
+
+    async def take(self, scopes: list[tuple[str, Quota]], cost: float) -> float:
+        keys = [f"{self.prefix}bucket:{scope}" for scope, _ in scopes]
+        args: list[Any] = [cost]
+        for _, quota in scopes:
+            args += [quota.rate, quota.burst]
+        return float(await self._client.eval(_TAKE_SCRIPT, len(keys), *keys, *args))
+
+    async def pause(self, scope: str, quota: Quota, delay: float) -> None:
+        await self._client.eval(_PAUSE_SCRIPT, 1, f"{self.prefix}bucket:{scope}", delay)
+
+    async def enter(self, scope: str, limit: int) -> str:
+        lease = uuid.uuid4().hex
+        key = f"{self.prefix}slots:{scope}"
+        while not int(
+            await self._client.eval(_ENTER_SCRIPT, 1, key, limit, self.lease_seconds, lease)
+        ):
+            await asyncio.sleep(self.poll_interval)
+        return lease
+
+    async def leave(self, scope: str, lease: str) -> None:
+        await self._client.zrem(f"{self.prefix}slots:{scope}", lease)
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self._client.aclose()
+
+
+class RateLimiter:
+    """
+    Shared quota governor for every call to an external AI provider.
+
+    Callers acquire before each request; the limiter charges the call to every
+    configured scope it falls under (provider, provider model, provider tenant),
+    waiting until all of their token buckets have capacity and holding a
+    concurrency slot in each scope that caps requests in flight. A 429 reported
+    through ``throttle`` pauses those scopes for the ``Retry-After`` delay so
+    the other callers back off too, instead of each discovering the limit.
+
+    With the Redis backend, buckets and slots are shared by every worker; queue
+    depth counters (``stats``) always describe this worker.
+    """
+
+    def __init__(
+        self,
+        quotas: dict[str, Quota],
+        backend: Optional[Any] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            quotas: Limits by scope name (``provider``, ``provider:model``, ``provider@tenant``)
+            backend: Where quota state lives (defaults to this process)
+            clock: Monotonic time source for the local backend
+        """
+        self.quotas = quotas
+        self.backend = backend or LocalBackend(clock)
+        self._stats: dict[str, ScopeStats] = {}
+
+    def _scopes(
+        self, provider: str, model: Optional[str], tenant: Optional[str]
+    ) -> list[tuple[str, Quota]]:
+        if tenant is None:
+            tenant = current_tenant.get()
+        return [
+            (scope, self.quotas[scope])
+            for scope in scope_names(provider, model, tenant)
+            if scope in self.quotas
+        ]
+
+    def _stat(self, scope: str) -> ScopeStats:
+        return self._stats.setdefault(scope, ScopeStats())
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        provider: str,
+        model: Optional[str] = None,
+        tenant: Optional[str] = None,
+        cost: float = 1.0,
+    ) -> AsyncIterator[None]:
+        """
+        Wait for quota, then hold it for the duration of one request.
+
+        Args:
+            provider: Provider name (e.g. "runway", "anthropic")
+            model: Model the request uses, if any
+            tenant: Tenant charged for the request (defaults to ``current_tenant``)
+            cost: Tokens the request consumes
+        """
+        scopes = self._scopes(provider, model, tenant)
+        if not scopes:
+            yield
+            return
+
+        for scope, _ in scopes:
+            self._stat(scope).waiting += 1
+        leases: list[tuple[str, str]] = []
+        try:
+            # Slots first, so tokens are not spent by calls that then sit waiting
+            for scope, quota in scopes:
+                if quota.concurrency:
+                    leases.append((scope, await self.backend.enter(scope, quota.concurrency)))
+            while (wait := await self.backend.take(scopes, cost)) > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            for scope, lease in leases:
+                await self.backend.leave(scope, lease)
+            raise
+        finally:
+            for scope, _ in scopes:
+                self._stat(scope).waiting -= 1
+
+        for scope, _ in scopes:
+            self._stat(scope).in_flight += 1
+        try:
+            yield
+        finally:
+            for scope, _ in scopes:
+                self._stat(scope).in_flight -= 1
+            for scope, lease in leases:
+                await self.backend.leave(scope, lease)
+
+    async def throttle(
+        self,
+        provider: str,
+        model: Optional[str] = None,
+        tenant: Optional[str] = None,
+        retry_after: float = 1.0,
+    ) -> None:
+        """
+        Report a 429: pause every scope of the call for ``retry_after`` seconds.
+
+        When no quota covers the call there is nothing to pause, so the caller
+        itself is delayed; either way a caller retrying next honours the delay.
+
+        Args:
+            provider: Provider name
+            model: Model of the throttled request
+            tenant: Tenant of the throttled request (defaults to ``current_tenant``)
+            retry_after: Delay the provider asked for
+        """
+        scopes = self._scopes(provider, model, tenant)
+        if not scopes:
+            await asyncio.sleep(retry_after)
+        for scope, quota in scopes:
+            self._stat(scope).throttled += 1
+            await self.backend.pause(scope, quota, retry_after)
+
+    def stats(self) -> dict[str, ScopeStats]:
+        """Queue depth and in-flight requests per scope on this worker."""
+        return dict(self._stats)
+
+    async def aclose(self) -> None:
+        """Release backend resources."""
+        await self.backend.aclose()
+
+
+_limiter: Optional[RateLimiter] = None
+
+
+def build_rate_limiter() -> RateLimiter:
+    """Create a limiter from the configured quotas and backend."""
+    quotas = {scope: Quota.from_config(config) for scope, config in settings.rate_limits.items()}
+    backend = RedisBackend(settings.redis_url) if settings.rate_limit_redis_enabled else None
+    return RateLimiter(quotas, backend=backend)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter shared by every provider client, created on first use."""
+    global _limiter
+    if _limiter is None:
+        _limiter = build_rate_limiter()
+    return _limiter
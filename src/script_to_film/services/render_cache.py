@@ -0,0 +1,171 @@
+"""Content-addressed store for rendered scene clips."""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from script_to_film.services.cache import CacheStats
+from script_to_film.utils.files import atomic_write, place_file
+from script_to_film.utils.metrics import record_cache
+
+
+class RenderCache:
+    """
+    On-disk cache of Runway renders keyed by everything that determines the output.
+
+    Clips are stored as ``clips/<key>.mp4`` and evicted least-recently-used first
+    once the directory exceeds ``max_bytes``. Each hit touches a ``<key>.used``
+    marker rather than the clip: clips are hard-linked into job directories, and
+    their modification time is what thumbnails are checked against. Keyframe
+    images are cached as the Runway output URL only, with a TTL shorter than
+    Runway's URL expiry, so a re-render with a new duration can skip
+    text-to-image.
+    """
+
+    def __init__(self, root: Path, max_bytes: int, image_ttl_seconds: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            root: Cache directory
+            max_bytes: Disk budget for cached clips
+            image_ttl_seconds: Lifetime of cached keyframe image URLs
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.image_ttl_seconds = image_ttl_seconds
+        self.clip_stats = CacheStats()
+        self.image_stats = CacheStats()
+        self.clips_dir = self.root / "clips"
+        self.images_dir = self.root / "images"
+        self.clips_dir.mkdir(parents=True, exist_ok=True)
+        self.images_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(**params: Any) -> str:
+        """
+        Build a content address from render parameters.
+
+        Args:
+            **params: Everything that affects the rendered output
+
+        Returns:
+            Hex digest identifying the render
+        """
+        payload = json.dumps(params, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def clip_path(self, key: str) -> Path:
+        """Location of the cached clip for ``key``."""
+        return self.clips_dir / f"{key}.mp4"
+
+    def fetch_clip(self, key: str, destination: Path) -> bool:
+        """
+        Materialize a cached clip at ``destination`` (hard link, or copy across devices).
+
+        Args:
+            key: Clip key
+            destination: Where the clip should appear
+
+        Returns:
+            True on a hit, False if the clip is not cached
+        """
+        source = self.clip_path(key)
+        try:
+            place_file(source, destination)
+        except FileNotFoundError:
+            self.clip_stats.misses += 1
+            record_cache("clip", hit=False)
+            return False
+
+        self.clip_stats.hits += 1
+        record_cache("clip", hit=True)
+        self._used_marker(key).touch()
+        return True
+
+    def _used_marker(self, key: str) -> Path:
+        """File whose modification time records the last use of a cached clip."""
+        return self.clips_dir / f"{key}.used"
+
+    def get_image(self, key: str) -> Optional[str]:
+        """
+        Look up a cached keyframe image URL.
+
+        Args:
+            key: Image key
+
+        Returns:
+            Image URL, or None if missing or expired
+        """
+        path = self.images_dir / f"{key}.json"
+        try:
+            entry = json.loads(path.read_text())
+        except (FileNotFoundError, ValueError):
+            self.image_stats.misses += 1
+            record_cache("image", hit=False)
+            return None
+
+        if time.time() - entry["created_at"] > self.image_ttl_seconds:
+            path.unlink(missing_ok=True)
+            self.image_stats.misses += 1
+            record_cache("image", hit=False)
+            return None
+
+        self.image_stats.hits += 1
+        record_cache("image", hit=True)
+        return entry["url"]
+
+    def put_image(self, key: str, url: str) -> None:
+        """
+        Cache a keyframe image URL.
+
+        Args:
+            key: Image key
+            url: Runway output URL
+        """
+        entry = {"url": url, "created_at": time.time()}
+        atomic_write(self.images_dir / f"{key}.json", json.dumps(entry).encode("utf-8"))
+
+    def size_bytes(self) -> int:
+        """Total size of cached clips."""
+        return sum(path.stat().st_size for path in self.clips_dir.glob("*.mp4"))
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """
+        Delete least recently used clips until the cache fits its disk budget.
+
+        Args:
+            keep: Clip that must not be evicted (the one just written)
+
+        Returns:
+            Number of clips removed
+        """
+        entries = []
+        for path in self.clips_dir.glob("*.mp4"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            try:
+                last_used = self._used_marker(path.stem).stat().st_mtime
+            except FileNotFoundError:
+                last_used = stat.st_mtime  # never hit since it was rendered
+            entries.append((last_used, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            self._used_marker(path.stem).unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        self.clip_stats.evictions += removed
+        return removed
+
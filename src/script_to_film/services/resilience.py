@@ -0,0 +1,265 @@
+"""Retries and circuit breaking for calls to external providers."""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import anthropic
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from script_to_film.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Responses worth retrying: timeouts, throttling and server-side failures
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429})
+# Failures to reach a provider at all, always worth retrying
+CONNECTION_ERRORS = (httpx.TransportError, asyncio.TimeoutError, anthropic.APIConnectionError)
+
+
+class ProviderUnavailableError(Exception):
+    """
+    Raised when a provider is failing and the caller should degrade instead of waiting.
+
+    Either the circuit is open (the call was not attempted) or every retry of a
+    transient error failed.
+    """
+
+    def __init__(self, provider: str, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.provider = provider
+        self.retry_after = retry_after  # seconds until the provider is worth trying again
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    Whether an error is transient and the call may succeed if repeated.
+
+    Connection failures, timeouts, throttling (408/425/429) and 5xx responses are
+    retryable; other client errors (bad request, auth, not found) are not. An
+    error raised from a transport failure is classified by its cause.
+    """
+    if isinstance(exc, ProviderUnavailableError):
+        return False
+    if isinstance(exc, CONNECTION_ERRORS):
+        return True
+    status_code = getattr(exc, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+    if exc.__cause__ is not None:
+        return is_retryable(exc.__cause__)
+    return False
+
+
+def is_outage(exc: BaseException) -> bool:
+    """Whether an error counts against the provider's health (throttling does not)."""
+    return is_retryable(exc) and getattr(exc, "status_code", None) != 429
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a provider is down.
+
+    Closed: calls go through, consecutive outage errors are counted. After
+    ``failure_threshold`` of them the circuit opens and calls are refused for
+    ``reset_timeout`` seconds. Then it is half-open: one probe call is let
+    through; success closes the circuit, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe is allowed
+            clock: Monotonic clock (injectable for tests)
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """``closed``, ``open`` or ``half_open``."""
+        if self._opened_at is None:
+            return "closed"
+        if self._probing or self.clock() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets a probe through (0 when closed)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - self.clock())
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now; claims the probe slot when half-open."""
+        if self._opened_at is None:
+            return True
+        if self._probing or self.clock() - self._opened_at < self.reset_timeout:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        """The provider answered: close the circuit."""
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """The provider failed: open the circuit once the threshold is reached."""
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            self._opened_at = self.clock()
+        self._probing = False
+
+    def release(self) -> None:
+        """Give back a probe slot whose call ended without a verdict (e.g. cancelled)."""
+        self._probing = False
+
+
+class Resilience:
+    """
+    Retry policy and circuit breaker for one provider.
+
+    Retryable errors are retried with full-jitter exponential backoff; every
+    attempt first checks the breaker, so once the provider is marked down all
+    callers fail fast with ``ProviderUnavailableError`` instead of queueing
+    behind doomed requests. Non-retryable errors propagate unchanged.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        breaker: Optional[CircuitBreaker] = None,
+        max_attempts: Optional[int] = None,
+        initial_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            provider: Provider name, used in errors and health reports
+            breaker: Circuit breaker (defaults to one built from settings)
+            max_attempts: Attempts per call, including the first (defaults to settings)
+            initial_delay: Backoff scale in seconds (defaults to settings)
+            max_delay: Cap on a single backoff in seconds (defaults to settings)
+        """
+        self.provider = provider
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=settings.circuit_failure_threshold,
+            reset_timeout=settings.circuit_reset_seconds,
+        )
+        self.max_attempts = max_attempts or settings.retry_max_attempts
+        self.initial_delay = (
+            settings.retry_initial_delay if initial_delay is None else initial_delay
+        )
+        self.max_delay = settings.retry_max_delay if max_delay is None else max_delay
+
+    def unavailable(self, message: str) -> ProviderUnavailableError:
+        """Degraded-mode error for this provider, with a retry hint."""
+        retry_after = self.breaker.retry_after() or self.breaker.reset_timeout
+        return ProviderUnavailableError(self.provider, message, retry_after=retry_after)
+
+    def check(self) -> None:
+        """
+        Fail fast if the circuit is open.
+
+        Raises:
+            ProviderUnavailableError: If the provider is marked down
+        """
+        if self.breaker.state == "open":
+            raise self.unavailable(f"{self.provider} is unavailable (circuit open)")
+
+    async def _attempt(self, call: Callable[[], Awaitable[T]]) -> T:
+        if not self.breaker.allow():
+            raise self.unavailable(f"{self.provider} is unavailable (circuit open)")
+        try:
+            result = await call()
+        except Exception as e:
+            if is_outage(e):
+                self.breaker.record_failure()
+            else:
+                # The provider answered (e.g. a 4xx or a throttle), so it is up
+                self.breaker.record_success()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return result
+
+    async def call(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``call`` with retries, behind the circuit breaker.
+
+        Args:
+            call: Zero-argument coroutine function making one provider request
+
+        Returns:
+            The call's result
+
+        Raises:
+            ProviderUnavailableError: If the circuit is open or retries ran out
+        """
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.max_attempts),
+            wait=wait_random_exponential(multiplier=self.initial_delay, max=self.max_delay),
+            retry=retry_if_exception(is_retryable),
+            reraise=True,
+        )
+        try:
+            return await retrying(self._attempt, call)
+        except ProviderUnavailableError:
+            raise
+        except Exception as e:
+            if not is_retryable(e):
+                raise
+            logger.error(
+                "%s unavailable after %d attempts: %s",
+                self.provider,
+                self.max_attempts,
+                e,
+                extra={"provider": self.provider},
+            )
+            raise self.unavailable(
+                f"{self.provider} request failed after {self.max_attempts} attempts: {e}"
+            ) from e
+
+
+_policies: dict[str, Resilience] = {}
+
+
+def get_resilience(provider: str) -> Resilience:
+    """Process-wide retry policy and circuit breaker for a provider."""
+    if provider not in _policies:
+        _policies[provider] = Resilience(provider)
+    return _policies[provider]
+
+
+def circuit_states() -> dict[str, str]:
+    """State of every provider circuit used in this process."""
+    return {provider: policy.breaker.state for provider, policy in _policies.items()}
@@ -0,0 +1,281 @@
+"""Async client for the Runway API."""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from script_to_film.config.settings import settings
+from script_to_film.services.downloader import DownloadResult, Downloader
+from script_to_film.services.rate_limiter import RateLimiter, get_rate_limiter, parse_retry_after
+from script_to_film.services.resilience import Resilience, get_resilience
+
+logger = logging.getLogger(__name__)
+
+
+class RunwayAPIError(Exception):
+    """Raised when the Runway API rejects a request."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class RunwayTask:
+    """Snapshot of a Runway generation task."""
+
+    id: str
+    status: str
+    output: list[str] = field(default_factory=list)
+    failure: Optional[str] = None
+    progress: Optional[float] = None
+
+    @classmethod
+    def from_response(cls, data: dict[str, Any]) -> "RunwayTask":
+        """Build a task from a ``/v1/tasks/{id}`` response body."""
+        return cls(
+            id=data["id"],
+            status=data.get("status", "PENDING"),
+            output=list(data.get("output") or []),
+            failure=data.get("failure"),
+            progress=data.get("progress"),
+        )
+
+
+class RunwayClient:
+    """
+    Non-blocking Runway API client shared by every render in the process.
+
+    Talks to the Runway REST API over one pooled ``httpx.AsyncClient`` so task
+    creation and status polls never block the event loop and reuse keep-alive
+    connections instead of paying TLS setup on every call.
+    """
+
+    def __init__(
+        self,
+        api_secret: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        limiter: Optional[RateLimiter] = None,
+        resilience: Optional[Resilience] = None,
+    ) -> None:
+        """
+        Initialize the Runway client.
+
+        Args:
+            api_secret: Runway API secret (defaults to settings)
+            base_url: API base URL (defaults to settings)
+            timeout: Per-request timeout in seconds (defaults to settings)
+            max_connections: Connection pool size (defaults to settings)
+            transport: Optional httpx transport, used to point the client at a fake server
+            limiter: Quota governor every API call acquires from (defaults to the
+                process-wide limiter)
+            resilience: Retry policy and circuit breaker for API calls (defaults to
+                the process-wide Runway policy)
+        """
+        self.api_secret = api_secret or settings.runwayml_api_secret
+        self.base_url = base_url or settings.runway_api_base_url
+        self.timeout = timeout or settings.runway_request_timeout
+        self.max_connections = max_connections or settings.runway_max_connections
+        self._transport = transport
+        self.limiter = limiter or get_rate_limiter()
+        self.resilience = resilience or get_resilience("runway")
+        self._api_client: Optional[httpx.AsyncClient] = None
+        self._download_client: Optional[httpx.AsyncClient] = None
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+
+    @property
+    def api_client(self) -> httpx.AsyncClient:
+        """Pooled client for authenticated API calls (created on first use)."""
+        if self._api_client is None:
+            self._api_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_secret}",
+                    "X-Runway-Version": settings.runway_api_version,
+                },
+                timeout=self.timeout,
+                limits=self._limits(),
+                transport=self._transport,
+            )
+        return self._api_client
+
+    @property
+    def download_client(self) -> httpx.AsyncClient:
+        """Pooled client for fetching task outputs; never sends API credentials."""
+        if self._download_client is None:
+            self._download_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self._limits(),
+                transport=self._transport,
+                follow_redirects=True,
+            )
+        return self._download_client
+
+    async def _send(
+        self, method: str, path: str, model: Optional[str] = None, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send an API request within the rate limits, retrying transient failures.
+
+        Throttled requests wait out Retry-After (reported to the shared limiter)
+        and 5xx responses and connection errors back off with jitter; both are
+        retried behind the Runway circuit breaker.
+
+        Raises:
+            ProviderUnavailableError: If Runway is marked down or retries ran out
+        """
+
+        async def attempt() -> httpx.Response:
+            async with self.limiter.acquire("runway", model=model):
+                response = await self.api_client.request(method, path, **kwargs)
+            if response.status_code == 429:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                logger.warning(
+                    "Runway API %s %s throttled, retrying in %.1fs", method, path, retry_after
+                )
+                await self.limiter.throttle("runway", model=model, retry_after=retry_after)
+            if response.status_code == 429 or response.status_code >= 500:
+                raise RunwayAPIError(
+                    f"Runway API {method} {path} failed with {response.status_code}",
+                    status_code=response.status_code,
+                )
+            return response
+
+        return await self.resilience.call(attempt)
+
+    async def _request(
+        self, method: str, path: str, model: Optional[str] = None, **kwargs: Any
+    ) -> dict[str, Any]:
+        response = await self._send(method, path, model=model, **kwargs)
+        if response.is_error:
+            raise RunwayAPIError(
+                f"Runway API {method} {path} failed with {response.status_code}: {response.text}",
+                status_code=response.status_code,
+            )
+        return response.json()
+
+    async def create_text_to_image(
+        self, prompt_text: str, model: str = "gen4_image", ratio: str = "1920:1080"
+    ) -> str:
+        """
+        Start a text-to-image task.
+
+        Args:
+            prompt_text: Image prompt
+            model: Runway image model
+            ratio: Output resolution as ``width:height``
+
+        Returns:
+            Task ID
+        """
+        data = await self._request(
+            "POST",
+            "/v1/text_to_image",
+            model=model,
+            json={"model": model, "promptText": prompt_text, "ratio": ratio},
+        )
+        return data["id"]
+
+    async def create_image_to_video(
+        self,
+        prompt_image: str,
+        prompt_text: str,
+        duration: int,
+        model: str = "gen3a_turbo",
+        ratio: str = "16:9",
+        watermark: bool = False,
+    ) -> str:
+        """
+        Start an image-to-video task.
+
+        Args:
+            prompt_image: URL of the keyframe image
+            prompt_text: Motion/scene prompt
+            duration: Clip duration in seconds
+            model: Runway video model
+            ratio: Output aspect ratio
+            watermark: Whether Runway should watermark the clip
+
+        Returns:
+            Task ID
+        """
+        data = await self._request(
+            "POST",
+            "/v1/image_to_video",
+            model=model,
+            json={
+                "model": model,
+                "promptImage": prompt_image,
+                "promptText": prompt_text,
+                "duration": duration,
+                "ratio": ratio,
+                "watermark": watermark,
+            },
+        )
+        return data["id"]
+
+    async def get_task(self, task_id: str) -> RunwayTask:
+        """
+        Fetch the current state of a task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Task snapshot
+        """
+        return RunwayTask.from_response(await self._request("GET", f"/v1/tasks/{task_id}"))
+
+    async def cancel_task(self, task_id: str) -> None:
+        """
+        Cancel a pending or running task (or delete a finished one).
+
+        Args:
+            task_id: Task ID
+        """
+        response = await self._send("DELETE", f"/v1/tasks/{task_id}")
+        if response.is_error and response.status_code != 404:
+            raise RunwayAPIError(
+                f"Runway API DELETE /v1/tasks/{task_id} failed with {response.status_code}",
+                status_code=response.status_code,
+            )
+
+    async def download_output(
+        self, url: str, destination: Path, expected_sha256: Optional[str] = None
+    ) -> DownloadResult:
+        """
+        Stream a task output to disk over the pooled download client.
+
+        Args:
+            url: Output URL returned by a succeeded task
+            destination: File to create (replaced atomically once complete)
+            expected_sha256: Optional hex digest the content must match
+
+        Returns:
+            Size and SHA-256 of the downloaded file
+        """
+        downloader = Downloader(
+            self.download_client,
+            chunk_size=settings.download_chunk_size,
+            max_attempts=settings.download_max_attempts,
+        )
+        return await downloader.download(url, destination, expected_sha256=expected_sha256)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients."""
+        for client in (self._api_client, self._download_client):
+            if client is not None:
+                await client.aclose()
+        self._api_client = None
+        self._download_client = None
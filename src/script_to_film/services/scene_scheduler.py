@@ -0,0 +1,145 @@
+"""Bounded-concurrency scheduling for per-scene rendering."""
+
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+P = TypeVar("P")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SceneProgress(Generic[R]):
+    """Progress update emitted each time a scene finishes rendering."""
+
+    index: int
+    completed: int
+    total: int
+    result: R
+
+
+ProgressCallback = Callable[[SceneProgress[Any]], Optional[Awaitable[None]]]
+
+
+class SceneScheduler:
+    """
+    Run per-scene work concurrently under a per-job and a process-wide limit.
+
+    A single scheduler is meant to be shared by every render job in the process,
+    so the global limit caps the total number of scenes in flight on this worker
+    while the per-job limit keeps one long film from starving the others.
+
+    Work can run as a two-stage pipeline: an optional ``prepare`` stage (bounded
+    by its own process-wide limit, not by the scene limits) starts for every item
+    immediately, and each item enters the main stage as soon as its own
+    preparation finishes, regardless of the order of the others.
+    """
+
+    def __init__(
+        self, max_in_flight: int, max_in_flight_per_job: int, max_preparing: int = 16
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_in_flight: Maximum scenes rendering at once across all jobs
+            max_in_flight_per_job: Default maximum scenes rendering at once per job
+            max_preparing: Maximum items in the prepare stage at once across all jobs
+        """
+        if max_in_flight < 1 or max_in_flight_per_job < 1 or max_preparing < 1:
+            raise ValueError("Concurrency limits must be at least 1")
+
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_job = max_in_flight_per_job
+        self.max_preparing = max_preparing
+        self._global_limit = asyncio.Semaphore(max_in_flight)
+        self._prepare_limit = asyncio.Semaphore(max_preparing)
+        self._in_flight = 0
+        self._preparing = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of scenes currently rendering across all jobs."""
+        return self._in_flight
+
+    @property
+    def preparing(self) -> int:
+        """Number of items currently in the prepare stage across all jobs."""
+        return self._preparing
+
+    async def run(
+        self,
+        items: Sequence[T],
+        worker: Callable[[int, Any], Awaitable[R]],
+        on_progress: Optional[ProgressCallback] = None,
+        max_in_flight: Optional[int] = None,
+        prepare: Optional[Callable[[int, T], Awaitable[P]]] = None,
+    ) -> list[R]:
+        """
+        Run ``worker`` for every item and return the results in input order.
+
+        Args:
+            items: Items to process (typically script scenes)
+            worker: Coroutine function called with ``(index, item)``, or with
+                ``(index, prepared)`` when ``prepare`` is given
+            on_progress: Optional callback (sync or async) invoked as each item completes;
+                an error it raises is logged and does not affect the other items
+            max_in_flight: Per-job limit overriding the scheduler default
+            prepare: Optional first stage called with ``(index, item)``; its result
+                is what ``worker`` receives
+
+        Returns:
+            Worker results, in the same order as ``items``
+        """
+        per_job = min(max_in_flight or self.max_in_flight_per_job, self.max_in_flight)
+        job_limit = asyncio.Semaphore(per_job)
+        total = len(items)
+        completed = 0
+
+        async def run_one(index: int, item: Any) -> R:
+            nonlocal completed
+
+            if prepare is not None:
+                async with self._prepare_limit:
+                    self._preparing += 1
+                    try:
+                        item = await prepare(index, item)
+                    finally:
+                        self._preparing -= 1
+
+            # Take the job slot first so a queued job never holds a global slot idle
+            async with job_limit:
+                async with self._global_limit:
+                    self._in_flight += 1
+                    try:
+                        result = await worker(index, item)
+                    finally:
+                        self._in_flight -= 1
+
+            completed += 1
+            if on_progress is not None:
+                # A failed progress write must not cancel the scenes still rendering
+                try:
+                    outcome = on_progress(SceneProgress(index, completed, total, result))
+                    if inspect.isawaitable(outcome):
+                        await outcome
+                except Exception:
+                    logger.exception(
+                        "Progress callback failed for scene %d",
+                        index,
+                        extra={"scene_number": index},
+                    )
+            return result
+
+        tasks = [asyncio.ensure_future(run_one(i, item)) for i, item in enumerate(items)]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
@@ -1,9 +1,34 @@
 """Script parsing service."""
 
+import logging
 import re
-from typing import Optional
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Iterable, Iterator, Optional
 
 from script_to_film.models.script import Script, ScriptScene
+from script_to_film.utils.metrics import SCRIPT_PARSE_BYTES, SCRIPT_PARSE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# First characters of a possible scene heading: "*" or a case-insensitive I/E
+# (including the Turkish dotted and dotless I, which match "I" case-insensitively)
+HEADING_START = frozenset("*IiEe\u0130\u0131")
+
+# Upper-case lines that are editing directions rather than character cues
+TRANSITION_PREFIXES = ("FADE IN", "FADE OUT")
+TRANSITION_SUFFIXES = ("TO:", "TO BLACK.")
+
+
+class LineKind(str, Enum):
+    """Role of a line inside a scene (headings are found by ``match_heading``)."""
+
+    CHARACTER = "character"
+    PARENTHETICAL = "parenthetical"
+    DIALOGUE = "dialogue"
+    TRANSITION = "transition"
+    ACTION = "action"
 
 
 class ScriptParser:
@@ -11,12 +36,12 @@ class ScriptParser:
 
     def __init__(self) -> None:
         """Initialize the script parser."""
-        # More flexible pattern that accepts any time of day and markdown formatting
-        # Matches: INT./EXT. LOCATION - TIME or **INT./EXT. LOCATION - TIME** (markdown bold)
-        # Uses greedy matching for location to capture everything up to the last dash before time
-        self.scene_pattern = re.compile(
-            r"\*{0,2}(?:INT\.|EXT\.)\s+(.+)\s+-\s+([A-Z]+)\*{0,2}",re.IGNORECASE
-        )
+        # Scene headings accept any time of day and markdown formatting:
+        # INT./EXT. LOCATION - TIME or **INT./EXT. LOCATION - TIME** (markdown bold).
+        # Only the prefix is a pattern; match_heading scans for the last dash before
+        # the time, so long lines are never backtracked over.
+        self.scene_pattern = re.compile(r"\*{0,2}(?:INT|EXT)\.", re.IGNORECASE)
+        self.time_of_day_pattern = re.compile(r"[A-Z]+", re.IGNORECASE)
 
     def parse(self, script_content: str, title: str, author: Optional[str] = None) -> Script:
         """
@@ -30,20 +55,49 @@ class ScriptParser:
         Returns:
             Parsed Script object with structured scenes
         """
+        started = time.perf_counter()
         scenes = self._extract_scenes(script_content)
+        SCRIPT_PARSE_SECONDS.observe(time.perf_counter() - started)
+        SCRIPT_PARSE_BYTES.observe(len(script_content))
+        return self.build_script(script_content, title, author, scenes)
+
+    def build_script(
+        self,
+        script_content: str,
+        title: str,
+        author: Optional[str],
+        scenes: list[ScriptScene],
+    ) -> Script:
+        """
+        Assemble a Script from content whose scenes have already been extracted.
+
+        Args:
+            script_content: Raw script text
+            title: Script title
+            author: Script author
+            scenes: Scenes parsed from the content
+
+        Returns:
+            Script object with the given scenes
+        """
         total_duration = sum(scene.duration_seconds or 0 for scene in scenes)
 
-        print(f"\n=== SCRIPT PARSER DEBUG ===")
-        print(f"Script title: {title}")
-        print(f"Content length: {len(script_content)} characters")
-        print(f"Scenes found: {len(scenes)}")
         if scenes:
-            print(f"First scene location: {scenes[0].location}")
-            print(f"First scene has video_prompt: {bool(scenes[0].video_prompt)}")
+            logger.debug(
+                "Parsed script %r",
+                title,
+                extra={
+                    "content_length": len(script_content),
+                    "scene_count": len(scenes),
+                    "first_location": scenes[0].location,
+                },
+            )
         else:
-            print("WARNING: No scenes were parsed! Check script format.")
-            print(f"Script preview: {script_content[:500]}")
-        print(f"=========================\n")
+            logger.warning(
+                "No scenes were parsed from script %r, check the script format",
+                title,
+                extra={"content_length": len(script_content), "preview": script_content[:500]},
+            )
 
         return Script(
             title=title,
@@ -53,65 +107,112 @@ class ScriptParser:
             total_duration=total_duration if total_duration > 0 else None,
         )
 
-    def _extract_scenes(self, content: str) -> list[ScriptScene]:
-        """Extract scenes from script content."""
-        scenes = []
-        lines = content.split("\n")
-        current_scene: Optional[dict] = None
-        scene_number = 0
+    def incremental(self, keep_content: bool = False) -> "IncrementalScriptParser":
+        """
+        Create an incremental parser that accepts the script in text chunks.
 
-        for line in lines:
-            line = line.strip()
-            if not line:
+        Args:
+            keep_content: Retain the fed text so it is available as ``content``
+
+        Returns:
+            New incremental parser using this parser's rules
+        """
+        return IncrementalScriptParser(self, keep_content=keep_content)
+
+    def iter_scenes(self, chunks: Iterable[str]) -> Iterator[ScriptScene]:
+        """
+        Lazily extract scenes from script text supplied in chunks.
+
+        Only the scene currently being parsed is held in memory, so an open
+        file (or ``iter(lambda: f.read(65536), "")``) can be parsed in
+        constant memory regardless of its size.
+
+        Args:
+            chunks: Script text in pieces of any size
+
+        Yields:
+            Scenes in script order, each as soon as it is complete
+        """
+        incremental = self.incremental()
+        for chunk in chunks:
+            yield from incremental.feed(chunk)
+        yield from incremental.close()
+
+    def match_heading(self, line: str) -> Optional[tuple[str, str]]:
+        """
+        Recognise a scene heading in one stripped line.
+
+        Equivalent to matching ``INT. (.+) - ([A-Z]+)`` with a greedy location,
+        but runs in linear time: after the fixed prefix, dashes are tried from
+        the right until one is surrounded by whitespace and followed by a word.
+
+        Args:
+            line: Stripped script line
+
+        Returns:
+            ``(location, time of day)``, or None if the line is not a heading
+        """
+        prefix = self.scene_pattern.match(line)
+        if prefix is None:
+            return None
+        start = prefix.end()
+        length = len(line)
+        if start == length or not line[start].isspace():
+            return None
+
+        # The location needs at least one character between the prefix and the dash
+        dash = length
+        while True:
+            dash = line.rfind("-", start + 3, dash)
+            if dash == -1:
+                return None
+            if not line[dash - 1].isspace():
+                continue
+            word = dash + 1
+            while word < length and line[word].isspace():
+                word += 1
+            if word == dash + 1:
                 continue
+            time_of_day = self.time_of_day_pattern.match(line, word)
+            if time_of_day is not None:
+                return line[start : dash - 1].strip(), time_of_day.group()
+
+    def classify(self, line: str, after_cue: bool = False) -> LineKind:
+        """
+        Classify one stripped, non-empty line that is not a scene heading.
 
-            # Check for scene heading
-            scene_match = self.scene_pattern.match(line)
-            if scene_match:
-                # Save previous scene if exists
-                if current_scene:
-                    scenes.append(self._create_scene(scene_number, current_scene))
-                    scene_number += 1
-
-                # Start new scene
-                current_scene = {
-                    "location": scene_match.group(1).strip(),
-                    "time_of_day": scene_match.group(2).strip(),
-                    "description": "",
-                    "dialogue": [],
-                }
-            elif current_scene:
-                # Add content to current scene
-                if line.isupper() and len(line.split()) <= 3:
-                    # Character name
-                    current_scene["current_character"] = line
-                elif current_scene.get("current_character"):
-                    # Dialogue
-                    current_scene["dialogue"].append(
-                        {"character": current_scene["current_character"], "line": line}
-                    )
-                    current_scene["current_character"] = None
-                else:
-                    # Action/description
-                    current_scene["description"] += f" {line}"
-
-        # Save last scene
-        if current_scene:
-            scenes.append(self._create_scene(scene_number, current_scene))
-
-        return scenes
-
-    def _create_scene(self, scene_number: int, scene_data: dict) -> ScriptScene:
+        Args:
+            line: Stripped script line
+            after_cue: Whether a character cue is waiting for its dialogue
+
+        Returns:
+            The line's role in the scene
+        """
+        if after_cue and line[0] == "(" and line[-1] == ")":
+            return LineKind.PARENTHETICAL
+        if line.isupper():
+            if line.startswith(TRANSITION_PREFIXES) or line.endswith(TRANSITION_SUFFIXES):
+                return LineKind.TRANSITION
+            if len(line.split(None, 3)) <= 3:
+                return LineKind.CHARACTER
+        return LineKind.DIALOGUE if after_cue else LineKind.ACTION
+
+    def _extract_scenes(self, content: str) -> list[ScriptScene]:
+        """Extract scenes from script content."""
+        return list(self.iter_scenes([content]))
+
+    def _create_scene(self, scene_number: int, scene_data: "_SceneState") -> ScriptScene:
         """Create a ScriptScene object from parsed data."""
+        description = " ".join(scene_data.description)
+
         # Estimate duration based on dialogue and description length
-        dialogue_duration = len(scene_data["dialogue"]) * 3  # ~3 seconds per dialogue line
-        description_words = len(scene_data["description"].split())
+        dialogue_duration = len(scene_data.dialogue) * 3  # ~3 seconds per dialogue line
+        description_words = len(description.split())
         description_duration = description_words * 0.3  # ~0.3 seconds per word
 
         # Generate optimized video prompt for the scene
-        location = scene_data["location"]
-        time_of_day = scene_data["time_of_day"]
-        description = scene_data["description"].strip()
+        location = scene_data.location
+        time_of_day = scene_data.time_of_day
 
         # Determine camera angle variety based on scene number for dynamic filming
         camera_angles = [
@@ -159,10 +260,123 @@ class ScriptParser:
 
         return ScriptScene(
             scene_number=scene_number,
-            location=scene_data["location"],
-            time_of_day=scene_data["time_of_day"],
-            description=scene_data["description"].strip(),
-            dialogue=scene_data["dialogue"],
+            location=location,
+            time_of_day=time_of_day,
+            description=description,
+            dialogue=scene_data.dialogue,
             duration_seconds=max(dialogue_duration + description_duration, 5.0),
             video_prompt=video_prompt,
         )
+
+
+@dataclass
+class _SceneState:
+    """Scene currently being parsed."""
+
+    location: str
+    time_of_day: str
+    description: list[str] = field(default_factory=list)
+    dialogue: list[dict[str, str]] = field(default_factory=list)
+    current_character: Optional[str] = None
+
+
+class IncrementalScriptParser:
+    """
+    Resumable parser for a script that arrives in chunks.
+
+    Used for streamed LLM output and for large uploads. Text is consumed line
+    by line through a small state machine; completed scenes are yielded as soon
+    as the next scene heading (or the end of input) closes them, and only the
+    scene in progress is kept in memory. Feeding a whole script produces exactly
+    the scenes ``ScriptParser.parse`` returns for it.
+
+    ``feed`` and ``close`` are generators: exhaust each before feeding more text.
+    """
+
+    def __init__(self, parser: ScriptParser, keep_content: bool = False) -> None:
+        """
+        Initialize the incremental parser.
+
+        Args:
+            parser: Parser whose scene rules are applied
+            keep_content: Retain the fed text so it is available as ``content``
+        """
+        self.parser = parser
+        self.keep_content = keep_content
+        self._content_parts: list[str] = []
+        self._pending = ""
+        self._scene: Optional[_SceneState] = None
+        self._scene_number = 0
+
+    @property
+    def content(self) -> str:
+        """All text fed so far (requires ``keep_content``)."""
+        if not self.keep_content:
+            raise RuntimeError("Incremental parser was created without keep_content")
+        return "".join(self._content_parts)
+
+    def feed(self, chunk: str) -> Iterator[ScriptScene]:
+        """
+        Feed a chunk of script text.
+
+        Args:
+            chunk: Next piece of the script
+
+        Yields:
+            Scenes completed by this chunk
+        """
+        if self.keep_content:
+            self._content_parts.append(chunk)
+
+        # Only complete lines are parsed; the trailing partial line waits for more text
+        lines = (self._pending + chunk).split("\n")
+        self._pending = lines.pop()
+        yield from self._process_lines(lines)
+
+    def close(self) -> Iterator[ScriptScene]:
+        """
+        Signal the end of input.
+
+        Yields:
+            The final scene, if any
+        """
+        pending, self._pending = self._pending, ""
+        yield from self._process_lines([pending])
+
+        if self._scene is not None:
+            yield self.parser._create_scene(self._scene_number, self._scene)
+            self._scene = None
+
+    def _process_lines(self, lines: list[str]) -> Iterator[ScriptScene]:
+        # One pass over the lines; hot lookups are bound to locals
+        match_heading = self.parser.match_heading
+        classify = self.parser.classify
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            heading = match_heading(line) if line[0] in HEADING_START else None
+            if heading is not None:
+                # Emit the previous scene, if any
+                if self._scene is not None:
+                    yield self.parser._create_scene(self._scene_number, self._scene)
+                    self._scene_number += 1
+
+                self._scene = _SceneState(location=heading[0], time_of_day=heading[1])
+                continue
+
+            scene = self._scene
+            if scene is None:
+                # Text before the first scene heading is not part of any scene
+                continue
+
+            kind = classify(line, after_cue=scene.current_character is not None)
+            if kind is LineKind.CHARACTER:
+                scene.current_character = line
+            elif kind is LineKind.DIALOGUE:
+                scene.dialogue.append({"character": scene.current_character, "line": line})
+                scene.current_character = None
+            elif kind is LineKind.ACTION:
+                scene.description.append(line)
+            # Parentheticals keep the cue waiting for its line; transitions are not scene content
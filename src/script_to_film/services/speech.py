@@ -0,0 +1,468 @@
+"""Dialogue speech synthesis and per-scene audio tracks."""
+
+import array
+import asyncio
+import hashlib
+import io
+import logging
+import math
+import wave
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from script_to_film.config.settings import settings
+from script_to_film.services.cache import CacheStats
+from script_to_film.services.rate_limiter import RateLimiter, get_rate_limiter, parse_retry_after
+from script_to_film.services.render_cache import RenderCache
+from script_to_film.services.resilience import Resilience, get_resilience
+from script_to_film.utils.files import atomic_write
+from script_to_film.utils.metrics import record_cache
+from script_to_film.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Every backend returns raw PCM in this format so lines can be mixed without decoding
+SAMPLE_RATE = 24000
+SAMPLE_WIDTH = 2  # 16-bit signed little-endian
+CHANNELS = 1
+
+
+class SpeechError(Exception):
+    """Raised when a line of dialogue cannot be synthesized."""
+
+    def __init__(
+        self,
+        message: str,
+        retry_after: Optional[float] = None,
+        status_code: Optional[int] = None,
+    ) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after  # set when the provider throttled the request
+        self.status_code = status_code  # HTTP status of a rejected request
+
+
+class VoiceBackend(ABC):
+    """Text-to-speech provider producing 24 kHz 16-bit mono PCM."""
+
+    name = "base"
+    model: Optional[str] = None
+    voices: tuple[str, ...] = ("default",)
+
+    @abstractmethod
+    async def synthesize(self, text: str, voice: str, emotion: Optional[str] = None) -> bytes:
+        """
+        Speak one line.
+
+        Args:
+            text: Line to speak
+            voice: Backend voice name
+            emotion: Optional delivery (e.g. "angry", "whispering")
+
+        Returns:
+            Raw PCM samples
+        """
+
+    async def aclose(self) -> None:
+        """Release backend resources."""
+
+
+class StubVoiceBackend(VoiceBackend):
+    """
+    Offline backend that "speaks" a tone per voice, for tests and local demos.
+
+    Line length follows word count, so mixing and padding behave like real
+    speech without network access or API keys.
+    """
+
+    name = "stub"
+    voices = ("low", "mid", "high", "bright")
+    _pitches = {"low": 140.0, "mid": 220.0, "high": 330.0, "bright": 440.0}
+
+    def __init__(self, seconds_per_word: float = 0.3, delay: float = 0.0) -> None:
+        """
+        Initialize the stub.
+
+        Args:
+            seconds_per_word: Speaking rate
+            delay: Simulated latency per request in seconds
+        """
+        self.seconds_per_word = seconds_per_word
+        self.delay = delay
+        self.calls: list[tuple[str, str, Optional[str]]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def synthesize(self, text: str, voice: str, emotion: Optional[str] = None) -> bytes:
+        self.calls.append((text, voice, emotion))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        seconds = max(len(text.split()), 1) * self.seconds_per_word
+        pitch = self._pitches.get(voice, 220.0)
+        samples = array.array(
+            "h",
+            (
+                int(8000 * math.sin(2 * math.pi * pitch * i / SAMPLE_RATE))
+                for i in range(int(seconds * SAMPLE_RATE))
+            ),
+        )
+        return samples.tobytes()
+
+
+class OpenAIVoiceBackend(VoiceBackend):
+    """OpenAI text-to-speech over the REST API, requesting raw PCM."""
+
+    name = "openai"
+    voices = ("alloy", "ash", "coral", "echo", "fable", "nova", "onyx", "sage", "shimmer")
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            api_key: OpenAI API key (defaults to settings)
+            base_url: API base URL (defaults to settings)
+            model: Speech model (defaults to settings)
+            transport: Optional httpx transport, used to point the client at a fake server
+        """
+        self.model = model or settings.openai_tts_model
+        self._client = httpx.AsyncClient(
+            base_url=base_url or settings.openai_base_url,
+            headers={"Authorization": f"Bearer {api_key or settings.openai_api_key}"},
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            transport=transport,
+        )
+
+    async def synthesize(self, text: str, voice: str, emotion: Optional[str] = None) -> bytes:
+        payload = {"model": self.model, "voice": voice, "input": text, "response_format": "pcm"}
+        if emotion:
+            payload["instructions"] = f"Speak {emotion}."
+        try:
+            response = await self._client.post("/audio/speech", json=payload)
+        except httpx.HTTPError as e:
+            raise SpeechError(f"Speech request failed: {e}") from e
+        if response.status_code == 429:
+            raise SpeechError(
+                "Speech request throttled",
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                status_code=429,
+            )
+        if response.status_code >= 400:
+            raise SpeechError(
+                f"Speech request failed ({response.status_code}): {response.text}",
+                status_code=response.status_code,
+            )
+        return response.content
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def build_voice_backend(name: Optional[str] = None) -> VoiceBackend:
+    """
+    Create the configured voice backend.
+
+    Args:
+        name: "openai" or "stub" (defaults to settings)
+
+    Returns:
+        Voice backend
+    """
+    name = name or settings.speech_backend
+    if name == "openai":
+        return OpenAIVoiceBackend()
+    if name == "stub":
+        return StubVoiceBackend()
+    raise ValueError(f"Unknown speech backend: {name}")
+
+
+class LineCache:
+    """
+    On-disk cache of synthesized lines keyed by backend, voice, text and emotion.
+
+    Lines are small, so entries are kept until the directory is cleared; a
+    re-render only synthesizes lines whose text, voice or delivery changed.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            root: Cache directory
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached PCM for ``key``, or None."""
+        try:
+            data = (self.root / f"{key}.pcm").read_bytes()
+        except FileNotFoundError:
+            self.stats.misses += 1
+            record_cache("speech", hit=False)
+            return None
+        self.stats.hits += 1
+        record_cache("speech", hit=True)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store PCM for ``key``."""
+        atomic_write(self.root / f"{key}.pcm", data)
+
+
+def silence(seconds: float) -> bytes:
+    """PCM silence of the given length."""
+    return bytes(int(seconds * SAMPLE_RATE) * SAMPLE_WIDTH * CHANNELS)
+
+
+def pcm_duration(pcm: bytes) -> float:
+    """Length of PCM audio in seconds."""
+    return len(pcm) / (SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS)
+
+
+def wav_bytes(pcm: bytes) -> bytes:
+    """Wrap PCM in a WAV container."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(CHANNELS)
+        wav.setsampwidth(SAMPLE_WIDTH)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def mix_track(lines: list[bytes], duration: float, gap: float) -> bytes:
+    """
+    Lay dialogue lines out one after another into a scene track.
+
+    Lines are separated by ``gap`` seconds of silence and the track is padded
+    with silence to ``duration``. Dialogue that runs longer than the scene is
+    kept whole rather than cut mid-word.
+
+    Args:
+        lines: PCM of each line, in script order
+        duration: Scene length in seconds
+        gap: Pause between lines in seconds
+
+    Returns:
+        PCM of the whole track
+    """
+    pause = silence(gap)
+    track = pause.join(lines)
+    remaining = duration - pcm_duration(track)
+    if remaining > 0:
+        track += silence(remaining)
+    return track
+
+
+class SpeechSynthesizer:
+    """
+    Turns script dialogue into per-scene audio tracks.
+
+    Every line of every requested scene is synthesized concurrently through one
+    bounded pool that draws on the provider's shared quota; identical lines in flight
+    share one request and finished lines are cached, so re-rendering an edited
+    script only synthesizes the lines that changed.
+    """
+
+    def __init__(
+        self,
+        backend: VoiceBackend,
+        cache: Optional[LineCache] = None,
+        max_concurrent_requests: int = 8,
+        line_gap: float = 0.25,
+        limiter: Optional[RateLimiter] = None,
+        resilience: Optional[Resilience] = None,
+    ) -> None:
+        """
+        Initialize the synthesizer.
+
+        Args:
+            backend: Voice backend
+            cache: Optional cache of synthesized lines
+            max_concurrent_requests: Cap on in-flight backend requests
+            line_gap: Pause between consecutive lines in seconds
+            limiter: Quota governor requests acquire from, under the backend's name
+                (defaults to the process-wide limiter)
+            resilience: Retry policy and circuit breaker for backend requests
+                (defaults to the process-wide policy for the backend's provider)
+        """
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        self.backend = backend
+        self.cache = cache
+        self.line_gap = line_gap
+        self.limiter = limiter or get_rate_limiter()
+        self.resilience = resilience or get_resilience(backend.name)
+        self._limit = asyncio.Semaphore(max_concurrent_requests)
+        self._lines: SingleFlight[bytes] = SingleFlight()
+
+    def voice_for(self, character: str, voices: Optional[dict[str, str]] = None) -> str:
+        """
+        Pick the voice for a character.
+
+        Characters without an explicit voice get a stable one derived from their
+        name, so the same character sounds the same (and hits the cache) across renders.
+
+        Args:
+            character: Character name as it appears in the script
+            voices: Optional character to voice mapping
+
+        Returns:
+            Backend voice name
+        """
+        if voices and character in voices:
+            return voices[character]
+        digest = hashlib.sha256(character.strip().upper().encode("utf-8")).digest()
+        return self.backend.voices[digest[0] % len(self.backend.voices)]
+
+    def line_key(self, text: str, voice: str, emotion: Optional[str]) -> str:
+        """Cache key of a synthesized line."""
+        return RenderCache.key(backend=self.backend.name, voice=voice, text=text, emotion=emotion)
+
+    async def synthesize_line(self, text: str, voice: str, emotion: Optional[str] = None) -> bytes:
+        """
+        Synthesize one line, reusing cached or in-flight results.
+
+        Args:
+            text: Line to speak
+            voice: Backend voice name
+            emotion: Optional delivery
+
+        Returns:
+            Raw PCM samples
+        """
+        key = self.line_key(text, voice, emotion)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        async def synthesize() -> bytes:
+            async with self._limit:
+                pcm = await self._request(text, voice, emotion)
+            if self.cache is not None:
+                self.cache.put(key, pcm)
+            return pcm
+
+        return await self._lines.do(key, synthesize)
+
+    async def _request(self, text: str, voice: str, emotion: Optional[str]) -> bytes:
+        """Call the backend within its quota, retrying throttling and transient failures."""
+        provider, model = self.backend.name, self.backend.model
+
+        async def attempt() -> bytes:
+            try:
+                async with self.limiter.acquire(provider, model=model):
+                    return await self.backend.synthesize(text, voice, emotion)
+            except SpeechError as e:
+                if e.retry_after is not None:
+                    await self.limiter.throttle(provider, model=model, retry_after=e.retry_after)
+                raise
+
+        return await self.resilience.call(attempt)
+
+    async def synthesize_track(
+        self,
+        dialogue: list[dict[str, str]],
+        duration: float,
+        destination: Path,
+        voices: Optional[dict[str, str]] = None,
+    ) -> str:
+        """
+        Synthesize a scene's dialogue and mix it into one WAV track.
+
+        Args:
+            dialogue: Dialogue lines (``character``, ``line`` and optional ``emotion``)
+            duration: Scene length in seconds
+            destination: WAV file to write
+            voices: Optional character to voice mapping
+
+        Returns:
+            Path of the track
+        """
+        lines = await asyncio.gather(
+            *(
+                self.synthesize_line(
+                    entry["line"],
+                    self.voice_for(entry.get("character", ""), voices),
+                    entry.get("emotion"),
+                )
+                for entry in dialogue
+            )
+        )
+        track = mix_track(list(lines), duration, self.line_gap)
+        await asyncio.to_thread(atomic_write, destination, wav_bytes(track))
+        return str(destination)
+
+    async def synthesize_scenes(
+        self,
+        scenes: list[tuple[list[dict[str, str]], float, Path]],
+        voices: Optional[dict[str, str]] = None,
+    ) -> list[Optional[str]]:
+        """
+        Build tracks for many scenes at once.
+
+        All lines of all scenes are fanned out together, bounded only by the
+        shared pool. A scene whose lines fail gets no track; the others still do.
+
+        Args:
+            scenes: (dialogue, duration, destination) per scene
+            voices: Optional character to voice mapping
+
+        Returns:
+            Track path per scene, in input order (None where synthesis failed)
+        """
+        results = await asyncio.gather(
+            *(
+                self.synthesize_track(dialogue, duration, destination, voices)
+                for dialogue, duration, destination in scenes
+            ),
+            return_exceptions=True,
+        )
+        tracks: list[Optional[str]] = []
+        for (_, _, destination), result in zip(scenes, results):
+            if isinstance(result, Exception):
+                logger.error("Error synthesizing dialogue for %s: %s", destination.name, result)
+                tracks.append(None)
+            else:
+                tracks.append(result)
+        return tracks
+
+    async def aclose(self) -> None:
+        """Close the voice backend."""
+        await self.backend.aclose()
+
+
+def build_speech_synthesizer(cache_root: Optional[Path] = None) -> SpeechSynthesizer:
+    """
+    Create a synthesizer from settings.
+
+    Args:
+        cache_root: Directory for cached lines (None disables the line cache)
+
+    Returns:
+        Speech synthesizer
+    """
+    return SpeechSynthesizer(
+        build_voice_backend(),
+        cache=LineCache(cache_root) if cache_root is not None else None,
+        max_concurrent_requests=settings.speech_max_concurrent_requests,
+        line_gap=settings.speech_line_gap_seconds,
+    )
@@ -0,0 +1,263 @@
+"""Process-wide polling of Runway task status."""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from script_to_film.services.resilience import ProviderUnavailableError
+from script_to_film.services.runway_client import RunwayAPIError, RunwayClient, RunwayTask
+from script_to_film.utils.metrics import RUNWAY_TASK_SECONDS, RUNWAY_TASKS
+
+logger = logging.getLogger(__name__)
+
+# Statuses after which a task never changes again
+TERMINAL_STATUSES = frozenset({"SUCCEEDED", "FAILED", "CANCELLED"})
+
+
+class TaskTimeoutError(Exception):
+    """Raised when a task does not finish before its deadline."""
+
+
+@dataclass
+class _Watch:
+    """A task being polled on behalf of one or more waiters."""
+
+    task_id: str
+    interval: float
+    next_check: float
+    result: asyncio.Future = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+    waiters: int = 0
+    step: str = "task"  # pipeline step the task belongs to, for metrics
+    started_at: float = 0.0  # when polling began
+    running_at: Optional[float] = None  # first check that found the task running
+
+
+class TaskPoller:
+    """
+    Wait for Runway tasks with one shared polling loop.
+
+    Every task in the process is tracked by a single background loop that wakes
+    when the earliest task is due, checks all due tasks together (with bounded
+    concurrency), and reschedules each unfinished task with exponential backoff
+    plus jitter. Waiters give a monotonic deadline; when the last waiter of a task
+    times out, the Runway task is cancelled too so it stops consuming quota. When
+    the last waiter is cancelled instead (e.g. its worker is shutting down), the
+    task is only no longer polled: it keeps rendering on Runway, so a restarted
+    job can re-attach to it.
+    """
+
+    def __init__(
+        self,
+        runway: RunwayClient,
+        initial_interval: float = 1.0,
+        max_interval: float = 15.0,
+        multiplier: float = 1.5,
+        jitter: float = 0.2,
+        max_concurrent_checks: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        """
+        Initialize the poller.
+
+        Args:
+            runway: Runway client used for status checks
+            initial_interval: Delay before a new task is first checked
+            max_interval: Upper bound on the delay between checks of one task
+            multiplier: Backoff factor applied after every unfinished check
+            jitter: Relative random spread applied to each delay (0.2 = +/-20%)
+            max_concurrent_checks: Maximum status requests in flight at once
+            clock: Monotonic time source (deadlines use the same clock)
+            rng: Uniform [0, 1) random source for jitter
+        """
+        self.runway = runway
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.clock = clock
+        self._rng = rng
+        self._check_limit = asyncio.Semaphore(max_concurrent_checks)
+        self._watches: dict[str, _Watch] = {}
+        self._wakeup = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+        self.checks = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of tasks currently being polled."""
+        return len(self._watches)
+
+    async def wait(self, task_id: str, deadline: float, step: str = "task") -> RunwayTask:
+        """
+        Wait until a task reaches a terminal status.
+
+        The time a task spends queued and then rendering is recorded per ``step``
+        (at the resolution of the polling interval).
+
+        Args:
+            task_id: Runway task ID
+            deadline: Monotonic time (per ``clock``) by which the task must finish
+            step: Pipeline step of the task (``image`` or ``video``), a metrics label
+
+        Returns:
+            Final task snapshot (SUCCEEDED, FAILED or CANCELLED)
+
+        Raises:
+            TaskTimeoutError: If the deadline passes first
+            RunwayAPIError: If the task cannot be polled (e.g. it does not exist)
+            ProviderUnavailableError: If Runway is down (its circuit is open)
+        """
+        watch = self._watches.get(task_id)
+        if watch is None:
+            now = self.clock()
+            watch = _Watch(
+                task_id,
+                interval=self.initial_interval,
+                next_check=now + self._jittered(self.initial_interval),
+                step=step,
+                started_at=now,
+            )
+            self._watches[task_id] = watch
+            self._wakeup.set()
+        watch.waiters += 1
+        self._ensure_loop()
+
+        finished = False
+        timed_out = False
+        try:
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                timed_out = True
+                raise TaskTimeoutError(f"Task {task_id} timed out")
+            task = await asyncio.wait_for(asyncio.shield(watch.result), remaining)
+            finished = True
+            return task
+        except asyncio.TimeoutError as e:
+            timed_out = True
+            raise TaskTimeoutError(f"Task {task_id} timed out") from e
+        finally:
+            watch.waiters -= 1
+            if not finished and watch.waiters == 0 and not watch.result.done():
+                self._abandon(watch, cancel_remote=timed_out)
+
+    def _abandon(self, watch: _Watch, cancel_remote: bool) -> None:
+        """Stop polling a task nobody waits for, cancelling it on Runway if asked."""
+        self._forget(watch)
+        watch.result.cancel()
+        if cancel_remote:
+            asyncio.ensure_future(self._cancel_remote(watch.task_id))
+
+    async def _cancel_remote(self, task_id: str) -> None:
+        try:
+            await self.runway.cancel_task(task_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to cancel Runway task %s: %s", task_id, e, extra={"task_id": task_id}
+            )
+
+    def _jittered(self, interval: float) -> float:
+        return max(0.0, interval * (1 + self.jitter * (2 * self._rng() - 1)))
+
+    def _ensure_loop(self) -> None:
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Poll due tasks until none are left."""
+        while self._watches:
+            now = self.clock()
+            due = [watch for watch in self._watches.values() if watch.next_check <= now]
+            if not due:
+                next_check = min(watch.next_check for watch in self._watches.values())
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), next_check - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            results = await asyncio.gather(
+                *(self._check(watch) for watch in due), return_exceptions=True
+            )
+            for watch, result in zip(due, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        "Checking Runway task %s failed",
+                        watch.task_id,
+                        exc_info=result,
+                        extra={"task_id": watch.task_id},
+                    )
+
+    def _forget(self, watch: _Watch) -> None:
+        """Stop polling a watch, unless a new wait has already replaced it."""
+        if self._watches.get(watch.task_id) is watch:
+            del self._watches[watch.task_id]
+
+    async def _check(self, watch: _Watch) -> None:
+        """Check one task and resolve it or schedule its next check."""
+        async with self._check_limit:
+            if watch.result.done():
+                return
+            self.checks += 1
+            try:
+                task = await self.runway.get_task(watch.task_id)
+            except (RunwayAPIError, ProviderUnavailableError) as e:
+                # The client already retried transient errors; what is left is a
+                # rejected poll or Runway being down, and neither is worth waiting out.
+                # Its waiters may have given up while the check was running.
+                self._forget(watch)
+                if not watch.result.done():
+                    watch.result.set_exception(e)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Polling Runway task %s failed: %s",
+                    watch.task_id,
+                    e,
+                    extra={"task_id": watch.task_id},
+                )
+                task = None
+
+        if watch.result.done():
+            return
+        if task is not None and task.status == "RUNNING" and watch.running_at is None:
+            watch.running_at = self.clock()
+        if task is not None and task.status in TERMINAL_STATUSES:
+            self._forget(watch)
+            self._record(watch, task)
+            watch.result.set_result(task)
+            return
+
+        watch.interval = min(watch.interval * self.multiplier, self.max_interval)
+        watch.next_check = self.clock() + self._jittered(watch.interval)
+
+    def _record(self, watch: _Watch, task: RunwayTask) -> None:
+        """Observe how long a finished task was queued and rendering."""
+        finished_at = self.clock()
+        # A task no check found RUNNING (it started and finished between two checks)
+        # counts as queued throughout
+        running_at = watch.running_at if watch.running_at is not None else finished_at
+        RUNWAY_TASK_SECONDS.labels(step=watch.step, phase="queued").observe(
+            running_at - watch.started_at
+        )
+        if watch.running_at is not None:
+            RUNWAY_TASK_SECONDS.labels(step=watch.step, phase="render").observe(
+                finished_at - watch.running_at
+            )
+        RUNWAY_TASKS.labels(step=watch.step, status=task.status).inc()
+
+    async def aclose(self) -> None:
+        """Stop the polling loop and fail any remaining waiters."""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+        for watch in self._watches.values():
+            watch.result.cancel()
+        self._watches.clear()
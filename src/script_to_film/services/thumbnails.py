@@ -0,0 +1,249 @@
+"""Thumbnail and preview-strip extraction from rendered clips."""
+
+import asyncio
+import logging
+import os
+import subprocess
+import uuid
+from pathlib import Path
+from typing import Callable
+
+from script_to_film.models.video import Video, VideoStatus
+from script_to_film.services.compositor import CompositionError, Compositor
+
+logger = logging.getLogger(__name__)
+
+# Input seek to the keyframe at or before the timestamp and emit it as-is, instead of
+# decoding forward to the exact frame (or from the start of the clip)
+_KEYFRAME_SEEK = ["-noaccurate_seek"]
+
+
+def thumbnail_path(clip: Path) -> Path:
+    """Cached thumbnail location for a clip (next to it)."""
+    return clip.with_name(f"{clip.stem}.thumb.jpg")
+
+
+def strip_path(clip: Path) -> Path:
+    """Cached preview-strip location for a clip (next to it)."""
+    return clip.with_name(f"{clip.stem}.strip.jpg")
+
+
+def thumbnail_command(
+    clip: Path, output: Path, timestamp: float, width: int, ffmpeg: str = "ffmpeg"
+) -> list[str]:
+    """Build the ffmpeg command grabbing the keyframe nearest ``timestamp``."""
+    return [
+        ffmpeg, "-y", "-v", "error",
+        "-ss", f"{timestamp:.3f}", *_KEYFRAME_SEEK, "-i", str(clip),
+        "-frames:v", "1", "-vf", f"scale={width}:-2", "-q:v", "3",
+        str(output),
+    ]  # fmt: skip
+
+
+def strip_command(
+    clip: Path, output: Path, timestamps: list[float], tile_width: int, ffmpeg: str = "ffmpeg"
+) -> list[str]:
+    """
+    Build the ffmpeg command tiling one keyframe per timestamp into a horizontal strip.
+
+    Each timestamp is its own keyframe-seeked input, so the whole strip is a single
+    ffmpeg run that never decodes the clip end to end.
+    """
+    command = [ffmpeg, "-y", "-v", "error"]
+    for timestamp in timestamps:
+        command += ["-ss", f"{timestamp:.3f}", *_KEYFRAME_SEEK, "-i", str(clip)]
+
+    frames = [
+        f"[{i}:v]trim=end_frame=1,setpts=PTS-STARTPTS,scale={tile_width}:-2,setsar=1[f{i}]"
+        for i in range(len(timestamps))
+    ]
+    inputs = "".join(f"[f{i}]" for i in range(len(timestamps)))
+    frames.append(f"{inputs}concat=n={len(timestamps)}:v=1:a=0,tile={len(timestamps)}x1[strip]")
+    return command + [
+        "-filter_complex", ";".join(frames), "-map", "[strip]",
+        "-frames:v", "1", "-q:v", "4",
+        str(output),
+    ]  # fmt: skip
+
+
+def extract_previews(
+    clip: str,
+    duration: float,
+    width: int,
+    strip_frames: int,
+    strip_tile_width: int,
+    ffmpeg: str = "ffmpeg",
+) -> tuple[str, str]:
+    """
+    Create (or reuse) a clip's thumbnail and preview strip.
+
+    Runs synchronously (meant for a worker pool). Results are cached next to the
+    clip and reused while they are newer than the clip.
+
+    Args:
+        clip: Clip file
+        duration: Clip duration in seconds
+        width: Thumbnail width
+        strip_frames: Number of frames in the preview strip
+        strip_tile_width: Width of each strip frame
+        ffmpeg: ffmpeg executable
+
+    Returns:
+        Paths of the thumbnail and the preview strip
+    """
+    clip_path = Path(clip)
+    thumb, strip = thumbnail_path(clip_path), strip_path(clip_path)
+    # Sample frame centres so no tile lands on the very last (possibly missing) frame
+    step = duration / strip_frames if duration > 0 else 0
+    timestamps = [step * (i + 0.5) for i in range(strip_frames)]
+
+    _render_cached(
+        clip_path, thumb, lambda out: thumbnail_command(clip_path, out, duration / 2, width, ffmpeg)
+    )
+    _render_cached(
+        clip_path,
+        strip,
+        lambda out: strip_command(clip_path, out, timestamps, strip_tile_width, ffmpeg),
+    )
+    return str(thumb), str(strip)
+
+
+def extract_thumbnail(clip: str, output: str, timestamp: float, width: int, ffmpeg: str) -> str:
+    """Grab the keyframe nearest ``timestamp`` of ``clip`` into ``output`` (synchronous)."""
+    output_path = Path(output)
+    temp = _temp_for(output_path)
+    _render(thumbnail_command(Path(clip), temp, timestamp, width, ffmpeg), temp, output_path)
+    return output
+
+
+def _render_cached(clip: Path, output: Path, command_for: Callable[[Path], list[str]]) -> None:
+    """Render ``output`` unless a copy newer than ``clip`` already exists."""
+    try:
+        if output.stat().st_mtime >= clip.stat().st_mtime:
+            return
+    except FileNotFoundError:
+        pass
+    temp = _temp_for(output)
+    _render(command_for(temp), temp, output)
+
+
+def _temp_for(output: Path) -> Path:
+    return output.with_name(f".{output.stem}.{uuid.uuid4().hex}{output.suffix}")
+
+
+def _render(command: list[str], temp: Path, output: Path) -> None:
+    """Run an ffmpeg command that writes ``temp``, then move the result to ``output``."""
+    try:
+        subprocess.run(command, check=True, capture_output=True, text=True)
+    except FileNotFoundError as e:
+        raise CompositionError(
+            f"Could not render {output.name}: {command[0]} is not installed"
+        ) from e
+    except subprocess.CalledProcessError as e:
+        temp.unlink(missing_ok=True)
+        raise CompositionError(f"Could not render {output.name}: {e.stderr.strip()}") from e
+
+    if not temp.exists():
+        raise CompositionError(f"Could not render {output.name}: no frame at that position")
+    os.replace(temp, output)
+
+
+class Thumbnailer:
+    """Creates thumbnails and preview strips in the compositor's worker pool."""
+
+    def __init__(
+        self,
+        compositor: Compositor,
+        width: int = 480,
+        strip_frames: int = 4,
+        strip_tile_width: int = 240,
+    ) -> None:
+        """
+        Initialize the thumbnailer.
+
+        Args:
+            compositor: Supplies the worker pool and ffmpeg executable
+            width: Thumbnail width in pixels
+            strip_frames: Frames per preview strip
+            strip_tile_width: Width of each preview-strip frame in pixels
+        """
+        self.compositor = compositor
+        self.width = width
+        self.strip_frames = strip_frames
+        self.strip_tile_width = strip_tile_width
+
+    async def thumbnail(self, clip: str, output: str, timestamp: float = 0.0) -> str:
+        """
+        Extract a single thumbnail.
+
+        Args:
+            clip: Clip file
+            output: Image file to write
+            timestamp: Position in seconds (the nearest keyframe is used)
+
+        Returns:
+            Path of the thumbnail
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.compositor.executor,
+            extract_thumbnail,
+            clip,
+            output,
+            timestamp,
+            self.width,
+            self.compositor.ffmpeg,
+        )
+
+    async def previews_for_video(self, video: Video) -> Video:
+        """
+        Create previews for every completed scene of a video in one batch.
+
+        Sets each scene's ``thumbnail_path`` and ``preview_path`` and uses the first
+        scene's thumbnail as ``Video.thumbnail_path``. Scenes whose previews fail
+        are left without them.
+
+        Args:
+            video: Video with rendered scenes
+
+        Returns:
+            The same video, updated
+        """
+        scenes = [
+            scene
+            for scene in video.scenes
+            if scene.status == VideoStatus.COMPLETED and scene.visual_path
+        ]
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self.compositor.executor,
+                    extract_previews,
+                    scene.visual_path,
+                    scene.duration,
+                    self.width,
+                    self.strip_frames,
+                    self.strip_tile_width,
+                    self.compositor.ffmpeg,
+                )
+                for scene in scenes
+            ),
+            return_exceptions=True,
+        )
+
+        for scene, result in zip(scenes, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Could not create previews for scene %d: %s",
+                    scene.scene_number,
+                    result,
+                    extra={"scene_number": scene.scene_number},
+                )
+                continue
+            scene.thumbnail_path, scene.preview_path = result
+
+        thumbnails = [scene.thumbnail_path for scene in video.scenes if scene.thumbnail_path]
+        if thumbnails:
+            video.thumbnail_path = thumbnails[0]
+        return video
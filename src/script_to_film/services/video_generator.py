@@ -1,223 +1,795 @@
 """Video generation and composition service."""
 
 import asyncio
+import logging
 import os
+import time
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
-import time
 
 from script_to_film.models.script import Script, ScriptScene
 from script_to_film.models.video import Video, VideoScene, VideoStatus
 from script_to_film.config.settings import settings
+from script_to_film.services.artifacts import ArtifactStore, SceneCheckpoint
+from script_to_film.services.compositor import CompositionError, Compositor
+from script_to_film.services.progressive import ProgressiveAssembler
+from script_to_film.services.thumbnails import Thumbnailer, thumbnail_path
+from script_to_film.services.render_cache import RenderCache
+from script_to_film.services.runway_client import RunwayAPIError, RunwayClient, RunwayTask
+from script_to_film.services.scene_scheduler import ProgressCallback, SceneProgress, SceneScheduler
+from script_to_film.services.speech import SpeechSynthesizer, build_speech_synthesizer
+from script_to_film.services.task_poller import TaskPoller, TaskTimeoutError
+from script_to_film.utils.files import place_file
+from script_to_film.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Keyframe:
+    """Outcome of the text-to-image stage for one scene."""
+
+    image_url: Optional[str] = None  # None: the clip is cached, or render the image inline
+    elapsed: float = 0.0  # Runway time spent, counted against the scene deadline
+    failed: bool = False
+    error: Optional[str] = None  # why the stage failed, when it raised
 
 
 class VideoGenerator:
     """Service for generating videos from scripts using Runway Gen-3."""
 
-    def __init__(self, output_dir: str = "data/output") -> None:
+    image_model = "gen4_image"  # Use Gen-4 for image generation
+    image_ratio = "1920:1080"  # 16:9 aspect ratio in pixel dimensions
+    video_model = "gen3a_turbo"
+    video_ratio = "16:9"
+
+    def __init__(
+        self,
+        output_dir: str = "data/output",
+        scene_scheduler: Optional[SceneScheduler] = None,
+        runway_client: Optional[RunwayClient] = None,
+        render_cache: Optional[RenderCache] = None,
+        task_poller: Optional[TaskPoller] = None,
+        compositor: Optional[Compositor] = None,
+        speech: Optional[SpeechSynthesizer] = None,
+    ) -> None:
         """
         Initialize the video generator.
 
         Args:
             output_dir: Directory for output files
+            scene_scheduler: Scheduler bounding concurrent scene renders (shared per process)
+            runway_client: Async Runway client (shared per process)
+            render_cache: Store of rendered clips (defaults to ``<output_dir>/cache``)
+            task_poller: Poller tracking every Runway task of the process
+            compositor: Joins finished scenes into the film (None disables compositing
+                unless enabled in settings)
+            speech: Synthesizes dialogue tracks (None disables dialogue audio unless
+                enabled in settings)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.runwayml_api_secret = settings.runwayml_api_secret
+        self.runway = runway_client or RunwayClient(api_secret=settings.runwayml_api_secret)
+        self.task_poller = task_poller or TaskPoller(
+            self.runway,
+            initial_interval=settings.runway_poll_initial_interval,
+            max_interval=settings.runway_poll_max_interval,
+            multiplier=settings.runway_poll_multiplier,
+            jitter=settings.runway_poll_jitter,
+            max_concurrent_checks=settings.runway_poll_max_concurrent_checks,
+        )
+        self.scene_deadline = settings.runway_scene_deadline
+        self.scene_scheduler = scene_scheduler or SceneScheduler(
+            max_in_flight=settings.max_concurrent_scenes,
+            max_in_flight_per_job=settings.max_concurrent_scenes_per_job,
+            max_preparing=settings.max_concurrent_keyframes,
+        )
+        if render_cache is None and settings.render_cache_enabled:
+            render_cache = RenderCache(
+                self.output_dir / "cache",
+                max_bytes=settings.render_cache_max_bytes,
+                image_ttl_seconds=settings.render_cache_image_ttl_seconds,
+            )
+        self.render_cache = render_cache
+        self.artifacts = ArtifactStore(self.output_dir)
+        if compositor is None and settings.composite_enabled:
+            compositor = Compositor(
+                max_workers=settings.composite_max_workers,
+                ffmpeg=settings.ffmpeg_path,
+                ffprobe=settings.ffprobe_path,
+            )
+        self.compositor = compositor
+        self.thumbnailer = (
+            Thumbnailer(
+                compositor,
+                width=settings.thumbnail_width,
+                strip_frames=settings.preview_strip_frames,
+                strip_tile_width=settings.preview_strip_tile_width,
+            )
+            if compositor is not None and settings.thumbnails_enabled
+            else None
+        )
+        if speech is None and settings.speech_enabled:
+            speech = build_speech_synthesizer(self.output_dir / "cache" / "speech")
+        self.speech = speech
+        self._active_jobs: set[str] = set()
+        self._renders: SingleFlight[Optional[Path]] = SingleFlight()
+        self._keyframes: SingleFlight[Optional[str]] = SingleFlight()
+
+    @staticmethod
+    def clip_duration(scene: ScriptScene) -> int:
+        """Length of a scene's clip in seconds (max 10 seconds for Gen-3)."""
+        return min(int(scene.duration_seconds or 10), 10)
+
+    def _clip_key(self, scene: ScriptScene) -> str:
+        """Content address of a scene's clip."""
+        return RenderCache.key(
+            prompt=scene.video_prompt,
+            image_model=self.image_model,
+            image_ratio=self.image_ratio,
+            video_model=self.video_model,
+            video_ratio=self.video_ratio,
+            duration=self.clip_duration(scene),
+        )
 
-    async def generate_scene_video_runway(
-        self, scene: ScriptScene, scene_number: int
-    ) -> Optional[VideoScene]:
+    async def request_keyframe(
+        self,
+        scene: ScriptScene,
+        scene_number: int,
+        checkpoint: Optional[SceneCheckpoint] = None,
+    ) -> Keyframe:
         """
-        Generate video for a single scene using Runway Gen-3 API.
-        Uses a two-step process: text-to-image, then image-to-video.
+        Run the text-to-image stage for a scene.
+
+        Skipped when the scene's clip is already cached or being rendered, or when
+        the checkpoint shows a previous run got past this stage. Identical image
+        prompts in flight share one Runway task.
 
         Args:
-            scene: Scene to generate video for
+            scene: Scene to generate the keyframe for
             scene_number: Scene number
+            checkpoint: Durable progress of the scene in its render job
 
         Returns:
-            VideoScene with generated video path or None if failed
+            Keyframe to hand to ``generate_scene_video_runway``
         """
         try:
-            from runwayml import RunwayML
+            clip_key = self._clip_key(scene)
+            if clip_key in self._renders or (
+                self.render_cache is not None and self.render_cache.clip_path(clip_key).exists()
+            ):
+                return Keyframe()
+            if checkpoint is not None and (
+                checkpoint.finished_clip() is not None or checkpoint.get("video_task_id")
+            ):
+                return Keyframe()
+
+            started = self.task_poller.clock()
+            image_url = await self._keyframe_url(
+                scene, scene_number, started + self.scene_deadline, checkpoint
+            )
+            return Keyframe(
+                image_url=image_url,
+                elapsed=self.task_poller.clock() - started,
+                failed=image_url is None,
+                error="Keyframe task failed or timed out" if image_url is None else None,
+            )
+        except Exception as e:
+            logger.error(
+                "Error generating keyframe for scene %d: %s",
+                scene_number,
+                e,
+                extra={"scene_number": scene_number},
+            )
+            return Keyframe(failed=True, error=str(e))
+
+    async def _keyframe_url(
+        self,
+        scene: ScriptScene,
+        scene_number: int,
+        deadline: float,
+        checkpoint: Optional[SceneCheckpoint] = None,
+    ) -> Optional[str]:
+        """Cached, checkpointed or freshly rendered keyframe image URL (None on failure)."""
+        image_prompt = scene.video_prompt[:2048]  # Gen-4 supports longer prompts
+        image_key = RenderCache.key(
+            prompt=image_prompt, image_model=self.image_model, image_ratio=self.image_ratio
+        )
+        image_url = self.render_cache.get_image(image_key) if self.render_cache else None
+        if image_url:
+            logger.info(
+                "Step 1: Reusing cached image: %s", image_url, extra={"scene_number": scene_number}
+            )
+            return image_url
+
+        if checkpoint is not None and checkpoint.get("image_url"):
+            # Runway output URLs expire, so only recent ones are worth resuming from
+            age = time.time() - checkpoint.get("image_at")
+            if age < settings.render_cache_image_ttl_seconds:
+                logger.info(
+                    "Step 1: Resuming from checkpointed image: %s",
+                    checkpoint.get("image_url"),
+                    extra={"scene_number": scene_number},
+                )
+                return checkpoint.get("image_url")
+
+        image_url = await self._keyframes.do(
+            image_key,
+            lambda: self._render_image(image_prompt, image_key, scene_number, deadline, checkpoint),
+        )
+        if image_url is not None and checkpoint is not None:
+            checkpoint.update(image_url=image_url, image_at=time.time())
+        return image_url
+
+    async def _resume_task(
+        self, checkpoint: Optional[SceneCheckpoint], field: str, deadline: float
+    ) -> Optional[RunwayTask]:
+        """
+        Re-attach to the Runway task a previous run of the job recorded under ``field``.
 
-            # Initialize Runway client with API key
-            client = RunwayML(api_key=self.runwayml_api_secret)
+        Returns:
+            The task's final snapshot, or None if there is nothing to resume (no
+            task recorded, Runway no longer knows it, or it was cancelled)
+        """
+        task_id = checkpoint.get(field) if checkpoint is not None else None
+        if not task_id:
+            return None
+
+        logger.info(
+            "Scene %d: re-attaching to Runway task %s",
+            checkpoint.scene_number,
+            task_id,
+            extra={"scene_number": checkpoint.scene_number, "task_id": task_id},
+        )
+        try:
+            task = await self.task_poller.wait(task_id, deadline, step=field.split("_")[0])
+        except RunwayAPIError as e:
+            logger.warning(
+                "Cannot resume Runway task %s: %s", task_id, e, extra={"task_id": task_id}
+            )
+            return None
+        return task if task.status != "CANCELLED" else None
+
+    async def _render_image(
+        self,
+        image_prompt: str,
+        image_key: str,
+        scene_number: int,
+        deadline: float,
+        checkpoint: Optional[SceneCheckpoint] = None,
+    ) -> Optional[str]:
+        """
+        Generate a keyframe image with Runway text-to-image.
 
-            # Determine duration based on scene (max 10 seconds for Gen-3)
-            duration = min(int(scene.duration_seconds or 10), 10)
+        The task ID is checkpointed as soon as the task exists, and a task recorded
+        by a previous run is waited for instead of starting another.
 
-            print(f"Generating video for Scene {scene_number} with Runway Gen-3...")
-            print(f"Prompt: {scene.video_prompt[:100]}...")
+        Returns:
+            Image URL, or None if the task failed or timed out
+        """
+        try:
+            image_task = await self._resume_task(checkpoint, "image_task_id", deadline)
+            if image_task is None:
+                # STEP 1: Generate an image from the text prompt
+                logger.info(
+                    "Step 1: Generating image for scene %d from prompt",
+                    scene_number,
+                    extra={"scene_number": scene_number},
+                )
+                image_task_id = await self.runway.create_text_to_image(
+                    prompt_text=image_prompt,
+                    model=self.image_model,
+                    ratio=self.image_ratio,
+                )
 
-            # STEP 1: Generate an image from the text prompt
-            print(f"Step 1: Generating image from prompt...")
-            image_task = client.text_to_image.create(
-                model='gen4_image',  # Use Gen-4 for image generation
-                prompt_text=scene.video_prompt[:2048],  # Gen-4 supports longer prompts
-                ratio="1920:1080",  # 16:9 aspect ratio in pixel dimensions
+                # Wait for image generation to complete
+                logger.info(
+                    "Image task created: %s",
+                    image_task_id,
+                    extra={"scene_number": scene_number, "task_id": image_task_id},
+                )
+                if checkpoint is not None:
+                    checkpoint.update(image_task_id=image_task_id)
+                image_task = await self.task_poller.wait(image_task_id, deadline, step="image")
+        except TaskTimeoutError:
+            logger.warning(
+                "Image generation timed out for scene %d",
+                scene_number,
+                extra={"scene_number": scene_number},
             )
+            return None
+        task_fields = {"scene_number": scene_number, "task_id": image_task.id}
+        logger.debug("Image task status: %s", image_task.status, extra=task_fields)
 
-            # Wait for image generation to complete
-            image_task_id = image_task.id
-            print(f"Image task created: {image_task_id}")
+        if image_task.status != 'SUCCEEDED':
+            logger.warning("Image generation failed: %s", image_task.failure, extra=task_fields)
+            return None
 
-            max_wait = 120  # 2 minutes for image generation
-            start_time = time.time()
+        # Get the generated image URL
+        image_url = image_task.output[0] if image_task.output else None
+        if not image_url:
+            logger.warning("No image URL in output", extra=task_fields)
+            return None
 
-            while time.time() - start_time < max_wait:
-                await asyncio.sleep(5)  # Check every 5 seconds for image
-                image_task = client.tasks.retrieve(image_task_id)
-                print(f"Image task status: {image_task.status}")
+        logger.info("Image generated: %s", image_url, extra=task_fields)
+        if self.render_cache is not None:
+            self.render_cache.put_image(image_key, image_url)
+        return image_url
 
-                if image_task.status == 'SUCCEEDED':
-                    break
-                elif image_task.status == 'FAILED':
-                    print(f"Image generation failed: {image_task.failure}")
-                    return VideoScene(
-                        scene_number=scene_number,
-                        duration=duration,
-                        status=VideoStatus.FAILED
-                    )
+    async def generate_scene_video_runway(
+        self,
+        scene: ScriptScene,
+        scene_number: int,
+        destination: Optional[Path] = None,
+        keyframe: Optional[Keyframe] = None,
+        checkpoint: Optional[SceneCheckpoint] = None,
+    ) -> Optional[VideoScene]:
+        """
+        Generate video for a single scene using Runway Gen-3 API.
+        Uses a two-step process: text-to-image, then image-to-video.
 
-            if image_task.status != 'SUCCEEDED':
-                print(f"Image generation timed out")
+        Renders are content-addressed: a clip already rendered for the same prompt,
+        models, duration and ratio is reused from the render cache, and concurrent
+        identical requests share a single in-flight render. With a checkpoint, a
+        scene a previous run of the job finished is returned as is, and Runway
+        tasks it started are re-attached to rather than paid for again.
+
+        Args:
+            scene: Scene to generate video for
+            scene_number: Scene number
+            destination: Where to write the clip (defaults to a content-addressed
+                path under ``<output_dir>/scenes``)
+            keyframe: Result of ``request_keyframe`` when step 1 already ran as a
+                separate pipeline stage (step 1 runs inline if omitted)
+            checkpoint: Durable progress of the scene in its render job
+
+        Returns:
+            VideoScene with generated video path or None if failed
+        """
+        try:
+            duration = self.clip_duration(scene)
+            finished = checkpoint.finished_clip() if checkpoint is not None else None
+            if finished is not None:
+                logger.info(
+                    "Scene %d: already rendered by a previous run",
+                    scene_number,
+                    extra={"scene_number": scene_number},
+                )
                 return VideoScene(
                     scene_number=scene_number,
+                    visual_path=str(finished),
                     duration=duration,
-                    status=VideoStatus.FAILED
+                    status=VideoStatus.COMPLETED
                 )
 
-            # Get the generated image URL
-            image_url = image_task.output[0] if image_task.output else None
-            if not image_url:
-                print("No image URL in output")
+            if keyframe is not None and keyframe.failed:
                 return VideoScene(
                     scene_number=scene_number,
                     duration=duration,
-                    status=VideoStatus.FAILED
+                    status=VideoStatus.FAILED,
+                    error=keyframe.error
                 )
 
-            print(f"Image generated: {image_url}")
-
-            # STEP 2: Create video from the generated image
-            print(f"Step 2: Generating video from image...")
-            task = client.image_to_video.create(
-                model='gen3a_turbo',
-                prompt_image=image_url,
-                prompt_text=scene.video_prompt[:512],  # Max 512 characters for video prompt
-                duration=duration,
-                ratio="16:9",
-                watermark=False
+            clip_key = self._clip_key(scene)
+            video_path = destination or (
+                self.output_dir / "scenes" / f"scene_{scene_number:03d}_{clip_key[:12]}.mp4"
             )
 
-            task_id = task.id
-            print(f"Video task created: {task_id}")
-
-            # Poll for completion (async)
-            max_wait = 300  # 5 minutes max
-            start_time = time.time()
-
-            while time.time() - start_time < max_wait:
-                await asyncio.sleep(10)  # Wait 10 seconds between checks
-
-                task = client.tasks.retrieve(task_id)
-                print(f"Task status: {task.status}")
-
-                if task.status == 'SUCCEEDED':
-                    # Download the video
-                    video_url = task.output[0] if task.output else None
-
-                    if video_url:
-                        # Save video locally
-                        video_filename = f"scene_{scene_number:03d}.mp4"
-                        video_path = self.output_dir / video_filename
-
-                        # Download video from URL
-                        import httpx
-                        async with httpx.AsyncClient() as http_client:
-                            response = await http_client.get(video_url)
-                            video_path.write_bytes(response.content)
-
-                        print(f"Video saved: {video_path}")
-
-                        return VideoScene(
-                            scene_number=scene_number,
-                            visual_path=str(video_path),
-                            duration=duration,
-                            status=VideoStatus.COMPLETED
-                        )
-
-                elif task.status == 'FAILED':
-                    print(f"Task failed: {task.failure}")
+            if self.render_cache is not None:
+                if self.render_cache.fetch_clip(clip_key, video_path):
+                    logger.info(
+                        "Scene %d: reusing cached render %s",
+                        scene_number,
+                        clip_key[:12],
+                        extra={"scene_number": scene_number},
+                    )
+                    if checkpoint is not None:
+                        checkpoint.update(clip_path=str(video_path))
                     return VideoScene(
                         scene_number=scene_number,
+                        visual_path=str(video_path),
                         duration=duration,
-                        status=VideoStatus.FAILED
+                        status=VideoStatus.COMPLETED
+                    )
+                if clip_key in self._renders:
+                    logger.info(
+                        "Scene %d: joining in-flight render %s",
+                        scene_number,
+                        clip_key[:12],
+                        extra={"scene_number": scene_number},
                     )
 
-            # Timeout
-            print(f"Task timed out after {max_wait} seconds")
+            clip = await self._renders.do(
+                clip_key,
+                lambda: self._render_clip(
+                    scene, scene_number, duration, clip_key, keyframe, checkpoint
+                ),
+            )
+            if clip is None:
+                return VideoScene(
+                    scene_number=scene_number,
+                    duration=duration,
+                    status=VideoStatus.FAILED,
+                    error="Runway task failed or timed out"
+                )
+
+            if self.render_cache is None or not self.render_cache.fetch_clip(clip_key, video_path):
+                place_file(clip, video_path)
+
+            logger.info("Video saved: %s", video_path, extra={"scene_number": scene_number})
+            if checkpoint is not None:
+                checkpoint.update(clip_path=str(video_path))
+
             return VideoScene(
                 scene_number=scene_number,
+                visual_path=str(video_path),
                 duration=duration,
-                status=VideoStatus.FAILED
+                status=VideoStatus.COMPLETED
             )
 
         except Exception as e:
-            print(f"Error generating video for scene {scene_number}: {e}")
+            # Includes ProviderUnavailableError: while Runway's circuit is open every
+            # uncached scene fails here at once instead of waiting out its deadline
+            logger.error(
+                "Error generating video for scene %d: %s",
+                scene_number,
+                e,
+                extra={"scene_number": scene_number},
+            )
             return VideoScene(
                 scene_number=scene_number,
                 duration=int(scene.duration_seconds or 10),
-                status=VideoStatus.FAILED
+                status=VideoStatus.FAILED,
+                error=str(e)
             )
 
+    async def _render_clip(
+        self,
+        scene: ScriptScene,
+        scene_number: int,
+        duration: int,
+        clip_key: str,
+        keyframe: Optional[Keyframe] = None,
+        checkpoint: Optional[SceneCheckpoint] = None,
+    ) -> Optional[Path]:
+        """
+        Render a clip with Runway and download it into the render cache.
+
+        Both Runway steps share one deadline of ``scene_deadline`` seconds; time
+        spent queued between the two pipeline stages does not count against it.
+        A video task recorded in the checkpoint by a previous run is resumed.
+
+        Returns:
+            Path of the downloaded clip, or None if either Runway step failed or timed out
+        """
+        elapsed = keyframe.elapsed if keyframe is not None else 0.0
+        deadline = self.task_poller.clock() + self.scene_deadline - elapsed
+        logger.info(
+            "Generating video for scene %d with Runway Gen-3",
+            scene_number,
+            extra={"scene_number": scene_number, "prompt": scene.video_prompt[:100]},
+        )
+
+        # Wait for completion on the shared poller, within what is left of the deadline
+        try:
+            task = await self._resume_task(checkpoint, "video_task_id", deadline)
+            if task is None:
+                image_url = keyframe.image_url if keyframe is not None else None
+                if not image_url:
+                    image_url = await self._keyframe_url(
+                        scene, scene_number, deadline, checkpoint
+                    )
+                    if image_url is None:
+                        return None
+
+                # STEP 2: Create video from the generated image
+                logger.info(
+                    "Step 2: Generating video from image", extra={"scene_number": scene_number}
+                )
+                task_id = await self.runway.create_image_to_video(
+                    prompt_image=image_url,
+                    prompt_text=scene.video_prompt[:512],  # Max 512 characters for video prompt
+                    duration=duration,
+                    model=self.video_model,
+                    ratio=self.video_ratio,
+                    watermark=False,
+                )
+
+                logger.info(
+                    "Video task created: %s",
+                    task_id,
+                    extra={"scene_number": scene_number, "task_id": task_id},
+                )
+                if checkpoint is not None:
+                    checkpoint.update(video_task_id=task_id)
+                task = await self.task_poller.wait(task_id, deadline, step="video")
+        except TaskTimeoutError:
+            logger.warning(
+                "Task timed out after %s seconds",
+                self.scene_deadline,
+                extra={"scene_number": scene_number},
+            )
+            return None
+        task_fields = {"scene_number": scene_number, "task_id": task.id}
+        logger.debug("Task status: %s", task.status, extra=task_fields)
+
+        if task.status != 'SUCCEEDED':
+            logger.warning("Task failed: %s", task.failure, extra=task_fields)
+            return None
+
+        video_url = task.output[0] if task.output else None
+        if not video_url:
+            logger.warning("No video URL in output", extra=task_fields)
+            return None
+
+        # Stream the clip to disk over the shared connection pool
+        if self.render_cache is not None:
+            clip_path = self.render_cache.clip_path(clip_key)
+        else:
+            clip_path = self.downloads_dir / f"{clip_key}.mp4"
+        download = await self.runway.download_output(video_url, clip_path)
+        logger.info(
+            "Downloaded %d bytes (sha256 %s)",
+            download.size,
+            download.sha256[:12],
+            extra=task_fields,
+        )
+        if self.render_cache is not None:
+            self.render_cache.evict(keep=clip_path)
+        return clip_path
+
     async def generate_from_script(
-        self, script: Script, resolution: str = "1920x1080", fps: int = 30, style: str = "realistic"
+        self,
+        script: Script,
+        resolution: str = "1920x1080",
+        fps: int = 30,
+        style: str = "realistic",
+        on_progress: Optional[ProgressCallback] = None,
+        max_concurrent_scenes: Optional[int] = None,
+        job_id: Optional[str] = None,
+        video_id: Optional[str] = None,
     ) -> Video:
         """
         Generate a video from a script using Runway Gen-3.
 
+        Scenes are rendered concurrently through the shared scene scheduler as a
+        two-stage pipeline: keyframe images for all scenes are requested at once
+        (bounded by ``max_concurrent_keyframes``), and each scene enters the
+        image-to-video stage (bounded by the scene limits) as soon as its keyframe
+        is ready. The resulting ``Video.scenes`` keep the script's scene order. Clips are written
+        to the job's own directory (``<output_dir>/jobs/<job_id>``), whose manifest
+        tracks every scene, so concurrent films never share files. While scenes
+        render, an HLS playlist (``Video.playlist_path``) grows with every scene
+        whose predecessors are done, so the opening is playable early. Dialogue is
+        synthesized alongside the renders into one WAV track per scene
+        (``VideoScene.audio_path``). Each scene's Runway task IDs, keyframe URL and
+        clip are checkpointed in the manifest as they progress, so running the same
+        job again (e.g. after its worker died) re-attaches to in-flight tasks and
+        skips finished scenes.
+
         Args:
             script: Script to convert to video
             resolution: Video resolution
             fps: Frames per second
             style: Visual style
+            on_progress: Optional callback invoked with a SceneProgress as each scene finishes
+            max_concurrent_scenes: Per-job concurrency limit overriding the configured default
+            job_id: Render job ID naming the output directory (generated if omitted);
+                an existing job's checkpoints are resumed
+            video_id: ID of the video being rendered, recorded in the manifest
 
         Returns:
             Video object with generation status
         """
         video = Video(
+            id=video_id,
             script_id=script.id or "unknown",
+            job_id=job_id or f"job_{uuid.uuid4().hex[:12]}",
             title=script.title,
             resolution=resolution,
             fps=fps,
             status=VideoStatus.PROCESSING,
         )
+        job = self.artifacts.job(video.job_id)
+        job.update(video_id=video_id, script_id=video.script_id, status=video.status.value)
+        self._active_jobs.add(job.job_id)
+
+        assembler = None
+        playlist_path = self.playlist_path(job.job_id)
+        if playlist_path is not None and script.scenes:
+            assembler = ProgressiveAssembler(
+                playlist_path.parent,
+                scene_count=len(script.scenes),
+                compositor=self.compositor,
+                segment_seconds=settings.hls_segment_seconds,
+            )
+            video.playlist_path = str(playlist_path)
+            job.update(playlist_path=video.playlist_path)
+
+        dialogue_audio = None
+        speaking = [index for index, scene in enumerate(script.scenes) if scene.dialogue]
+        if self.speech is not None and speaking:
+            # Dialogue does not depend on the visuals, so it is synthesized while scenes render
+            dialogue_audio = asyncio.create_task(
+                self.speech.synthesize_scenes(
+                    [
+                        (
+                            script.scenes[index].dialogue,
+                            self.clip_duration(script.scenes[index]),
+                            job.scene_path(index, ".wav"),
+                        )
+                        for index in speaking
+                    ]
+                )
+            )
+
+        async def prepare(
+            index: int, scene: ScriptScene
+        ) -> tuple[ScriptScene, Keyframe, SceneCheckpoint]:
+            # Progress of a previous run of this job (if its worker died) is picked up here
+            checkpoint = job.checkpoint(index, self._clip_key(scene))
+            keyframe = await self.request_keyframe(scene, index, checkpoint=checkpoint)
+            return scene, keyframe, checkpoint
+
+        async def render(
+            index: int, prepared: tuple[ScriptScene, Keyframe, SceneCheckpoint]
+        ) -> Optional[VideoScene]:
+            scene, keyframe, checkpoint = prepared
+            logger.info(
+                "Generating scene %d/%d",
+                index + 1,
+                len(script.scenes),
+                extra={"job_id": job.job_id, "scene_number": index},
+            )
+            return await self.generate_scene_video_runway(
+                scene,
+                index,
+                destination=job.scene_path(index),
+                keyframe=keyframe,
+                checkpoint=checkpoint,
+            )
+
+        async def report(progress: SceneProgress) -> None:
+            if progress.result is not None:
+                job.record_scene(progress.result)
+            status = progress.result.status.value if progress.result else "failed"
+            logger.info(
+                "Scene %d finished (%s), %d/%d complete",
+                progress.index,
+                status,
+                progress.completed,
+                progress.total,
+                extra={"job_id": job.job_id, "scene_number": progress.index, "status": status},
+            )
+            if on_progress is not None:
+                outcome = on_progress(progress)
+                if outcome is not None:
+                    await outcome
+            if assembler is not None and status == VideoStatus.COMPLETED.value:
+                # Extend the preview as soon as this scene and all before it are done
+                await assembler.add(progress.index, progress.result.visual_path)
 
         try:
-            # Generate videos for each scene using Runway Gen-3
-            video_scenes = []
-            for i, scene in enumerate(script.scenes):
-                print(f"\nGenerating scene {i+1}/{len(script.scenes)}...")
-                video_scene = await self.generate_scene_video_runway(scene, i)
+            # Two-stage pipeline: every scene's keyframe is requested up front, and each
+            # image-to-video render starts as soon as its own keyframe lands
+            results = await self.scene_scheduler.run(
+                script.scenes,
+                render,
+                on_progress=report,
+                max_in_flight=max_concurrent_scenes,
+                prepare=prepare,
+            )
 
+            video_scenes = []
+            for i, video_scene in enumerate(results):
                 if video_scene:
                     video_scenes.append(video_scene)
                 else:
-                    print(f"Failed to generate scene {i}")
+                    logger.warning(
+                        "Failed to generate scene %d",
+                        i,
+                        extra={"job_id": job.job_id, "scene_number": i},
+                    )
 
             video.scenes = video_scenes
-            video.status = VideoStatus.COMPLETED if len(video_scenes) == len(script.scenes) else VideoStatus.FAILED
+            all_completed = len(video_scenes) == len(script.scenes) and all(
+                scene.status == VideoStatus.COMPLETED for scene in video_scenes
+            )
+            video.status = VideoStatus.COMPLETED if all_completed else VideoStatus.FAILED
             video.duration = sum(scene.duration for scene in video_scenes)
 
-            return video
+            if dialogue_audio is not None:
+                rendered = {scene.scene_number: scene for scene in video_scenes}
+                for index, track in zip(speaking, await dialogue_audio):
+                    if track is not None and index in rendered:
+                        rendered[index].audio_path = track
+
+            if self.thumbnailer is not None:
+                await self.thumbnailer.previews_for_video(video)
+                job.update(thumbnail_path=video.thumbnail_path)
+            for scene in video.scenes:
+                job.record_scene(scene)
+
+            if video.status == VideoStatus.COMPLETED and self.compositor is not None:
+                output_path = job.root / f"film.{settings.output_video_format}"
+                try:
+                    video.output_path = await self.composite_scenes(
+                        video_scenes, str(output_path), resolution, fps
+                    )
+                    job.update(output_path=video.output_path)
+                except CompositionError as e:
+                    logger.error("Error compositing video: %s", e, extra={"job_id": job.job_id})
+                    video.status = VideoStatus.FAILED
 
         except Exception as e:
-            print(f"Error generating video from script: {e}")
+            logger.exception(
+                "Error generating video from script: %s", e, extra={"job_id": job.job_id}
+            )
             video.status = VideoStatus.FAILED
-            return video
+
+        finally:
+            if dialogue_audio is not None and not dialogue_audio.done():
+                dialogue_audio.cancel()
+            job.update(status=video.status.value)
+            self._active_jobs.discard(job.job_id)
+
+        return video
+
+    def playlist_path(self, job_id: str) -> Optional[Path]:
+        """
+        Location of a job's progressive HLS preview.
+
+        Args:
+            job_id: Render job ID
+
+        Returns:
+            Playlist path, or None if progressive assembly is disabled
+        """
+        if self.compositor is None or not settings.progressive_assembly_enabled:
+            return None
+        return self.artifacts.jobs_dir / job_id / "hls" / "film.m3u8"
+
+    @property
+    def downloads_dir(self) -> Path:
+        """Staging directory for clips downloaded while the render cache is disabled."""
+        return self.output_dir / "downloads"
+
+    def collect_garbage(self, max_age_seconds: Optional[float] = None) -> list[str]:
+        """
+        Remove output left behind by abandoned render jobs.
+
+        Deletes job directories of unfinished jobs idle for longer than
+        ``max_age_seconds`` (skipping jobs running in this process) and stale
+        staged downloads.
+
+        Args:
+            max_age_seconds: Idle time after which a job is abandoned (defaults to settings)
+
+        Returns:
+            IDs of the removed jobs
+        """
+        if max_age_seconds is None:
+            max_age_seconds = settings.artifact_gc_max_age_seconds
+        removed = self.artifacts.collect_garbage(max_age_seconds, active=self._active_jobs)
+
+        cutoff = time.time() - max_age_seconds
+        if self.downloads_dir.exists():
+            for path in self.downloads_dir.iterdir():
+                if path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+
+        return removed
+
+    async def aclose(self) -> None:
+        """Stop polling and release pooled network resources."""
+        await self.task_poller.aclose()
+        await self.runway.aclose()
+        if self.speech is not None:
+            await self.speech.aclose()
+        if self.compositor is not None:
+            self.compositor.shutdown()
 
     async def generate_scene_visuals(self, scene_number: int, prompt: str) -> str:
         """
@@ -239,6 +811,9 @@ class VideoGenerator:
         """
         Generate audio for a single scene.
 
+        Every line is synthesized concurrently (previously synthesized lines come
+        from the line cache) and mixed into ``<output_dir>/audio/scene_XXX.wav``.
+
         Args:
             scene_number: Scene number
             dialogue: List of dialogue lines
@@ -247,8 +822,13 @@ class VideoGenerator:
         Returns:
             Path to generated audio file
         """
-        # Placeholder - implement audio generation
-        raise NotImplementedError("Scene audio generation not yet implemented")
+        speech = self.speech or build_speech_synthesizer(self.output_dir / "cache" / "speech")
+        destination = self.output_dir / "audio" / f"scene_{scene_number:03d}.wav"
+        try:
+            return await speech.synthesize_track(dialogue, duration, destination)
+        finally:
+            if speech is not self.speech:
+                await speech.aclose()
 
     async def composite_scenes(
         self, scenes: list[VideoScene], output_path: str, resolution: str, fps: int
@@ -256,6 +836,9 @@ class VideoGenerator:
         """
         Composite all scenes into a final video.
 
+        Clips that share codec, resolution and frame rate (as Runway output does)
+        are joined with a stream copy; anything else is transcoded in one pass.
+
         Args:
             scenes: List of video scenes
             output_path: Path for output video
@@ -264,14 +847,39 @@ class VideoGenerator:
 
         Returns:
             Path to final video file
+
+        Raises:
+            CompositionError: If a scene has no clip or ffmpeg fails
         """
-        # Placeholder - implement video composition using moviepy or ffmpeg
-        raise NotImplementedError("Video composition not yet implemented")
+        inputs = [scene.visual_path for scene in scenes if scene.visual_path]
+        if len(inputs) != len(scenes):
+            raise CompositionError("Every scene needs a rendered clip before compositing")
+
+        compositor = self.compositor or Compositor(
+            max_workers=1, ffmpeg=settings.ffmpeg_path, ffprobe=settings.ffprobe_path
+        )
+        try:
+            started = time.monotonic()
+            method = await compositor.composite(inputs, output_path, resolution, fps)
+        finally:
+            if compositor is not self.compositor:
+                compositor.shutdown()
+        logger.info(
+            "Composited %d scenes into %s (%s, %.1fs)",
+            len(inputs),
+            output_path,
+            method,
+            time.monotonic() - started,
+        )
+        return output_path
 
     async def generate_thumbnail(self, video_path: str, timestamp: float = 0.0) -> str:
         """
         Generate a thumbnail from a video.
 
+        Seeks to the keyframe nearest ``timestamp`` rather than decoding from the
+        start, and writes ``<name>.thumb.jpg`` next to the video.
+
         Args:
             video_path: Path to video file
             timestamp: Timestamp for thumbnail
@@ -279,5 +887,11 @@ class VideoGenerator:
         Returns:
             Path to thumbnail file
         """
-        # Placeholder - implement thumbnail generation
-        raise NotImplementedError("Thumbnail generation not yet implemented")
+        compositor = self.compositor or Compositor(max_workers=1, ffmpeg=settings.ffmpeg_path)
+        thumbnailer = self.thumbnailer or Thumbnailer(compositor, width=settings.thumbnail_width)
+        output = thumbnail_path(Path(video_path))
+        try:
+            return await thumbnailer.thumbnail(video_path, str(output), timestamp)
+        finally:
+            if compositor is not self.compositor:
+                compositor.shutdown()
@@ -0,0 +1,89 @@
+"""Celery application and background tasks.
+
+Run a worker with::
+
+    celery -A script_to_film.tasks worker --loglevel=info
+"""
+
+import asyncio
+from typing import Optional
+
+from celery import Celery
+
+from script_to_film.config.settings import settings
+from script_to_film.db import ScriptRepository, VideoRepository, create_engine, init_db
+from script_to_film.services.compositor import Compositor
+from script_to_film.services.job_queue import render_video_job
+from script_to_film.services.video_generator import VideoGenerator
+
+app = Celery(
+    "script_to_film",
+    broker=settings.celery_broker_url,
+    backend=settings.celery_result_backend,
+)
+app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    # Renders run for minutes: only acknowledge once finished so a job is redelivered
+    # if its worker dies, and never reserve more than the job in hand
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+)
+
+
+class _Worker:
+    """Per-process event loop, database pool and generator reused across tasks."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        engine = create_engine()
+        self.loop.run_until_complete(init_db(engine))
+        self.script_repository = ScriptRepository(engine)
+        self.video_repository = VideoRepository(engine)
+        # Prefork workers are daemonic and cannot start a process pool of their own
+        self.generator = VideoGenerator(
+            compositor=(
+                Compositor(
+                    max_workers=settings.composite_max_workers,
+                    use_processes=False,
+                    ffmpeg=settings.ffmpeg_path,
+                    ffprobe=settings.ffprobe_path,
+                )
+                if settings.composite_enabled
+                else None
+            )
+        )
+        self.generator.collect_garbage()
+
+
+_worker: Optional[_Worker] = None
+
+
+def _get_worker() -> _Worker:
+    """Create the per-process worker state on first use (after the pool forks)."""
+    global _worker
+    if _worker is None:
+        _worker = _Worker()
+    return _worker
+
+
+@app.task(name="script_to_film.render_video")
+def render_video(video_id: str) -> Optional[str]:
+    """
+    Render every scene of a stored video.
+
+    Args:
+        video_id: ID of the video to render
+
+    Returns:
+        Final video status, or None if the video does not exist
+    """
+    worker = _get_worker()
+    video = worker.loop.run_until_complete(
+        render_video_job(
+            video_id, worker.script_repository, worker.video_repository, worker.generator
+        )
+    )
+    return video.status.value if video else None
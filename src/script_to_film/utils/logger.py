@@ -1,17 +1,59 @@
 """Logging configuration."""
 
+import json
 import logging
 import sys
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Optional, TextIO
 
+# Attributes every LogRecord has; anything else was passed in ``extra``
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "taskName"}
 
-def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+
+    Fields passed with ``extra={...}`` become top-level keys, so a log call like
+    ``logger.info("Task created", extra={"task_id": task_id})`` can be filtered
+    on ``task_id`` by the log pipeline.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Render the record, its extra fields and any exception as JSON."""
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def setup_logger(
+    name: str,
+    level: Optional[str] = None,
+    fmt: str = "text",
+    stream: Optional[TextIO] = None,
+) -> logging.Logger:
     """
     Set up a logger with consistent formatting.
 
+    Calling it again for the same logger replaces the handler, so an entry point
+    can redirect the application's logs (e.g. to stderr when stdout carries output).
+
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        fmt: ``text`` for human-readable lines or ``json`` for structured logs
+        stream: Stream to write to (defaults to stdout)
 
     Returns:
         Configured logger
@@ -24,17 +66,22 @@ def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
         logger.setLevel(logging.INFO)
 
     # Create console handler
-    handler = logging.StreamHandler(sys.stdout)
+    handler = logging.StreamHandler(stream or sys.stdout)
     handler.setLevel(logging.DEBUG)
 
     # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    if fmt == "json":
+        formatter: logging.Formatter = JSONFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        )
     handler.setFormatter(formatter)
 
-    # Add handler to logger
-    if not logger.handlers:
-        logger.addHandler(handler)
+    # Replace the handler of a previous call
+    for previous in [h for h in logger.handlers if getattr(h, "_setup_logger", False)]:
+        logger.removeHandler(previous)
+    handler._setup_logger = True  # type: ignore[attr-defined]
+    logger.addHandler(handler)
 
     return logger
@@ -0,0 +1,119 @@
+"""Prometheus metrics for the hot paths."""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Bucket bounds (seconds) for calls that take milliseconds to minutes
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600)
+
+SCRIPT_PARSE_SECONDS = Histogram(
+    "script_parse_seconds",
+    "Time to parse a screenplay into scenes",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+SCRIPT_PARSE_BYTES = Histogram(
+    "script_parse_bytes",
+    "Size of parsed screenplays in characters",
+    buckets=(1e3, 4e3, 16e3, 64e3, 256e3, 1e6, 4e6, 16e6, 64e6),
+)
+
+LLM_REQUEST_SECONDS = Histogram(
+    "llm_request_seconds",
+    "Anthropic request latency, from sending the request to the last token",
+    ["operation", "model"],
+    buckets=LATENCY_BUCKETS,
+)
+LLM_TOKENS = Histogram(
+    "llm_tokens",
+    "Tokens per Anthropic request",
+    ["direction", "model"],
+    buckets=(50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000),
+)
+
+RUNWAY_TASK_SECONDS = Histogram(
+    "runway_task_seconds",
+    "Runway task time by pipeline step, split into time queued and time rendering",
+    ["step", "phase"],
+    buckets=LATENCY_BUCKETS,
+)
+RUNWAY_TASKS = Counter(
+    "runway_tasks_total",
+    "Runway tasks that reached a terminal status",
+    ["step", "status"],
+)
+
+DOWNLOAD_BYTES = Histogram(
+    "download_bytes",
+    "Size of downloaded generated media",
+    buckets=(64e3, 256e3, 1e6, 4e6, 16e6, 64e6, 256e6, 1e9),
+)
+DOWNLOAD_SECONDS = Histogram(
+    "download_seconds",
+    "Time to download generated media, including resumed attempts",
+    buckets=LATENCY_BUCKETS,
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit or miss)",
+    ["cache", "result"],
+)
+
+RENDER_JOBS_IN_FLIGHT = Gauge(
+    "render_jobs_in_flight",
+    "Full-film render jobs currently running",
+    multiprocess_mode="livesum",
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """
+    Count one cache lookup.
+
+    Args:
+        cache: Cache name (``script``, ``image``, ``clip``, ``speech``)
+        hit: Whether the lookup was served from the cache
+    """
+    CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+@contextmanager
+def timed(histogram: Histogram) -> Iterator[None]:
+    """
+    Observe the duration of a block, only when it completes without raising.
+
+    Args:
+        histogram: Histogram (with labels already applied) to observe into
+    """
+    started = time.perf_counter()
+    yield
+    histogram.observe(time.perf_counter() - started)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Render every metric in the Prometheus text format.
+
+    With ``PROMETHEUS_MULTIPROC_DIR`` set (several server workers, or metrics
+    recorded in pool processes), samples are aggregated across processes.
+
+    Returns:
+        Response body and its content type
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
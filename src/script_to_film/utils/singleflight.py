@@ -0,0 +1,46 @@
+"""Duplicate call suppression for concurrent async work."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key starts the work as a task; callers arriving while
+    it is running await the same task instead of starting their own. The task is
+    shielded, so a caller that is cancelled does not cancel the shared work.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._in_flight: dict[str, asyncio.Future[T]] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._in_flight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn`` unless a call for ``key`` is already running, then share its result.
+
+        Args:
+            key: Deduplication key
+            fn: Coroutine function producing the result
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+
+            def forget(_: Any) -> None:
+                self._in_flight.pop(key, None)
+
+            future.add_done_callback(forget)
+
+        return await asyncio.shield(future)
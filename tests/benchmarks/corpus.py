@@ -0,0 +1,99 @@
+"""Deterministic synthetic screenplays for parser benchmarks."""
+
+import random
+from functools import cache
+
+# Benchmark corpus: name -> target size in characters
+CORPUS_SIZES = {
+    "1KB": 1024,
+    "100KB": 100 * 1024,
+    "1MB": 1024**2,
+    "10MB": 10 * 1024**2,
+    "50MB": 50 * 1024**2,
+}
+
+LOCATIONS = [
+    "COFFEE SHOP",
+    "CITY PARK",
+    "APARTMENT - KITCHEN",
+    "OFFICE",
+    "ROOFTOP",
+    "SUBWAY CAR",
+    "POLICE STATION - INTERROGATION ROOM",
+]
+TIMES = ["DAY", "NIGHT", "MORNING", "EVENING", "DUSK", "CONTINUOUS"]
+CHARACTERS = ["SARAH", "JOHN", "MAYA", "DETECTIVE RUIZ"]
+EXTENSIONS = ["(CONT'D)", "(V.O.)", "(O.S.)"]
+PARENTHETICALS = ["(beat)", "(to herself)", "(whispering)", "(laughs)"]
+TRANSITIONS = ["CUT TO:", "DISSOLVE TO:", "SMASH CUT TO:", "MATCH CUT TO:"]
+WORDS = (
+    "the a she he walks looks turns slowly toward window door light rain table "
+    "quietly across room city street phone glass coffee laptop smiles waits"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _heading(rng: random.Random) -> str:
+    heading = f"{rng.choice(['INT.', 'EXT.'])} {rng.choice(LOCATIONS)} - {rng.choice(TIMES)}"
+    style = rng.random()
+    if style < 0.15:
+        return f"**{heading}**"  # markdown bold, as LLMs write them
+    if style < 0.2:
+        return heading.lower()
+    return heading
+
+
+def _dialogue(rng: random.Random) -> list[str]:
+    cue = rng.choice(CHARACTERS)
+    if rng.random() < 0.15:
+        cue = f"{cue} {rng.choice(EXTENSIONS)}"
+    lines = [cue]
+    if rng.random() < 0.25:
+        lines.append(rng.choice(PARENTHETICALS))
+    lines.append(_sentence(rng, rng.randint(3, 18)))
+    return lines
+
+
+def screenplay(size_bytes: int, seed: int = 0) -> str:
+    """
+    Generate a screenplay of roughly ``size_bytes`` characters.
+
+    Scenes mix action paragraphs (occasionally very long ones), dialogue with
+    character extensions and parentheticals, and transitions.
+
+    Args:
+        size_bytes: Target length
+        seed: Random seed; the same arguments always give the same text
+
+    Returns:
+        Screenplay text
+    """
+    rng = random.Random(seed)
+    parts = ["FADE IN:\n\n"]
+    length = len(parts[0])
+    while length < size_bytes:
+        block = [_heading(rng), ""]
+        for _ in range(rng.randint(2, 8)):
+            if rng.random() < 0.4:
+                words = rng.randint(200, 800) if rng.random() < 0.02 else rng.randint(8, 40)
+                block.append(_sentence(rng, words))
+            else:
+                block.extend(_dialogue(rng))
+            block.append("")
+        if rng.random() < 0.3:
+            block += [rng.choice(TRANSITIONS), ""]
+        text = "\n".join(block) + "\n"
+        parts.append(text)
+        length += len(text)
+    parts.append("FADE OUT.\n")
+    return "".join(parts)
+
+
+@cache
+def corpus(name: str) -> str:
+    """Screenplay of the named corpus size (generated once per process)."""
+    return screenplay(CORPUS_SIZES[name], seed=len(name))
@@ -0,0 +1,98 @@
+"""
+Script parser benchmarks with regression thresholds.
+
+Opt-in (they take about a minute): ``make bench``, or ``RUN_BENCHMARKS=1 pytest
+tests/benchmarks``. Each corpus size is compared with ``parser_baseline.json``:
+a run fails when throughput drops, or peak memory per input character grows,
+by more than ``BENCHMARK_TOLERANCE`` (default 0.35). Throughput depends on the
+machine, so record a baseline on yours before a change with ``make
+bench-baseline`` (``BENCHMARK_SAVE=1``). The scaling checks do not depend on
+the machine.
+"""
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from script_to_film.services.script_parser import ScriptParser
+from tests.benchmarks.corpus import CORPUS_SIZES, corpus, screenplay
+from tests.benchmarks.parser_throughput import ParseStats, measure_parse, report
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="benchmarks run with RUN_BENCHMARKS=1"
+)
+
+BASELINE_PATH = Path(__file__).with_name("parser_baseline.json")
+TOLERANCE = float(os.environ.get("BENCHMARK_TOLERANCE", "0.35"))
+
+
+@pytest.fixture(scope="module")
+def measurements() -> Iterator[dict[str, ParseStats]]:
+    """Parse statistics by corpus name, reported (and optionally saved) at the end."""
+    results: dict[str, ParseStats] = {}
+    yield results
+
+    ordered = {name: results[name] for name in CORPUS_SIZES if name in results}
+    print("\n" + report(ordered))
+    if os.environ.get("BENCHMARK_SAVE") and ordered:
+        baseline = _load_baseline()
+        for name, stats in ordered.items():
+            baseline[name] = {
+                "throughput_mb_s": round(stats.throughput, 2),
+                "per_scene_us": round(stats.per_scene_us, 2),
+                "memory_ratio": round(stats.memory_ratio, 3),
+            }
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def _load_baseline() -> dict[str, dict[str, float]]:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def _stats(measurements: dict[str, ParseStats], name: str) -> ParseStats:
+    if name not in measurements:
+        measurements[name] = measure_parse(ScriptParser(), corpus(name))
+    return measurements[name]
+
+
+def test_corpus_is_deterministic_and_varied() -> None:
+    """Test that the corpus is reproducible and covers the formatting variants."""
+    text = screenplay(50_000, seed=7)
+
+    assert text == screenplay(50_000, seed=7)
+    assert text != screenplay(50_000, seed=8)
+    for variant in ("**INT.", "(CONT'D)", "(beat)", "CUT TO:", "FADE OUT."):
+        assert variant in text
+
+
+@pytest.mark.parametrize("name", list(CORPUS_SIZES))
+def test_parse_does_not_regress(measurements: dict[str, ParseStats], name: str) -> None:
+    """Test parse throughput and memory against the recorded baseline."""
+    stats = _stats(measurements, name)
+    assert stats.scenes > 0
+
+    baseline = _load_baseline().get(name)
+    if baseline is None or os.environ.get("BENCHMARK_SAVE"):
+        pytest.skip(f"no baseline recorded for {name}")
+    assert stats.throughput >= baseline["throughput_mb_s"] * (
+        1 - TOLERANCE
+    ), f"{name}: {stats.throughput:.1f} MB/s, baseline {baseline['throughput_mb_s']} MB/s"
+    assert stats.memory_ratio <= baseline["memory_ratio"] * (
+        1 + TOLERANCE
+    ), f"{name}: {stats.memory_ratio:.2f} bytes/char, baseline {baseline['memory_ratio']}"
+
+
+def test_parse_scales_linearly(measurements: dict[str, ParseStats]) -> None:
+    """Test that per-scene time and per-character memory stay flat as input grows."""
+    small = _stats(measurements, "1MB")
+    large = _stats(measurements, "50MB")
+
+    # Holding more scenes costs a little more each (GC, cache misses); a quadratic step
+    # would be ~50x
+    assert large.per_scene_us <= small.per_scene_us * 3
+    assert large.memory_ratio <= small.memory_ratio * 1.5
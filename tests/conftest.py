@@ -0,0 +1,42 @@
+"""Shared pytest configuration."""
+
+import os
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Settings requires these at import time; tests never talk to the real services.
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("JOB_QUEUE_BACKEND", "inprocess")
+# Compositing needs ffmpeg; tests that exercise it build their own Compositor
+os.environ.setdefault("COMPOSITE_ENABLED", "false")
+os.environ.setdefault("SPEECH_BACKEND", "stub")
+# No provider quotas; rate limiter tests configure their own
+os.environ.setdefault("RATE_LIMITS", "{}")
+# Keep retry backoff short; resilience tests configure their own policies
+os.environ.setdefault("RETRY_INITIAL_DELAY", "0.001")
+os.environ.setdefault("RETRY_MAX_DELAY", "0.01")
+for _name in (
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "RUNWAY_API_KEY",
+    "RUNWAYML_API_SECRET",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "S3_BUCKET_NAME",
+    "SECRET_KEY",
+):
+    os.environ.setdefault(_name, "test")
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    """Fresh in-memory SQLite database with the schema created."""
+    # Imported lazily: settings must see the environment defaults above
+    from script_to_film.db import create_engine, init_db
+
+    test_engine = create_engine("sqlite+aiosqlite://")
+    await init_db(test_engine)
+    yield test_engine
+    await test_engine.dispose()
@@ -0,0 +1 @@
+"""In-process fake provider servers for offline tests."""
@@ -0,0 +1,149 @@
+"""Fake Anthropic Messages API server.
+
+Answers ``POST /v1/messages`` (including ``"stream": true`` SSE responses)
+from memory so ``AIService`` can be exercised
+offline through ``httpx.ASGITransport(app=fake.app)``.
+"""
+
+import asyncio
+import json
+import random
+import uuid
+from typing import Any, AsyncIterator, Callable, Optional, Union
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+FAKE_SCRIPT = """INT. COFFEE SHOP - DAY
+
+Sarah sits at a corner table, typing on her laptop.
+
+SARAH
+This deadline is impossible.
+
+EXT. PARK - EVENING
+
+The two walk through a scenic park at sunset.
+
+JOHN
+I've been thinking about that project.
+"""
+
+
+class FakeAnthropic:
+    """In-memory Anthropic Messages API."""
+
+    def __init__(
+        self,
+        script: str = FAKE_SCRIPT,
+        response_delay: Union[float, Callable[[], float]] = 0.0,
+        status_code: int = 200,
+        stream_chunk_size: int = 16,
+        stream_delay: float = 0.0,
+        failure_rate: float = 0.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize the fake server.
+
+        Args:
+            script: Text returned as the assistant message
+            response_delay: Seconds every response is delayed by, or a function
+                sampling the delay per response
+            status_code: HTTP status to answer with (non-200 returns an API error body)
+            stream_chunk_size: Characters per text delta when streaming
+            stream_delay: Seconds between streamed text deltas
+            failure_rate: Probability that a request is answered with a 529 (overloaded)
+            rng: Random source for ``failure_rate`` (seeded for repeatable runs)
+        """
+        self.script = script
+        self.response_delay = response_delay
+        self.status_code = status_code
+        self.stream_chunk_size = stream_chunk_size
+        self.stream_delay = stream_delay
+        self.failure_rate = failure_rate
+        self.rng = rng or random.Random()
+        self.requests: list[dict[str, Any]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.app = self._build_app()
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.post("/v1/messages")
+        async def messages(request: Request) -> Any:
+            body = await request.json()
+            self.requests.append(body)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                delay = self.response_delay
+                delay = delay() if callable(delay) else delay
+                if delay:
+                    await asyncio.sleep(delay)
+                if self.status_code != 200:
+                    return self._error(self.status_code)
+                if self.failure_rate and self.rng.random() < self.failure_rate:
+                    return self._error(529)
+                if body.get("stream"):
+                    return StreamingResponse(self._stream(body), media_type="text/event-stream")
+                return self._message(body)
+            finally:
+                self.in_flight -= 1
+
+        return app
+
+    def _error(self, status_code: int) -> JSONResponse:
+        return JSONResponse(
+            status_code=status_code,
+            content={"type": "error", "error": {"type": "api_error", "message": "Fake error"}},
+        )
+
+    def _message(self, body: dict[str, Any], text: Optional[str] = None) -> dict[str, Any]:
+        text = self.script if text is None else text
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "fake"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 100, "output_tokens": len(text.split())},
+        }
+
+    async def _stream(self, body: dict[str, Any]) -> AsyncIterator[str]:
+        message = self._message(body, text="")
+        message["stop_reason"] = None
+        yield _sse("message_start", {"type": "message_start", "message": message})
+        yield _sse(
+            "content_block_start",
+            {"type": "content_block_start", "index": 0, "content_block": message["content"][0]},
+        )
+
+        for start in range(0, len(self.script), self.stream_chunk_size):
+            if self.stream_delay:
+                await asyncio.sleep(self.stream_delay)
+            delta = {
+                "type": "text_delta",
+                "text": self.script[start : start + self.stream_chunk_size],
+            }
+            yield _sse(
+                "content_block_delta", {"type": "content_block_delta", "index": 0, "delta": delta}
+            )
+
+        yield _sse("content_block_stop", {"type": "content_block_stop", "index": 0})
+        yield _sse(
+            "message_delta",
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": len(self.script.split())},
+            },
+        )
+        yield _sse("message_stop", {"type": "message_stop"})
+
+
+def _sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
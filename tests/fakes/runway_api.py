@@ -0,0 +1,206 @@
+"""Fake Runway API server.
+
+Serves the subset of the Runway REST API used by ``RunwayClient`` from memory.
+Mount it in-process with ``httpx.ASGITransport(app=fake.app)`` or run it
+standalone with ``uvicorn tests.fakes.runway_api:app``.
+"""
+
+import asyncio
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response
+
+FAKE_RUNWAY_URL = "http://runway.fake"
+
+
+@dataclass
+class FakeTask:
+    """A task tracked by the fake server."""
+
+    id: str
+    kind: str
+    payload: dict[str, Any]
+    polls: int = 0
+    ready_at: float = 0.0  # monotonic time the render finishes
+    cancelled: bool = False
+    output: list[str] = field(default_factory=list)
+
+
+class FakeRunway:
+    """In-memory Runway API."""
+
+    def __init__(
+        self,
+        polls_until_done: int = 1,
+        fail_kind: Optional[str] = None,
+        response_delay: Union[float, Callable[[], float]] = 0.0,
+        video_bytes: bytes = b"\x00\x00\x00\x18ftypmp42fake-video",
+        base_url: str = FAKE_RUNWAY_URL,
+        api_secret: Optional[str] = None,
+        truncate_downloads: int = 0,
+        unavailable_downloads: int = 0,
+        support_ranges: bool = True,
+        throttle_requests: int = 0,
+        retry_after: str = "0",
+        unavailable_requests: int = 0,
+        failure_rate: float = 0.0,
+        render_seconds: Union[float, Callable[[], float]] = 0.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize the fake server.
+
+        Args:
+            polls_until_done: Status polls before a task reports SUCCEEDED
+            fail_kind: Task kind ("text_to_image" or "image_to_video") that should fail
+            response_delay: Seconds every API response is delayed by, or a function
+                sampling the delay per response
+            video_bytes: Content served for generated clips
+            base_url: Base URL used in task output links
+            api_secret: Secret the server accepts (any non-empty secret if None)
+            truncate_downloads: Number of file responses cut off half-way through
+            unavailable_downloads: Number of file requests answered with 503
+            support_ranges: Whether file downloads honour ``Range`` headers
+            throttle_requests: Number of API requests answered with 429
+            retry_after: ``Retry-After`` header sent with 429 responses
+            unavailable_requests: Number of API requests answered with 503
+            failure_rate: Probability that an API request is answered with 503
+            render_seconds: Minimum seconds a task runs before it can finish, or a
+                function sampling it per task
+            rng: Random source for ``failure_rate`` (seeded for repeatable runs)
+        """
+        self.polls_until_done = polls_until_done
+        self.fail_kind = fail_kind
+        self.response_delay = response_delay
+        self.video_bytes = video_bytes
+        self.base_url = base_url
+        self.api_secret = api_secret
+        self.truncate_downloads = truncate_downloads
+        self.unavailable_downloads = unavailable_downloads
+        self.support_ranges = support_ranges
+        self.throttle_requests = throttle_requests
+        self.retry_after = retry_after
+        self.unavailable_requests = unavailable_requests
+        self.failure_rate = failure_rate
+        self.render_seconds = render_seconds
+        self.rng = rng or random.Random()
+        self.range_requests: list[str] = []
+        self.tasks: dict[str, FakeTask] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.app = self._build_app()
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.middleware("http")
+        async def record(request: Request, call_next: Any) -> Any:
+            self.requests.append((request.method, request.url.path))
+            delay = _sample(self.response_delay)
+            if delay:
+                await asyncio.sleep(delay)
+            if self.throttle_requests and request.url.path.startswith("/v1/"):
+                self.throttle_requests -= 1
+                return Response(status_code=429, headers={"Retry-After": self.retry_after})
+            if self.unavailable_requests and request.url.path.startswith("/v1/"):
+                self.unavailable_requests -= 1
+                return Response(status_code=503)
+            if (
+                self.failure_rate
+                and request.url.path.startswith("/v1/")
+                and self.rng.random() < self.failure_rate
+            ):
+                return Response(status_code=503)
+            return await call_next(request)
+
+        @app.post("/v1/text_to_image")
+        async def text_to_image(request: Request) -> dict[str, str]:
+            return self._create("text_to_image", request, await request.json())
+
+        @app.post("/v1/image_to_video")
+        async def image_to_video(request: Request) -> dict[str, str]:
+            return self._create("image_to_video", request, await request.json())
+
+        @app.get("/v1/tasks/{task_id}")
+        async def get_task(task_id: str) -> dict[str, Any]:
+            task = self.tasks.get(task_id)
+            if task is None:
+                raise HTTPException(status_code=404, detail="Task not found")
+
+            task.polls += 1
+            if task.cancelled:
+                return {"id": task.id, "status": "CANCELLED"}
+            if task.polls < self.polls_until_done or time.monotonic() < task.ready_at:
+                return {"id": task.id, "status": "RUNNING", "progress": 0.5}
+            if task.kind == self.fail_kind:
+                return {"id": task.id, "status": "FAILED", "failure": "Fake failure"}
+            return {"id": task.id, "status": "SUCCEEDED", "output": task.output}
+
+        @app.delete("/v1/tasks/{task_id}", status_code=204)
+        async def cancel_task(task_id: str) -> Response:
+            task = self.tasks.get(task_id)
+            if task is None:
+                raise HTTPException(status_code=404, detail="Task not found")
+            task.cancelled = True
+            return Response(status_code=204)
+
+        @app.get("/files/{name}")
+        async def files(name: str, request: Request) -> Response:
+            if self.unavailable_downloads:
+                self.unavailable_downloads -= 1
+                return Response(status_code=503)
+            if name.endswith(".png"):
+                return Response(content=b"\x89PNG fake-image", media_type="image/png")
+            return self._file(self.video_bytes, "video/mp4", request.headers.get("range"))
+
+        return app
+
+    def _file(self, content: bytes, media_type: str, range_header: Optional[str]) -> Response:
+        status_code = 200
+        headers = {"content-length": str(len(content)), "accept-ranges": "bytes"}
+        if range_header and self.support_ranges:
+            self.range_requests.append(range_header)
+            start = int(range_header.removeprefix("bytes=").split("-")[0])
+            headers["content-range"] = f"bytes {start}-{len(content) - 1}/{len(content)}"
+            content = content[start:]
+            headers["content-length"] = str(len(content))
+            status_code = 206
+
+        if self.truncate_downloads:
+            # Announce the full length but stop half-way, like a dropped connection
+            self.truncate_downloads -= 1
+            content = content[: len(content) // 2]
+
+        return Response(
+            content=content, status_code=status_code, headers=headers, media_type=media_type
+        )
+
+    def _create(self, kind: str, request: Request, payload: dict[str, Any]) -> dict[str, str]:
+        secret = request.headers.get("authorization", "").removeprefix("Bearer").strip()
+        if not secret or (self.api_secret is not None and secret != self.api_secret):
+            raise HTTPException(status_code=401, detail="Invalid API key")
+        if "x-runway-version" not in request.headers:
+            raise HTTPException(status_code=400, detail="Missing X-Runway-Version")
+
+        task_id = uuid.uuid4().hex
+        extension = "png" if kind == "text_to_image" else "mp4"
+        task = FakeTask(
+            id=task_id,
+            kind=kind,
+            payload=payload,
+            output=[f"{self.base_url}/files/{task_id}.{extension}"],
+            ready_at=time.monotonic() + _sample(self.render_seconds),
+        )
+        self.tasks[task_id] = task
+        return {"id": task_id}
+
+
+def _sample(value: Union[float, Callable[[], float]]) -> float:
+    return value() if callable(value) else value
+
+
+app = FakeRunway(polls_until_done=3, base_url="http://127.0.0.1:8001").app
@@ -0,0 +1,26 @@
+"""Smoke test for the load-test harness."""
+
+from tests.load.harness import Latency, LoadProfile, run
+
+
+def test_short_run_reports_every_endpoint() -> None:
+    """Test a one-second run against fast fake providers."""
+    profile = LoadProfile(
+        duration=1.0,
+        concurrency=4,
+        mix={"parse": 1, "generate": 1, "stream": 1, "scene": 1},
+        anthropic_latency=Latency(0.01),
+        runway_latency=Latency(0.0),
+        runway_render=Latency(0.02),
+        poll_interval=0.01,
+    )
+
+    report = run(profile)
+
+    assert set(report.endpoints) == {"parse", "generate", "stream", "scene"}
+    for name, stats in report.endpoints.items():
+        assert stats.requests > 0, name
+        assert stats.errors == 0, (name, stats.status_codes)
+        assert 0 < stats.p50 <= stats.p95 <= stats.p99
+    assert report.provider_requests["runway"] > 0
+    assert report.loop_lag_max >= report.loop_lag_p99 >= 0
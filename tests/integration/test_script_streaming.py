@@ -0,0 +1,73 @@
+"""Integration tests for the streaming script generation endpoint."""
+
+import json
+from collections.abc import Iterator
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from script_to_film.api import routes
+from script_to_film.main import app
+from script_to_film.services import resilience
+from script_to_film.services.ai_service import AIService
+from script_to_film.services.resilience import CircuitBreaker, Resilience
+from tests.fakes.anthropic_api import FAKE_SCRIPT, FakeAnthropic
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    """API client whose AI service talks to the fake Anthropic server."""
+    fake = FakeAnthropic(stream_chunk_size=5)
+    service = AIService(transport=httpx.ASGITransport(app=fake.app))
+    monkeypatch.setattr(routes, "ai_service", service)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_stream_emits_tokens_scenes_and_script(client: TestClient) -> None:
+    """Test the event sequence of a streamed generation."""
+    with client.stream(
+        "POST", "/api/v1/scripts/generate/stream", json={"prompt": "Two friends reunite"}
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.iter_lines() if line]
+
+    types = [event["type"] for event in events]
+    assert types[-1] == "script"
+    assert "".join(e["text"] for e in events if e["type"] == "token") == FAKE_SCRIPT
+
+    scenes = [e["scene"] for e in events if e["type"] == "scene"]
+    assert [scene["location"] for scene in scenes] == ["COFFEE SHOP", "PARK"]
+    # The first scene is emitted before the rest of the script has finished streaming
+    last_token = max(i for i, event_type in enumerate(types) if event_type == "token")
+    assert types.index("scene") < last_token
+
+    script = events[-1]["script"]
+    assert script["id"].startswith("script_")
+    assert script["content"] == FAKE_SCRIPT
+    assert script["scenes"] == scenes
+
+
+def test_provider_outage_answers_503(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an Anthropic outage is reported as degraded rather than faked."""
+    fake = FakeAnthropic(status_code=503)
+    policy = Resilience(
+        "anthropic", CircuitBreaker(failure_threshold=2, reset_timeout=30), max_attempts=2
+    )
+    monkeypatch.setitem(resilience._policies, "anthropic", policy)
+    service = AIService(transport=httpx.ASGITransport(app=fake.app), resilience=policy)
+    monkeypatch.setattr(routes, "ai_service", service)
+
+    with TestClient(app) as client:
+        generated = client.post("/api/v1/scripts/generate", json={"prompt": "Two friends"})
+        streamed = client.post("/api/v1/scripts/generate/stream", json={"prompt": "Two friends"})
+        health = client.get("/api/v1/health").json()
+
+    assert generated.status_code == streamed.status_code == 503
+    assert generated.json()["provider"] == "anthropic"
+    assert 0 < int(generated.headers["Retry-After"]) <= 30
+    assert len(fake.requests) == 2  # the stream found the circuit open
+    assert health["status"] == "degraded"
+    assert health["circuits"]["anthropic"] == "open"
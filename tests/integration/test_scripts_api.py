@@ -0,0 +1,143 @@
+"""Integration tests for the persisted script endpoints."""
+
+import io
+import json
+import tarfile
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from script_to_film.config.settings import settings
+from script_to_film.main import app
+
+SCRIPT_CONTENT = """INT. COFFEE SHOP - DAY
+
+Sarah types on her laptop.
+
+EXT. PARK - NIGHT
+
+John walks alone.
+"""
+
+
+def _tarball(files: dict[str, str]) -> bytes:
+    """Build a gzip-compressed tar archive of text files in memory."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content.encode())
+            archive.addfile(info, io.BytesIO(content.encode()))
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    """API client backed by a fresh in-memory database."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_create_and_get_script(client: TestClient) -> None:
+    """Test that a created script can be fetched by ID."""
+    created = client.post(
+        "/api/v1/scripts", json={"title": "Reunion", "content": SCRIPT_CONTENT}
+    ).json()
+
+    response = client.get(f"/api/v1/scripts/{created['id']}")
+
+    assert response.status_code == 200
+    assert response.json() == created
+    assert created["scene_count"] == 2
+    assert client.get("/api/v1/scripts/script_missing").status_code == 404
+
+
+def test_metrics_report_parse_time(client: TestClient) -> None:
+    """Test that /metrics exposes the parse histogram in the Prometheus text format."""
+
+    def parse_count() -> float:
+        for line in client.get("/metrics").text.splitlines():
+            if line.startswith("script_parse_seconds_count"):
+                return float(line.split()[-1])
+        return 0.0
+
+    before = parse_count()
+    client.post("/api/v1/scripts", json={"title": "Reunion", "content": SCRIPT_CONTENT})
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert parse_count() == before + 1
+    assert "# TYPE runway_task_seconds histogram" in response.text
+
+
+def test_list_scripts_paginates(client: TestClient) -> None:
+    """Test following the X-Next-Cursor header through every page."""
+    ids = [
+        client.post("/api/v1/scripts", json={"title": f"S{i}", "content": SCRIPT_CONTENT}).json()[
+            "id"
+        ]
+        for i in range(5)
+    ]
+
+    seen: list[str] = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/api/v1/scripts", params=params)
+        seen.extend(script["id"] for script in response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+
+    assert sorted(seen) == sorted(ids)
+    assert len(seen) == 5
+    assert client.get("/api/v1/scripts", params={"cursor": "bogus"}).status_code == 400
+
+
+def test_video_prompts_for_stored_script(client: TestClient) -> None:
+    """Test that video prompts are returned for a stored script."""
+    created = client.post(
+        "/api/v1/scripts", json={"title": "Reunion", "content": SCRIPT_CONTENT}
+    ).json()
+
+    response = client.post(f"/api/v1/scripts/{created['id']}/video-prompts")
+
+    assert response.status_code == 200
+    assert all(scene["video_prompt"] for scene in response.json()["scenes"])
+
+
+def test_batch_import_streams_results(client: TestClient) -> None:
+    """Test importing loose files and a tarball, with one NDJSON line per script."""
+    archive = _tarball({"one.txt": SCRIPT_CONTENT, "two.txt": SCRIPT_CONTENT})
+    files = [
+        ("files", ("reunion.txt", SCRIPT_CONTENT.encode(), "text/plain")),
+        ("files", ("binary.txt", b"\xff\xfe\x00", "text/plain")),
+        ("files", ("drafts.tar.gz", archive, "application/gzip")),
+    ]
+
+    response = client.post("/api/v1/scripts/batch", files=files)
+    events = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == 200
+    assert events[-1] == {"type": "summary", "imported": 3, "failed": 1}
+    imported = {event["name"]: event for event in events if event["type"] == "script"}
+    assert set(imported) == {"reunion.txt", "drafts.tar.gz/one.txt", "drafts.tar.gz/two.txt"}
+    assert [event["name"] for event in events if event["type"] == "error"] == ["binary.txt"]
+    script = client.get(f"/api/v1/scripts/{imported['reunion.txt']['id']}").json()
+    assert script["scene_count"] == 2
+
+
+def test_batch_import_rejects_oversized_uploads(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that uploads over the size limit are refused before anything is imported."""
+    monkeypatch.setattr(settings, "ingest_max_upload_bytes", len(SCRIPT_CONTENT) + 10)
+    files = [
+        ("files", ("one.txt", SCRIPT_CONTENT.encode(), "text/plain")),
+        ("files", ("two.txt", SCRIPT_CONTENT.encode(), "text/plain")),
+    ]
+
+    response = client.post("/api/v1/scripts/batch", files=files)
+
+    assert response.status_code == 413
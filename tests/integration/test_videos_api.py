@@ -0,0 +1,54 @@
+"""Integration tests for queued video rendering."""
+
+import time
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from script_to_film.api import routes
+from script_to_film.main import app
+from script_to_film.services.job_queue import InProcessJobQueue
+from tests.integration.test_scripts_api import SCRIPT_CONTENT
+from tests.unit.test_job_queue import StubGenerator
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch, tmp_path) -> Iterator[TestClient]:
+    """API client whose render jobs run in-process with a stub generator."""
+    queue = InProcessJobQueue(
+        routes.script_repository, routes.video_repository, StubGenerator(str(tmp_path))
+    )
+    monkeypatch.setattr(routes, "job_queue", queue)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_generate_video_is_queued(client: TestClient) -> None:
+    """Test that POST /videos returns 202 at once and the job completes in the background."""
+    script = client.post(
+        "/api/v1/scripts", json={"title": "Reunion", "content": SCRIPT_CONTENT}
+    ).json()
+
+    response = client.post("/api/v1/videos", json={"script_id": script["id"]})
+
+    assert response.status_code == 202
+    video = response.json()
+    assert video["status"] == "pending"
+    assert video["job_id"].startswith("job_")
+    assert [scene["status"] for scene in video["scenes"]] == ["pending", "pending"]
+
+    deadline = time.monotonic() + 5
+    while video["status"] in ("pending", "processing") and time.monotonic() < deadline:
+        time.sleep(0.01)
+        video = client.get(f"/api/v1/videos/{video['id']}").json()
+
+    assert video["status"] == "completed"
+    assert [scene["status"] for scene in video["scenes"]] == ["completed", "completed"]
+
+
+def test_generate_video_unknown_script(client: TestClient) -> None:
+    """Test that queueing a video for a missing script is rejected."""
+    response = client.post("/api/v1/videos", json={"script_id": "script_missing"})
+
+    assert response.status_code == 404
@@ -0,0 +1 @@
+"""Load-test harness: the API on one uvicorn worker against fake providers."""
@@ -0,0 +1,91 @@
+"""
+Run a load test: ``python -m tests.load --duration 30 --concurrency 50``.
+
+Provider latencies are log-normal with the given medians (seconds); the mix is
+``endpoint=weight`` pairs over parse, get, generate, stream and scene.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+# Settings are read on import: run against a scratch database and local stubs.
+# In-memory SQLite shares one connection between requests, so concurrent
+# transactions would interfere; a file database behaves like a real one.
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp(prefix='load-test-')}/load.db"
+)
+os.environ.setdefault("JOB_QUEUE_BACKEND", "inprocess")
+os.environ.setdefault("COMPOSITE_ENABLED", "false")
+os.environ.setdefault("SPEECH_BACKEND", "stub")
+# Measure the worker itself, not the provider quotas (set RATE_LIMITS to include them)
+os.environ.setdefault("RATE_LIMITS", "{}")
+for _name in (
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "RUNWAY_API_KEY",
+    "RUNWAYML_API_SECRET",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "S3_BUCKET_NAME",
+    "SECRET_KEY",
+):
+    os.environ.setdefault(_name, "load-test")
+
+from script_to_film.config.settings import settings  # noqa: E402
+from script_to_film.utils.logger import setup_logger  # noqa: E402
+from tests.load.harness import DEFAULT_MIX, Latency, LoadProfile, run  # noqa: E402
+
+
+def _mix(value: str) -> dict[str, float]:
+    mix = {}
+    for pair in value.split(","):
+        name, _, weight = pair.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def main() -> None:
+    """Parse arguments, run the load test and print the report."""
+    parser = argparse.ArgumentParser(prog="python -m tests.load", description=__doc__)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of traffic")
+    parser.add_argument("--concurrency", type=int, default=20, help="virtual users")
+    parser.add_argument(
+        "--mix",
+        type=_mix,
+        default=dict(DEFAULT_MIX),
+        help="endpoint weights, e.g. parse=4,get=4,generate=2,stream=1,scene=1",
+    )
+    parser.add_argument("--anthropic-latency", type=float, default=2.0)
+    parser.add_argument("--anthropic-failure-rate", type=float, default=0.0)
+    parser.add_argument("--runway-latency", type=float, default=0.15, help="per API call")
+    parser.add_argument("--runway-render", type=float, default=4.0, help="per task")
+    parser.add_argument("--runway-failure-rate", type=float, default=0.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="log-normal spread")
+    parser.add_argument("--poll-interval", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    sigma = args.latency_sigma
+    profile = LoadProfile(
+        duration=args.duration,
+        concurrency=args.concurrency,
+        mix=args.mix,
+        anthropic_latency=Latency(args.anthropic_latency, sigma),
+        anthropic_failure_rate=args.anthropic_failure_rate,
+        runway_latency=Latency(args.runway_latency, sigma),
+        runway_render=Latency(args.runway_render, sigma),
+        runway_failure_rate=args.runway_failure_rate,
+        poll_interval=args.poll_interval,
+        seed=args.seed,
+    )
+    # Keep stdout for the report
+    setup_logger("script_to_film", settings.log_level, settings.log_format, stream=sys.stderr)
+    report = run(profile)
+    print(report.to_json() if args.json else report.format())
+
+
+if __name__ == "__main__":
+    main()
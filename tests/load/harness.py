@@ -0,0 +1,410 @@
+"""
+Load-test harness.
+
+Boots ``script_to_film.main:app`` on one uvicorn worker in a background thread,
+with ``AIService`` and ``VideoGenerator`` wired to in-process fake Anthropic and
+Runway servers whose latency and failure rates follow a ``LoadProfile``. Virtual
+users then drive a weighted mix of API calls over real HTTP for a fixed
+duration, and every endpoint's throughput and latency percentiles are reported
+together with the server's event-loop lag.
+
+Settings are read when ``script_to_film`` is first imported, so set the
+environment first (``python -m tests.load`` does).
+"""
+
+import asyncio
+import json
+import math
+import random
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Awaitable
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Optional
+
+import httpx
+import uvicorn
+
+from script_to_film.api import routes
+from script_to_film.main import app
+from script_to_film.services.ai_service import AIService
+from script_to_film.services.resilience import Resilience
+from script_to_film.services.runway_client import RunwayClient
+from script_to_film.services.task_poller import TaskPoller
+from script_to_film.services.video_generator import VideoGenerator
+from tests.fakes.anthropic_api import FAKE_SCRIPT, FakeAnthropic
+from tests.fakes.runway_api import FAKE_RUNWAY_URL, FakeRunway
+
+# Relative weights of each endpoint in the default traffic mix
+DEFAULT_MIX = {"parse": 4.0, "get": 4.0, "generate": 2.0, "stream": 1.0, "scene": 1.0}
+
+
+@dataclass
+class Latency:
+    """Log-normal latency distribution, described by its median."""
+
+    median: float
+    sigma: float = 0.5  # spread; 0.5 puts p99 at about 3.2x the median
+
+    def sampler(self, rng: random.Random) -> Callable[[], float]:
+        """Function drawing one latency in seconds per call."""
+        if self.median <= 0:
+            return lambda: 0.0
+        mu = math.log(self.median)
+        return lambda: rng.lognormvariate(mu, self.sigma)
+
+
+@dataclass
+class LoadProfile:
+    """Traffic and provider behaviour for one run."""
+
+    duration: float = 30.0
+    concurrency: int = 20  # virtual users, each sending requests back to back
+    mix: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    anthropic_latency: Latency = field(default_factory=lambda: Latency(2.0))
+    anthropic_failure_rate: float = 0.0
+    runway_latency: Latency = field(default_factory=lambda: Latency(0.15))
+    runway_render: Latency = field(default_factory=lambda: Latency(4.0))
+    runway_failure_rate: float = 0.0
+    poll_interval: float = 0.5
+    seed: int = 0
+
+
+@dataclass
+class EndpointStats:
+    """Results for one endpoint."""
+
+    requests: int
+    errors: int
+    throughput: float  # completed requests per second
+    p50: float  # latency in seconds
+    p95: float
+    p99: float
+    status_codes: dict[str, int]
+
+
+@dataclass
+class LoadReport:
+    """Results of a run."""
+
+    duration: float
+    concurrency: int
+    endpoints: dict[str, EndpointStats]
+    loop_lag_p50: float  # seconds the server's event loop ran late
+    loop_lag_p99: float
+    loop_lag_max: float
+    provider_requests: dict[str, int]
+
+    def format(self) -> str:
+        """Human-readable table."""
+        lines = [
+            f"{self.concurrency} users for {self.duration:.1f}s",
+            f"{'endpoint':>10} {'requests':>9} {'errors':>7} {'req/s':>8} "
+            f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+        ]
+        for name, stats in self.endpoints.items():
+            lines.append(
+                f"{name:>10} {stats.requests:>9} {stats.errors:>7} {stats.throughput:>8.1f} "
+                f"{stats.p50 * 1000:>9.1f} {stats.p95 * 1000:>9.1f} {stats.p99 * 1000:>9.1f}"
+            )
+        lines.append(
+            f"event-loop lag: p50 {self.loop_lag_p50 * 1000:.1f} ms, "
+            f"p99 {self.loop_lag_p99 * 1000:.1f} ms, max {self.loop_lag_max * 1000:.1f} ms"
+        )
+        lines.append(
+            "provider requests: "
+            + ", ".join(f"{name} {count}" for name, count in self.provider_requests.items())
+        )
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        """Report as JSON."""
+        return json.dumps(asdict(self), indent=2)
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile (0 for no samples)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+
+class LoopLagMonitor:
+    """Measure how late a periodic timer fires on the running event loop."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """
+        Initialize the monitor.
+
+        Args:
+            interval: Seconds between timer ticks
+        """
+        self.interval = interval
+        self.samples: list[float] = []
+
+    async def run(self) -> None:
+        """Sample until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+
+class LoadTestServer:
+    """The API on one uvicorn worker, backed by fake providers."""
+
+    def __init__(self, profile: LoadProfile) -> None:
+        """
+        Initialize the server (call ``start`` to boot it).
+
+        Args:
+            profile: Provider latency and failure behaviour
+        """
+        self.profile = profile
+        rng = random.Random(profile.seed)
+        self.anthropic = FakeAnthropic(
+            response_delay=profile.anthropic_latency.sampler(rng),
+            failure_rate=profile.anthropic_failure_rate,
+            rng=rng,
+        )
+        self.runway = FakeRunway(
+            response_delay=profile.runway_latency.sampler(rng),
+            render_seconds=profile.runway_render.sampler(rng),
+            failure_rate=profile.runway_failure_rate,
+            rng=rng,
+        )
+        self.lag = LoopLagMonitor()
+        self.base_url = ""
+        self._output_dir = tempfile.TemporaryDirectory(prefix="load-test-")
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._originals: dict[str, Any] = {}
+
+    def start(self, timeout: float = 10.0) -> None:
+        """Boot the server thread and wait until it accepts connections."""
+        config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._serve()), name="load-test-server", daemon=True
+        )
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise RuntimeError("Load-test server did not start")
+
+    def stop(self) -> None:
+        """Shut the server down and restore the application's services."""
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=30)
+        for name, value in self._originals.items():
+            setattr(routes, name, value)
+        self._output_dir.cleanup()
+
+    async def _serve(self) -> None:
+        # Provider clients are created here so they belong to the server's event loop
+        ai_service = AIService(
+            transport=httpx.ASGITransport(app=self.anthropic.app),
+            resilience=Resilience("anthropic"),
+        )
+        runway = RunwayClient(
+            api_secret="load-test",
+            base_url=FAKE_RUNWAY_URL,
+            transport=httpx.ASGITransport(app=self.runway.app),
+            resilience=Resilience("runway"),
+        )
+        generator = VideoGenerator(
+            output_dir=self._output_dir.name,
+            runway_client=runway,
+            task_poller=TaskPoller(
+                runway,
+                initial_interval=self.profile.poll_interval,
+                max_interval=self.profile.poll_interval * 4,
+            ),
+        )
+        self._originals = {
+            "ai_service": routes.ai_service,
+            "video_generator": routes.video_generator,
+        }
+        routes.ai_service = ai_service
+        routes.video_generator = generator
+
+        monitor = asyncio.create_task(self.lag.run())
+        serving = asyncio.create_task(self._server.serve())
+        try:
+            while not self._server.started:
+                if serving.done():
+                    await serving  # raises the startup error
+                    return
+                await asyncio.sleep(0.01)
+            port = self._server.servers[0].sockets[0].getsockname()[1]
+            self.base_url = f"http://127.0.0.1:{port}"
+            self._ready.set()
+            await serving
+        finally:
+            monitor.cancel()
+            await generator.aclose()
+            await ai_service.aclose()
+
+
+class TrafficMix:
+    """The API calls virtual users choose from."""
+
+    def __init__(self, rng: random.Random) -> None:
+        """
+        Initialize the mix.
+
+        Args:
+            rng: Random source for choices and prompts
+        """
+        self.rng = rng
+        self.script_ids: list[str] = []
+        self.endpoints: dict[str, Callable[[httpx.AsyncClient], Awaitable[int]]] = {
+            "parse": self.parse,
+            "get": self.get,
+            "generate": self.generate,
+            "stream": self.stream,
+            "scene": self.scene,
+        }
+
+    def _prompt(self) -> str:
+        # Unique prompts: the script and render caches would otherwise answer repeats
+        return f"Two friends reunite at a coffee shop ({uuid.uuid4().hex[:8]})"
+
+    async def parse(self, client: httpx.AsyncClient) -> int:
+        """POST /scripts with a screenplay."""
+        response = await client.post(
+            "/api/v1/scripts", json={"title": "Load test", "content": FAKE_SCRIPT}
+        )
+        if response.status_code == 201:
+            self.script_ids.append(response.json()["id"])
+        return response.status_code
+
+    async def get(self, client: httpx.AsyncClient) -> int:
+        """GET /scripts/{id} for a script created earlier in the run."""
+        if not self.script_ids:
+            return await self.parse(client)
+        response = await client.get(f"/api/v1/scripts/{self.rng.choice(self.script_ids)}")
+        return response.status_code
+
+    async def generate(self, client: httpx.AsyncClient) -> int:
+        """POST /scripts/generate."""
+        response = await client.post("/api/v1/scripts/generate", json={"prompt": self._prompt()})
+        return response.status_code
+
+    async def stream(self, client: httpx.AsyncClient) -> int:
+        """POST /scripts/generate/stream, read to the end (failed streams count as 502)."""
+        async with client.stream(
+            "POST", "/api/v1/scripts/generate/stream", json={"prompt": self._prompt()}
+        ) as response:
+            last = ""
+            async for line in response.aiter_lines():
+                last = line or last
+        if response.status_code == 200 and json.loads(last).get("type") != "script":
+            return 502
+        return response.status_code
+
+    async def scene(self, client: httpx.AsyncClient) -> int:
+        """POST /videos/scene, which renders through Runway before answering."""
+        response = await client.post(
+            "/api/v1/videos/scene",
+            json={
+                "video_prompt": f"Wide shot: {self._prompt()}",
+                "duration_seconds": 5,
+                "scene_number": 0,
+            },
+        )
+        return response.status_code
+
+
+async def drive(base_url: str, profile: LoadProfile) -> dict[str, list[tuple[float, int]]]:
+    """
+    Send traffic from ``profile.concurrency`` virtual users until the duration is up.
+
+    Args:
+        base_url: Server address
+        profile: Traffic mix and duration
+
+    Returns:
+        ``(latency seconds, status code)`` per request, by endpoint (599 for
+        requests that failed without a response)
+    """
+    rng = random.Random(profile.seed + 1)
+    mix = TrafficMix(rng)
+    unknown = set(profile.mix) - set(mix.endpoints)
+    if unknown:
+        raise ValueError(f"Unknown endpoints in mix: {', '.join(sorted(unknown))}")
+    names = [name for name, weight in profile.mix.items() if weight > 0]
+    weights = [profile.mix[name] for name in names]
+    results: dict[str, list[tuple[float, int]]] = {name: [] for name in names}
+    deadline = time.monotonic() + profile.duration
+
+    async def user(client: httpx.AsyncClient) -> None:
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights)[0]
+            started = time.perf_counter()
+            try:
+                status_code = await mix.endpoints[name](client)
+            except httpx.HTTPError:
+                status_code = 599
+            results[name].append((time.perf_counter() - started, status_code))
+
+    limits = httpx.Limits(max_connections=profile.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=300, limits=limits) as client:
+        await asyncio.gather(*(user(client) for _ in range(profile.concurrency)))
+    return results
+
+
+def run(profile: LoadProfile) -> LoadReport:
+    """
+    Run a load test.
+
+    Args:
+        profile: Traffic and provider behaviour
+
+    Returns:
+        Per-endpoint throughput and latency, and the server's event-loop lag
+    """
+    server = LoadTestServer(profile)
+    server.start()
+    try:
+        started = time.perf_counter()
+        results = asyncio.run(drive(server.base_url, profile))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.stop()
+
+    endpoints = {}
+    for name, samples in results.items():
+        latencies = [latency for latency, _ in samples]
+        status_codes: dict[str, int] = {}
+        for _, status_code in samples:
+            status_codes[str(status_code)] = status_codes.get(str(status_code), 0) + 1
+        endpoints[name] = EndpointStats(
+            requests=len(samples),
+            errors=sum(status_code >= 400 for _, status_code in samples),
+            throughput=len(samples) / elapsed,
+            p50=percentile(latencies, 0.50),
+            p95=percentile(latencies, 0.95),
+            p99=percentile(latencies, 0.99),
+            status_codes=status_codes,
+        )
+
+    lag = server.lag.samples
+    return LoadReport(
+        duration=elapsed,
+        concurrency=profile.concurrency,
+        endpoints=endpoints,
+        loop_lag_p50=percentile(lag, 0.50),
+        loop_lag_p99=percentile(lag, 0.99),
+        loop_lag_max=max(lag, default=0.0),
+        provider_requests={
+            "anthropic": len(server.anthropic.requests),
+            "runway": len(server.runway.requests),
+        },
+    )
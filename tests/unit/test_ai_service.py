@@ -0,0 +1,145 @@
+"""Unit tests for the AI service against the fake Anthropic server."""
+
+import asyncio
+
+import anthropic
+import httpx
+import pytest
+
+from script_to_film.services.ai_service import SCRIPT_SYSTEM_PROMPT, AIService
+from script_to_film.services.resilience import (
+    CircuitBreaker,
+    ProviderUnavailableError,
+    Resilience,
+)
+from tests.fakes.anthropic_api import FAKE_SCRIPT, FakeAnthropic
+
+
+def make_service(fake: FakeAnthropic, max_concurrent_requests: int = 10) -> AIService:
+    """Create an AI service wired to a fake Anthropic server, with its own circuit."""
+    return AIService(
+        transport=httpx.ASGITransport(app=fake.app),
+        max_concurrent_requests=max_concurrent_requests,
+        resilience=Resilience(
+            "anthropic", CircuitBreaker(failure_threshold=3), max_attempts=3, initial_delay=0
+        ),
+    )
+
+
+async def test_generate_script() -> None:
+    """Test that the generated script text and request parameters round-trip."""
+    fake = FakeAnthropic()
+    service = make_service(fake)
+
+    script = await service.generate_script("Two friends reunite", genre="Drama")
+    await service.aclose()
+
+    assert script == FAKE_SCRIPT
+    request = fake.requests[0]
+    assert request["system"] == SCRIPT_SYSTEM_PROMPT
+    assert "Genre: Drama" in request["messages"][0]["content"]
+
+
+async def test_client_is_reused() -> None:
+    """Test that one pooled client serves every call."""
+    service = make_service(FakeAnthropic())
+
+    client = service.anthropic_client
+    await service.generate_script("First")
+    await service.generate_script("Second")
+
+    assert service.anthropic_client is client
+    await service.aclose()
+
+
+async def test_concurrency_limit() -> None:
+    """Test that in-flight Anthropic requests are capped per service."""
+    fake = FakeAnthropic(response_delay=0.02)
+    service = make_service(fake, max_concurrent_requests=2)
+
+    await asyncio.gather(*(service.generate_script(f"Idea {i}") for i in range(6)))
+    await service.aclose()
+
+    assert len(fake.requests) == 6
+    assert fake.peak_in_flight == 2
+
+
+async def test_rejected_request_is_not_retried() -> None:
+    """Test that a client error surfaces at once instead of a stand-in script."""
+    fake = FakeAnthropic(status_code=400)
+    service = make_service(fake)
+
+    with pytest.raises(anthropic.BadRequestError):
+        await service.generate_script("Two friends reunite")
+    await service.aclose()
+
+    assert len(fake.requests) == 1
+
+
+async def test_outage_retries_then_fails_fast() -> None:
+    """Test that server errors are retried, then the open circuit skips the API."""
+    fake = FakeAnthropic(status_code=503)
+    service = make_service(fake)
+
+    with pytest.raises(ProviderUnavailableError):
+        await service.generate_script("Two friends reunite")
+    with pytest.raises(ProviderUnavailableError) as exc_info:
+        await service.generate_script("Two friends reunite")
+    await service.aclose()
+
+    assert len(fake.requests) == 3
+    assert exc_info.value.retry_after > 0
+
+
+async def test_identical_requests_hit_cache() -> None:
+    """Test that a repeated request is served from the cache."""
+    fake = FakeAnthropic()
+    service = make_service(fake)
+
+    first = await service.generate_script("Two friends reunite", genre="Drama", tone="Warm")
+    second = await service.generate_script("  Two friends reunite ", genre="drama", tone="warm")
+    await service.aclose()
+
+    assert first == second == FAKE_SCRIPT
+    assert len(fake.requests) == 1
+    assert service.script_cache.stats.hits == 1
+
+
+async def test_bypass_cache() -> None:
+    """Test that use_cache=False always calls the model."""
+    fake = FakeAnthropic()
+    service = make_service(fake)
+
+    await service.generate_script("Two friends reunite")
+    await service.generate_script("Two friends reunite", use_cache=False)
+    await service.aclose()
+
+    assert len(fake.requests) == 2
+
+
+async def test_stream_outage_raises_before_first_chunk() -> None:
+    """Test that opening a stream is retried and fails before anything is yielded."""
+    fake = FakeAnthropic(status_code=503)
+    service = make_service(fake)
+
+    chunks = []
+    with pytest.raises(ProviderUnavailableError):
+        async for chunk in service.stream_script("Two friends reunite"):
+            chunks.append(chunk)
+    await service.aclose()
+
+    assert chunks == []
+    assert len(fake.requests) == 3
+
+
+async def test_streamed_script_is_cached() -> None:
+    """Test that a completed stream populates the cache for later requests."""
+    fake = FakeAnthropic(stream_chunk_size=8)
+    service = make_service(fake)
+
+    streamed = "".join([chunk async for chunk in service.stream_script("Two friends reunite")])
+    cached = await service.generate_script("Two friends reunite")
+    await service.aclose()
+
+    assert streamed == cached == FAKE_SCRIPT
+    assert len(fake.requests) == 1
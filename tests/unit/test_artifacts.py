@@ -0,0 +1,191 @@
+"""Unit tests for per-job output directories."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from script_to_film.models.script import Script, ScriptScene
+from script_to_film.models.video import VideoScene, VideoStatus
+from script_to_film.services.artifacts import ArtifactStore
+from tests.fakes.runway_api import FakeRunway
+from tests.unit.test_runway_client import make_generator
+
+
+class FakeClock:
+    """Settable wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_manifest_tracks_scenes(tmp_path: Path) -> None:
+    """Test that the manifest is created and updated with scene state."""
+    job = ArtifactStore(tmp_path).job("job_1")
+
+    job.update(video_id="video_1", status="processing")
+    job.record_scene(
+        VideoScene(
+            scene_number=0, visual_path=str(job.scene_path(0)), duration=5, status="completed"
+        )
+    )
+
+    manifest = json.loads(job.manifest_path.read_text())
+    assert job.scene_path(0) == tmp_path / "jobs" / "job_1" / "scenes" / "scene_000.mp4"
+    assert manifest["video_id"] == "video_1"
+    assert manifest["scenes"]["0"]["status"] == "completed"
+    assert ArtifactStore(tmp_path).job("job_1").manifest == job.manifest
+
+
+def test_rejects_path_like_job_ids(tmp_path: Path) -> None:
+    """Test that job IDs cannot escape the jobs directory."""
+    with pytest.raises(ValueError):
+        ArtifactStore(tmp_path).job("../elsewhere")
+
+
+def test_collects_abandoned_jobs(tmp_path: Path) -> None:
+    """Test that only idle unfinished jobs not running here are removed."""
+    clock = FakeClock()
+    store = ArtifactStore(tmp_path, clock=clock)
+    store.job("abandoned").update(status="processing")
+    store.job("finished").update(status="completed")
+    store.job("running").update(status="processing")
+    clock.now += 7200
+    store.job("recent").update(status="processing")
+
+    removed = store.collect_garbage(max_age_seconds=3600, active={"running"})
+
+    assert removed == ["abandoned"]
+    assert sorted(p.name for p in store.jobs_dir.iterdir()) == ["finished", "recent", "running"]
+
+
+async def test_concurrent_films_do_not_collide(tmp_path: Path) -> None:
+    """Test that two films rendering at once write scene 0 to separate job directories."""
+    fake = FakeRunway()
+    generator = make_generator(fake, tmp_path)
+    scripts = [
+        Script(
+            id=f"script_{name}",
+            title=name,
+            content="",
+            scenes=[
+                ScriptScene(
+                    scene_number=1,
+                    location="ROOM",
+                    time_of_day="DAY",
+                    description="",
+                    duration_seconds=5,
+                    video_prompt=f"A {name} room",
+                )
+            ],
+        )
+        for name in ("red", "blue")
+    ]
+
+    red, blue = await asyncio.gather(
+        *(
+            generator.generate_from_script(script, job_id=f"job_{script.title}")
+            for script in scripts
+        )
+    )
+    await generator.aclose()
+
+    assert red.status == blue.status == VideoStatus.COMPLETED
+    assert red.scenes[0].visual_path != blue.scenes[0].visual_path
+    for video in (red, blue):
+        job = generator.artifacts.job(video.job_id)
+        assert job.manifest["status"] == "completed"
+        assert Path(job.manifest["scenes"]["0"]["visual_path"]) == job.scene_path(0)
+        assert job.scene_path(0).read_bytes() == fake.video_bytes
+
+
+def test_checkpoint_survives_reopen_but_not_edits(tmp_path: Path) -> None:
+    """Test that checkpoints persist per clip and are dropped when the scene changes."""
+    job = ArtifactStore(tmp_path).job("job_1")
+    job.checkpoint(0, "key_a").update(video_task_id="task_1")
+
+    reopened = ArtifactStore(tmp_path).job("job_1")
+
+    assert reopened.checkpoint(0, "key_a").get("video_task_id") == "task_1"
+    assert reopened.checkpoint(0, "key_b").get("video_task_id") is None
+    assert reopened.checkpoint(0, "key_a").finished_clip() is None
+
+
+async def test_restarted_job_resumes_from_checkpoints(tmp_path: Path) -> None:
+    """Test that a rerun skips finished scenes and re-attaches to in-flight tasks."""
+    fake = FakeRunway()
+    generator = make_generator(fake, tmp_path)
+    generator.render_cache = None
+    scenes = [
+        ScriptScene(
+            scene_number=i,
+            location="ROOM",
+            time_of_day="DAY",
+            description="",
+            duration_seconds=5,
+            video_prompt=f"Shot {i}",
+        )
+        for i in range(2)
+    ]
+    # State left behind by a worker that died: scene 0 done, scene 1 rendering
+    job = generator.artifacts.job("job_1")
+    job.scene_path(0).write_bytes(b"clip 0")
+    job.checkpoint(0, generator._clip_key(scenes[0])).update(clip_path=str(job.scene_path(0)))
+    task_id = await generator.runway.create_image_to_video(
+        prompt_image="https://example.test/image.png", prompt_text="Shot 1", duration=5
+    )
+    job.checkpoint(1, generator._clip_key(scenes[1])).update(video_task_id=task_id)
+
+    video = await generator.generate_from_script(
+        Script(id="script_1", title="Test", content="", scenes=scenes), job_id="job_1"
+    )
+    await generator.aclose()
+
+    assert video.status == VideoStatus.COMPLETED
+    assert list(fake.tasks) == [task_id]
+    assert job.scene_path(0).read_bytes() == b"clip 0"
+    assert job.scene_path(1).read_bytes() == fake.video_bytes
+
+
+async def test_job_cancelled_at_shutdown_resumes_its_task(tmp_path: Path) -> None:
+    """Test that a job cancelled mid-render (graceful shutdown) re-attaches on restart."""
+    # The keyframe renders at once, the clip takes a minute
+    fake = FakeRunway(render_seconds=lambda: 60.0 if fake.tasks else 0.0)
+    scene = ScriptScene(
+        scene_number=0,
+        location="ROOM",
+        time_of_day="DAY",
+        description="",
+        duration_seconds=5,
+        video_prompt="Shot 0",
+    )
+    script = Script(id="script_1", title="Test", content="", scenes=[scene])
+    generator = make_generator(fake, tmp_path)
+    generator.render_cache = None
+
+    run = asyncio.ensure_future(generator.generate_from_script(script, job_id="job_1"))
+    while len(fake.tasks) < 2:
+        await asyncio.sleep(0.01)
+    # Shut down like asyncio.run does: cancel every task, shared renders included
+    for task in asyncio.all_tasks() - {asyncio.current_task()}:
+        task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    await asyncio.sleep(0.05)  # room for a cancel request to reach Runway
+    await generator.aclose()
+
+    # The clip finishes on Runway while the worker is down
+    video_task = list(fake.tasks.values())[1]
+    video_task.ready_at = 0.0
+    restarted = make_generator(fake, tmp_path)
+    restarted.render_cache = None
+    video = await asyncio.wait_for(restarted.generate_from_script(script, job_id="job_1"), 10)
+    await restarted.aclose()
+
+    assert video.status == VideoStatus.COMPLETED
+    assert [task.kind for task in fake.tasks.values()] == ["text_to_image", "image_to_video"]
+    assert not video_task.cancelled
@@ -0,0 +1,92 @@
+"""Unit tests for the cache tiers."""
+
+from typing import Optional
+
+import pytest
+
+from script_to_film.services.cache import LRUCache, RedisCache, TieredCache
+
+
+class _Clock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeRedis:
+    """Minimal stand-in for a redis.asyncio client."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.data: dict[str, str] = {}
+        self.fail = fail
+
+    async def get(self, key: str) -> Optional[str]:
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value
+
+    async def aclose(self) -> None:
+        pass
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    """Test size-based eviction order."""
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_lru_expires_entries() -> None:
+    """Test TTL-based expiry."""
+    clock = _Clock()
+    cache = LRUCache(max_entries=10, ttl_seconds=60, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 59
+    assert cache.get("a") == 1
+    clock.now = 61
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+async def test_tiered_promotes_remote_hits() -> None:
+    """Test that a remote hit is copied into memory and counted once."""
+    remote = RedisCache("redis://unused", client=_FakeRedis(), prefix="t:")
+    shared = TieredCache(LRUCache(max_entries=10), remote)
+    await shared.set("key", "script")
+
+    other_worker = TieredCache(LRUCache(max_entries=10), remote)
+    assert await other_worker.get("key") == "script"
+    assert await other_worker.get("key") == "script"
+
+    stats = other_worker.stats
+    assert (stats.hits, stats.remote_hits, stats.misses) == (2, 1, 0)
+    assert stats.hit_rate == pytest.approx(1.0)
+
+
+async def test_tiered_tolerates_remote_errors() -> None:
+    """Test that an unavailable remote tier degrades to memory only."""
+    cache = TieredCache(
+        LRUCache(max_entries=10), RedisCache("redis://unused", client=_FakeRedis(fail=True))
+    )
+
+    await cache.set("key", "script")
+    assert await cache.get("key") == "script"
+    assert await cache.get("missing") is None
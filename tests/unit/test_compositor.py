@@ -0,0 +1,146 @@
+"""Unit tests for scene composition."""
+
+import shutil
+import subprocess
+from fractions import Fraction
+from pathlib import Path
+
+import pytest
+
+from script_to_film.config.settings import settings
+from script_to_film.models.video import VideoScene, VideoStatus
+from script_to_film.services import video_generator
+from script_to_film.services.compositor import (
+    ClipInfo,
+    CompositionError,
+    Compositor,
+    can_stream_copy,
+    composite_clips,
+    concat_command,
+    probe,
+)
+from script_to_film.services.video_generator import VideoGenerator
+
+RUNWAY_CLIP = ClipInfo(
+    video_codec="h264", width=1280, height=768, frame_rate=Fraction(24), pixel_format="yuv420p"
+)
+
+requires_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+    reason="ffmpeg is not installed",
+)
+
+
+def make_clip(path: Path, size: str = "320x240", rate: int = 24) -> Path:
+    """Render a one-second test pattern clip with ffmpeg."""
+    subprocess.run(
+        ["ffmpeg", "-y", "-v", "error", "-f", "lavfi", "-i", f"testsrc=size={size}:rate={rate}"]
+        + ["-t", "1", "-c:v", "libx264", "-pix_fmt", "yuv420p", str(path)],
+        check=True,
+    )
+    return path
+
+
+def test_uniform_clips_are_stream_copied(tmp_path: Path) -> None:
+    """Test that matching clips use the concat demuxer without re-encoding."""
+    command = concat_command(
+        [tmp_path / "a.mp4", tmp_path / "b.mp4"],
+        tmp_path / "film.mp4",
+        tmp_path / "list.txt",
+        [RUNWAY_CLIP, RUNWAY_CLIP],
+        "1920x1080",
+        30,
+    )
+
+    assert command[command.index("-c") + 1] == "copy"
+    assert command[command.index("-i") + 1] == str(tmp_path / "list.txt")
+
+
+def test_mismatched_clips_are_transcoded_once(tmp_path: Path) -> None:
+    """Test that differing clips are normalized in a single ffmpeg pass."""
+    other = ClipInfo(
+        video_codec="h264", width=1920, height=1080, frame_rate=Fraction(30), pixel_format="yuv420p"
+    )
+    inputs = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+
+    assert not can_stream_copy([RUNWAY_CLIP, other])
+    command = concat_command(
+        inputs, tmp_path / "film.mp4", tmp_path / "list.txt", [RUNWAY_CLIP, other], "1920x1080", 30
+    )
+
+    assert command.count("-i") == 2
+    assert "concat=n=2:v=1:a=0[v]" in command[command.index("-filter_complex") + 1]
+    assert command[command.index("-c:v") + 1] == "libx264"
+
+
+def test_missing_ffmpeg_raises(tmp_path: Path) -> None:
+    """Test that a missing ffprobe surfaces as a CompositionError."""
+    with pytest.raises(CompositionError, match="not installed"):
+        composite_clips(
+            [str(tmp_path / "a.mp4")],
+            str(tmp_path / "film.mp4"),
+            "1920x1080",
+            30,
+            ffprobe=str(tmp_path / "no-ffprobe"),
+        )
+
+
+async def test_composite_scenes_requires_every_clip(tmp_path: Path) -> None:
+    """Test that compositing refuses scenes without a rendered clip."""
+    generator = VideoGenerator(output_dir=str(tmp_path), compositor=Compositor(max_workers=1))
+    scenes = [VideoScene(scene_number=0, duration=5, status=VideoStatus.FAILED)]
+
+    with pytest.raises(CompositionError):
+        await generator.composite_scenes(scenes, str(tmp_path / "film.mp4"), "1920x1080", 30)
+    await generator.aclose()
+
+
+async def test_composite_scenes_releases_temporary_compositor(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a compositor created for one call is shut down when compositing fails."""
+    created: list[Compositor] = []
+
+    class RecordingCompositor(Compositor):
+        def __init__(self, **kwargs) -> None:
+            super().__init__(**kwargs)
+            self.closed = False
+            created.append(self)
+
+        def shutdown(self) -> None:
+            self.closed = True
+            super().shutdown()
+
+    monkeypatch.setattr(video_generator, "Compositor", RecordingCompositor)
+    monkeypatch.setattr(settings, "ffprobe_path", str(tmp_path / "no-ffprobe"))
+    generator = VideoGenerator(output_dir=str(tmp_path))
+    generator.compositor = None
+    clip = tmp_path / "a.mp4"
+    clip.write_bytes(b"not a video")
+    scenes = [VideoScene(scene_number=0, visual_path=str(clip), duration=5)]
+
+    with pytest.raises(CompositionError):
+        await generator.composite_scenes(scenes, str(tmp_path / "film.mp4"), "1920x1080", 30)
+    await generator.aclose()
+
+    assert len(created) == 1 and created[0].closed
+
+
+@requires_ffmpeg
+async def test_composite_stream_copy_and_transcode(tmp_path: Path) -> None:
+    """Test both composition paths end to end with real clips."""
+    compositor = Compositor(max_workers=1)
+    first = make_clip(tmp_path / "a.mp4")
+    second = make_clip(tmp_path / "b.mp4")
+    odd = make_clip(tmp_path / "c.mp4", size="640x360", rate=30)
+
+    copied = await compositor.composite(
+        [str(first), str(second)], str(tmp_path / "copy.mp4"), "320x240", 24
+    )
+    transcoded = await compositor.composite(
+        [str(first), str(odd)], str(tmp_path / "transcode.mp4"), "320x240", 24
+    )
+    compositor.shutdown()
+
+    assert (copied, transcoded) == ("copy", "transcode")
+    assert probe(tmp_path / "transcode.mp4").width == 320
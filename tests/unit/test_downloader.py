@@ -0,0 +1,92 @@
+"""Unit tests for streaming clip downloads."""
+
+import hashlib
+from pathlib import Path
+
+import httpx
+import pytest
+
+from script_to_film.services.downloader import DownloadError, Downloader
+from tests.fakes.runway_api import FAKE_RUNWAY_URL, FakeRunway
+
+CLIP = bytes(range(256)) * 40
+CLIP_URL = f"{FAKE_RUNWAY_URL}/files/clip.mp4"
+
+
+def make_downloader(fake: FakeRunway) -> Downloader:
+    """Create a downloader with small chunks and no retry delay."""
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app))
+    return Downloader(client, chunk_size=1000, retry_delay=0.0)
+
+
+async def test_download_to_disk(tmp_path: Path) -> None:
+    """Test that a clip is written completely with its checksum."""
+    downloader = make_downloader(FakeRunway(video_bytes=CLIP))
+    destination = tmp_path / "clips" / "scene.mp4"
+
+    result = await downloader.download(CLIP_URL, destination)
+    await downloader.client.aclose()
+
+    assert destination.read_bytes() == CLIP
+    assert result.size == len(CLIP)
+    assert result.sha256 == hashlib.sha256(CLIP).hexdigest()
+    assert [path.name for path in destination.parent.iterdir()] == ["scene.mp4"]
+
+
+async def test_resumes_with_range_request(tmp_path: Path) -> None:
+    """Test that a truncated transfer resumes from the bytes already on disk."""
+    fake = FakeRunway(video_bytes=CLIP, truncate_downloads=1)
+    downloader = make_downloader(fake)
+    destination = tmp_path / "scene.mp4"
+
+    await downloader.download(
+        CLIP_URL, destination, expected_sha256=hashlib.sha256(CLIP).hexdigest()
+    )
+    await downloader.client.aclose()
+
+    assert destination.read_bytes() == CLIP
+    assert fake.range_requests == [f"bytes={len(CLIP) // 2}-"]
+
+
+async def test_restarts_when_range_ignored(tmp_path: Path) -> None:
+    """Test that a server without range support gets a full re-download."""
+    fake = FakeRunway(video_bytes=CLIP, truncate_downloads=1, support_ranges=False)
+    downloader = make_downloader(fake)
+    destination = tmp_path / "scene.mp4"
+
+    await downloader.download(CLIP_URL, destination)
+    await downloader.client.aclose()
+
+    assert destination.read_bytes() == CLIP
+
+
+async def test_retries_server_errors_only(tmp_path: Path) -> None:
+    """Test that a 503 from the file server is retried and a 404 fails at once."""
+    fake = FakeRunway(video_bytes=CLIP, unavailable_downloads=1)
+    downloader = make_downloader(fake)
+
+    await downloader.download(CLIP_URL, tmp_path / "scene.mp4")
+    downloads = len(fake.requests)
+    with pytest.raises(DownloadError, match="404"):
+        await downloader.download(f"{FAKE_RUNWAY_URL}/missing.mp4", tmp_path / "other.mp4")
+    await downloader.client.aclose()
+
+    assert (tmp_path / "scene.mp4").read_bytes() == CLIP
+    assert downloads == 2
+    assert len(fake.requests) == 3
+
+
+async def test_failed_download_leaves_nothing(tmp_path: Path) -> None:
+    """Test that exhausted retries and checksum mismatches leave no partial files."""
+    fake = FakeRunway(video_bytes=CLIP, truncate_downloads=10)
+    downloader = make_downloader(fake)
+    downloader.max_attempts = 2
+
+    with pytest.raises(DownloadError):
+        await downloader.download(CLIP_URL, tmp_path / "scene.mp4")
+    fake.truncate_downloads = 0
+    with pytest.raises(DownloadError, match="Checksum"):
+        await downloader.download(CLIP_URL, tmp_path / "scene.mp4", expected_sha256="0" * 64)
+    await downloader.client.aclose()
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,114 @@
+"""Unit tests for bulk script import."""
+
+import io
+import json
+import tarfile
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from script_to_film.cli import import_scripts
+from script_to_film.config.settings import settings
+from script_to_film.db import ScriptRepository
+from script_to_film.services.ingest import ScriptImporter, expand_archive, path_sources
+
+SCRIPT_CONTENT = b"""INT. COFFEE SHOP - DAY
+
+Sarah types on her laptop.
+
+EXT. PARK - NIGHT
+
+John walks alone.
+"""
+
+
+def make_tarball(files: dict[str, bytes]) -> bytes:
+    """Build a gzip-compressed tar archive in memory."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def test_path_sources_reads_directories(tmp_path: Path) -> None:
+    """Test that directories are walked, skipping archives and other files."""
+    (tmp_path / "drama").mkdir()
+    (tmp_path / "drama" / "reunion.txt").write_bytes(SCRIPT_CONTENT)
+    (tmp_path / "notes.pdf").write_bytes(b"%PDF")
+    (tmp_path / "archive.tgz").write_bytes(make_tarball({"heist.fountain": SCRIPT_CONTENT}))
+
+    assert [name for name, _ in path_sources(tmp_path)] == ["drama/reunion.txt"]
+
+
+def test_expand_archive_enforces_size_limits() -> None:
+    """Test that oversized members are reported unextracted and large archives rejected."""
+    archive = make_tarball({"short.txt": SCRIPT_CONTENT, "long.txt": SCRIPT_CONTENT * 10})
+    limit = len(SCRIPT_CONTENT)
+
+    sources, rejected = expand_archive("drafts.tgz", archive, limit, max_total_bytes=10 * limit)
+
+    assert sources == [("drafts.tgz/short.txt", SCRIPT_CONTENT)]
+    assert [result.name for result in rejected] == ["drafts.tgz/long.txt"]
+    with pytest.raises(ValueError):
+        expand_archive("drafts.tgz", archive, 10 * limit, max_total_bytes=5 * limit)
+
+
+async def test_ingest_stores_scripts_and_reports_failures(engine: AsyncEngine) -> None:
+    """Test that parsed scripts are inserted in batches and bad files reported."""
+    repository = ScriptRepository(engine)
+    importer = ScriptImporter(repository, max_workers=2, batch_size=2)
+    sources = [(f"script_{i}.txt", SCRIPT_CONTENT) for i in range(5)]
+    sources += [("latin1.txt", "CAFÉ".encode("latin-1")), ("notes.txt", b"Just notes.")]
+
+    try:
+        results = {result.name: result async for result in importer.ingest(sources)}
+    finally:
+        importer.shutdown()
+
+    assert len(results) == 7
+    assert "not UTF-8" in results["latin1.txt"].error
+    assert "No scene headings" in results["notes.txt"].error
+    stored = await repository.get(results["script_3.txt"].script_id)
+    assert stored.title == "script 3"
+    assert len(stored.scenes) == 2
+    assert sum(result.error is None for result in results.values()) == 5
+
+
+async def test_failed_insert_reports_its_batch(engine: AsyncEngine) -> None:
+    """Test that a batch whose insert fails is reported per script, not raised."""
+
+    class _BrokenRepository(ScriptRepository):
+        async def add_many(self, items):
+            raise RuntimeError("database is locked")
+
+    importer = ScriptImporter(_BrokenRepository(engine), batch_size=10, use_processes=False)
+    sources = [("a.txt", SCRIPT_CONTENT), ("b.txt", SCRIPT_CONTENT)]
+
+    results = [result async for result in importer.ingest(sources)]
+    importer.shutdown()
+
+    assert sorted(result.name for result in results) == ["a.txt", "b.txt"]
+    assert all("database is locked" in result.error for result in results)
+
+
+async def test_cli_import_applies_archive_limits(
+    engine: AsyncEngine, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys
+) -> None:
+    """Test that the import command expands tarballs within the upload size limits."""
+    monkeypatch.setattr(settings, "ingest_max_script_bytes", len(SCRIPT_CONTENT))
+    archive = tmp_path / "drafts.tgz"
+    archive.write_bytes(
+        make_tarball({"short.txt": SCRIPT_CONTENT, "long.txt": SCRIPT_CONTENT * 10})
+    )
+    importer = ScriptImporter(ScriptRepository(engine), use_processes=False)
+
+    failed = await import_scripts([archive], importer)
+
+    results = {line["name"]: line for line in map(json.loads, capsys.readouterr().out.splitlines())}
+    assert failed == 1
+    assert results["drafts.tgz/short.txt"]["script_id"] is not None
+    assert "larger than" in results["drafts.tgz/long.txt"]["error"]
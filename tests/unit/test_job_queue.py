@@ -0,0 +1,137 @@
+"""Unit tests for background render jobs."""
+
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from script_to_film.db import ScriptRepository, VideoRepository
+from script_to_film.models.script import Script, ScriptScene
+from script_to_film.models.video import Video, VideoScene, VideoStatus
+from script_to_film.services.artifacts import SceneCheckpoint
+from script_to_film.services.job_queue import (
+    CeleryJobQueue,
+    InProcessJobQueue,
+    JobQueue,
+    render_video_job,
+)
+from script_to_film.services.scene_scheduler import SceneScheduler
+from script_to_film.services.video_generator import Keyframe, VideoGenerator
+
+
+class StubGenerator(VideoGenerator):
+    """Generator that "renders" instantly, failing the scenes listed in ``fail``."""
+
+    def __init__(self, output_dir: str, fail: tuple[int, ...] = ()) -> None:
+        super().__init__(
+            output_dir=output_dir,
+            scene_scheduler=SceneScheduler(max_in_flight=2, max_in_flight_per_job=2),
+        )
+        self.fail = fail
+
+    async def request_keyframe(
+        self, scene: ScriptScene, scene_number: int, checkpoint: Optional[SceneCheckpoint] = None
+    ) -> Keyframe:
+        return Keyframe()
+
+    async def generate_scene_video_runway(
+        self,
+        scene: ScriptScene,
+        scene_number: int,
+        destination: Optional[Path] = None,
+        keyframe: Optional[Keyframe] = None,
+        checkpoint: Optional[SceneCheckpoint] = None,
+    ) -> Optional[VideoScene]:
+        if scene_number in self.fail:
+            return VideoScene(scene_number=scene_number, duration=5, status=VideoStatus.FAILED)
+        return VideoScene(
+            scene_number=scene_number,
+            visual_path=f"scene_{scene_number:03d}.mp4",
+            duration=5,
+            status=VideoStatus.COMPLETED,
+        )
+
+
+@pytest.fixture
+async def repositories(engine: AsyncEngine) -> tuple[ScriptRepository, VideoRepository]:
+    """Repositories holding one three-scene script and a pending video for it."""
+    scripts = ScriptRepository(engine)
+    videos = VideoRepository(engine)
+    await scripts.add(
+        Script(
+            id="script_1",
+            title="Test",
+            content="",
+            scenes=[
+                ScriptScene(scene_number=i + 1, location="ROOM", time_of_day="DAY", description="")
+                for i in range(3)
+            ],
+        )
+    )
+    await videos.add(
+        Video(
+            id="video_1",
+            script_id="script_1",
+            title="Test",
+            resolution="1920x1080",
+            fps=30,
+            scenes=[VideoScene(scene_number=i, duration=5) for i in range(3)],
+        )
+    )
+    return scripts, videos
+
+
+async def test_render_job_persists_scene_status(repositories, tmp_path) -> None:
+    """Test that a job records every scene and the final status."""
+    scripts, videos = repositories
+
+    await render_video_job("video_1", scripts, videos, StubGenerator(str(tmp_path), fail=(1,)))
+    video = await videos.get("video_1")
+
+    assert video.status == VideoStatus.FAILED
+    assert [s.status for s in video.scenes] == [
+        VideoStatus.COMPLETED,
+        VideoStatus.FAILED,
+        VideoStatus.COMPLETED,
+    ]
+
+
+async def test_in_process_queue(repositories, tmp_path) -> None:
+    """Test that the in-process backend renders the video in the background."""
+    scripts, videos = repositories
+    queue = InProcessJobQueue(scripts, videos, StubGenerator(str(tmp_path)))
+
+    await queue.enqueue("video_1", "job_1")
+    assert "job_1" in queue.jobs
+    await queue.join()
+
+    video = await videos.get("video_1")
+    assert video.status == VideoStatus.COMPLETED
+    assert video.duration == 15
+    assert not queue.jobs
+
+
+def test_queue_backend_must_implement_enqueue() -> None:
+    """Test that a backend without ``enqueue`` fails when constructed."""
+
+    class IncompleteQueue(JobQueue):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteQueue()
+
+
+async def test_celery_queue_publishes_task(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the Celery backend publishes the render task under the job ID."""
+    from script_to_film import tasks
+
+    published = []
+    monkeypatch.setattr(
+        tasks.render_video, "apply_async", lambda **kwargs: published.append(kwargs)
+    )
+
+    await CeleryJobQueue().enqueue("video_1", "job_1")
+
+    assert published == [{"args": ["video_1"], "task_id": "job_1"}]
+    assert tasks.app.conf.task_acks_late
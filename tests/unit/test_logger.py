@@ -0,0 +1,35 @@
+"""Unit tests for logging configuration."""
+
+import io
+import json
+
+from script_to_film.utils.logger import setup_logger
+
+
+def test_json_logs_carry_extra_fields() -> None:
+    """Test that JSON logs are one object per line with the fields passed in ``extra``."""
+    stream = io.StringIO()
+    logger = setup_logger("script_to_film.test_json", "DEBUG", fmt="json", stream=stream)
+
+    logger.info("Task %s created", "task_1", extra={"task_id": "task_1", "scene_number": 3})
+
+    entry = json.loads(stream.getvalue())
+    assert entry["message"] == "Task task_1 created"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "script_to_film.test_json"
+    assert entry["task_id"] == "task_1"
+    assert entry["scene_number"] == 3
+
+
+def test_setup_again_replaces_handler() -> None:
+    """Test that reconfiguring a logger redirects it instead of duplicating output."""
+    first, second = io.StringIO(), io.StringIO()
+    setup_logger("script_to_film.test_setup", stream=first)
+    logger = setup_logger("script_to_film.test_setup", "WARNING", stream=second)
+
+    logger.warning("Only once")
+    logger.info("Filtered")
+
+    assert first.getvalue() == ""
+    assert second.getvalue().count("Only once") == 1
+    assert "Filtered" not in second.getvalue()
@@ -0,0 +1,89 @@
+"""Unit tests for progressive HLS assembly."""
+
+from pathlib import Path
+
+import pytest
+
+from script_to_film.services import progressive
+from script_to_film.services.compositor import CompositionError, Compositor
+from script_to_film.services.progressive import (
+    ProgressiveAssembler,
+    Segment,
+    parse_media_playlist,
+    render_playlist,
+)
+from tests.unit.test_compositor import make_clip, requires_ffmpeg
+
+
+def fake_segment_clip(clip, output_dir, prefix, segment_seconds, ffmpeg="ffmpeg"):
+    """Pretend every clip splits into two segments."""
+    if "broken" in clip:
+        raise CompositionError("corrupt clip")
+    return [(f"{prefix}_000.ts", 4.0), (f"{prefix}_001.ts", 1.5)]
+
+
+@pytest.fixture
+def assembler(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ProgressiveAssembler:
+    """Assembler for a three-scene film with segmentation stubbed out."""
+    monkeypatch.setattr(progressive, "segment_clip", fake_segment_clip)
+    return ProgressiveAssembler(
+        tmp_path / "hls", scene_count=3, compositor=Compositor(max_workers=1, use_processes=False)
+    )
+
+
+def test_playlist_round_trip() -> None:
+    """Test rendering a playlist and reading its segments back."""
+    text = render_playlist(
+        [Segment("a.ts", 4.0), Segment("b.ts", 2.5, discontinuity=True)], ended=True
+    )
+
+    assert "#EXT-X-TARGETDURATION:4" in text
+    assert text.index("#EXT-X-DISCONTINUITY") < text.index("b.ts")
+    assert text.rstrip().endswith("#EXT-X-ENDLIST")
+    assert parse_media_playlist(text) == [("a.ts", 4.0), ("b.ts", 2.5)]
+
+
+async def test_scenes_appended_in_order(assembler: ProgressiveAssembler) -> None:
+    """Test that a scene finishing early waits for its predecessors."""
+    await assembler.add(1, "scene_001.mp4")
+    assert not assembler.playlist_path.exists()
+
+    await assembler.add(0, "scene_000.mp4")
+    playlist = assembler.playlist_path.read_text()
+    assert [uri for uri, _ in parse_media_playlist(playlist)] == [
+        "scene_000_000.ts",
+        "scene_000_001.ts",
+        "scene_001_000.ts",
+        "scene_001_001.ts",
+    ]
+    assert "#EXT-X-ENDLIST" not in playlist
+
+    await assembler.add(2, "scene_002.mp4")
+    assert assembler.complete
+    assert assembler.playlist_path.read_text().count("#EXT-X-DISCONTINUITY") == 2
+    assert "#EXT-X-ENDLIST" in assembler.playlist_path.read_text()
+
+
+async def test_failure_keeps_playable_prefix(assembler: ProgressiveAssembler) -> None:
+    """Test that a scene that cannot be segmented stops assembly after the prefix."""
+    await assembler.add(0, "scene_000.mp4")
+    await assembler.add(1, "broken.mp4")
+    await assembler.add(2, "scene_002.mp4")
+
+    assert assembler.assembled == 1
+    assert len(parse_media_playlist(assembler.playlist_path.read_text())) == 2
+
+
+@requires_ffmpeg
+async def test_segments_real_clips(tmp_path: Path) -> None:
+    """Test segmenting real clips with ffmpeg."""
+    compositor = Compositor(max_workers=1)
+    assembler = ProgressiveAssembler(tmp_path / "hls", scene_count=2, compositor=compositor)
+
+    for index in range(2):
+        await assembler.add(index, str(make_clip(tmp_path / f"scene_{index}.mp4")))
+    compositor.shutdown()
+
+    segments = parse_media_playlist(assembler.playlist_path.read_text())
+    assert segments
+    assert all((tmp_path / "hls" / uri).exists() for uri, _ in segments)
@@ -0,0 +1,177 @@
+"""Unit tests for the provider rate limiter."""
+
+import asyncio
+import email.utils
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from script_to_film.services.rate_limiter import (
+    Quota,
+    RateLimiter,
+    RedisBackend,
+    current_tenant,
+    parse_retry_after,
+)
+from script_to_film.services.resilience import ProviderUnavailableError
+from script_to_film.services.runway_client import RunwayClient
+from tests.fakes.runway_api import FAKE_RUNWAY_URL, FakeRunway
+
+
+async def _timed(limiter: RateLimiter, calls: int, **scope: Any) -> float:
+    """Seconds taken to pass ``calls`` acquisitions through the limiter."""
+    started = time.perf_counter()
+    for _ in range(calls):
+        async with limiter.acquire("runway", **scope):
+            pass
+    return time.perf_counter() - started
+
+
+async def test_burst_then_steady_rate() -> None:
+    """Test that the bucket allows a burst and then paces calls at the rate."""
+    limiter = RateLimiter({"runway": Quota(rate=50, burst=3)})
+
+    assert await _timed(limiter, 3) < 0.02
+    assert await _timed(limiter, 3) >= 0.05
+
+
+async def test_model_and_tenant_scopes() -> None:
+    """Test that model and tenant quotas only apply to their own calls."""
+    limiter = RateLimiter(
+        {
+            "runway": Quota(rate=1000, burst=100),
+            "runway:gen4_image": Quota(rate=20, burst=1),
+            "runway@acme": Quota(rate=20, burst=1),
+        }
+    )
+
+    assert await _timed(limiter, 3, model="gen3a_turbo") < 0.02
+    assert await _timed(limiter, 3, model="gen4_image") >= 0.09
+
+    token = current_tenant.set("acme")
+    try:
+        assert await _timed(limiter, 3) >= 0.09
+    finally:
+        current_tenant.reset(token)
+
+
+async def test_concurrency_cap_and_queue_depth() -> None:
+    """Test that in-flight calls are capped and waiting calls are counted."""
+    limiter = RateLimiter({"runway": Quota(rate=1000, burst=100, concurrency=2)})
+    peak = 0
+    depth = 0
+
+    async def call() -> None:
+        nonlocal peak, depth
+        async with limiter.acquire("runway"):
+            await asyncio.sleep(0.01)
+            stats = limiter.stats()["runway"]
+            peak = max(peak, stats.in_flight)
+            depth = max(depth, stats.waiting)
+
+    await asyncio.gather(*(call() for _ in range(5)))
+
+    assert peak == 2
+    assert depth == 3
+    assert limiter.stats()["runway"].in_flight == 0
+
+
+async def test_throttle_pauses_every_caller() -> None:
+    """Test that a reported 429 holds back calls for the Retry-After delay."""
+    limiter = RateLimiter({"runway": Quota(rate=1000, burst=100)})
+
+    await limiter.throttle("runway", retry_after=0.05)
+
+    assert await _timed(limiter, 1) >= 0.045
+    assert limiter.stats()["runway"].throttled == 1
+
+
+async def test_unconfigured_provider_is_not_limited() -> None:
+    """Test that calls outside every configured scope pass straight through."""
+    limiter = RateLimiter({"anthropic": Quota(rate=1, burst=1)})
+
+    assert await _timed(limiter, 20) < 0.02
+    assert limiter.stats() == {}
+
+
+def test_parse_retry_after() -> None:
+    """Test delay-seconds, HTTP-date and missing Retry-After values."""
+    in_ten = email.utils.formatdate(time.time() + 10, usegmt=True)
+
+    assert parse_retry_after("2.5") == 2.5
+    assert 8 < parse_retry_after(in_ten) <= 10
+    assert parse_retry_after(None, default=3.0) == 3.0
+    assert parse_retry_after("soon") == 1.0
+
+
+async def test_runway_client_waits_out_429() -> None:
+    """Test that throttled Runway calls are retried and reported to the limiter."""
+    fake = FakeRunway(throttle_requests=2, retry_after="0.02")
+    limiter = RateLimiter({"runway": Quota(rate=1000, burst=100)})
+    client = RunwayClient(
+        api_secret="secret",
+        base_url=FAKE_RUNWAY_URL,
+        transport=httpx.ASGITransport(app=fake.app),
+        limiter=limiter,
+    )
+
+    task_id = await client.create_text_to_image(prompt_text="A coffee shop")
+    await client.aclose()
+
+    assert task_id in fake.tasks
+    assert limiter.stats()["runway"].throttled == 2
+
+
+async def test_runway_client_gives_up_after_retries() -> None:
+    """Test that persistent throttling surfaces as an unavailable provider."""
+    fake = FakeRunway(throttle_requests=100)
+    client = RunwayClient(
+        api_secret="secret",
+        base_url=FAKE_RUNWAY_URL,
+        transport=httpx.ASGITransport(app=fake.app),
+        limiter=RateLimiter({}),
+    )
+
+    with pytest.raises(ProviderUnavailableError) as exc_info:
+        await client.get_task("task_1")
+    await client.aclose()
+
+    assert exc_info.value.__cause__.status_code == 429
+    assert client.resilience.breaker.state == "closed"
+
+
+class _ScriptedRedis:
+    """Stand-in Redis client replaying ``eval`` results."""
+
+    def __init__(self, results: list[Any]) -> None:
+        self.results = results
+        self.calls: list[tuple[Any, ...]] = []
+        self.removed: list[str] = []
+
+    async def eval(self, script: str, numkeys: int, *args: Any) -> Any:
+        self.calls.append(args)
+        return self.results.pop(0)
+
+    async def zrem(self, key: str, member: str) -> None:
+        self.removed.append(key)
+
+    async def aclose(self) -> None:
+        pass
+
+
+async def test_redis_backend_waits_for_slot_and_tokens() -> None:
+    """Test that the Redis backend polls for a slot and sleeps out the bucket wait."""
+    redis = _ScriptedRedis([0, 1, "0.01", "0"])
+    limiter = RateLimiter(
+        {"runway": Quota(rate=10, burst=1, concurrency=1)},
+        backend=RedisBackend("redis://unused", poll_interval=0.0, client=redis),
+    )
+
+    async with limiter.acquire("runway"):
+        pass
+
+    assert len(redis.calls) == 4
+    assert redis.calls[2][:2] == ("script-to-film:ratelimit:bucket:runway", 1.0)
+    assert redis.removed == ["script-to-film:ratelimit:slots:runway"]
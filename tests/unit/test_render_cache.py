@@ -0,0 +1,121 @@
+"""Unit tests for the render cache and render deduplication."""
+
+import asyncio
+import os
+from pathlib import Path
+
+from script_to_film.models.script import ScriptScene
+from script_to_film.models.video import VideoStatus
+from script_to_film.services.render_cache import RenderCache
+from tests.fakes.runway_api import FakeRunway
+from tests.unit.test_runway_client import make_generator
+
+
+def make_scene(duration: float = 6) -> ScriptScene:
+    """A scene with a fixed video prompt."""
+    return ScriptScene(
+        scene_number=0,
+        location="PARK",
+        time_of_day="EVENING",
+        description="",
+        duration_seconds=duration,
+        video_prompt="Wide angle establishing shot: Exterior of park during evening.",
+    )
+
+
+def store_clip(cache: RenderCache, key: str, data: bytes) -> Path:
+    """Add a clip the way a render does: download into place, then enforce the budget."""
+    path = cache.clip_path(key)
+    path.write_bytes(data)
+    cache.evict(keep=path)
+    return path
+
+
+def test_key_is_order_independent() -> None:
+    """Test that keys depend on parameter values, not keyword order."""
+    assert RenderCache.key(prompt="a", duration=5) == RenderCache.key(duration=5, prompt="a")
+    assert RenderCache.key(prompt="a", duration=5) != RenderCache.key(prompt="a", duration=6)
+
+
+def test_fetch_clip(tmp_path: Path) -> None:
+    """Test storing a clip and materializing it elsewhere."""
+    cache = RenderCache(tmp_path / "cache", max_bytes=1000, image_ttl_seconds=60)
+    destination = tmp_path / "out" / "scene_000.mp4"
+
+    assert not cache.fetch_clip("k", destination)
+    store_clip(cache, "k", b"clip")
+
+    assert cache.fetch_clip("k", destination)
+    assert destination.read_bytes() == b"clip"
+    assert (cache.clip_stats.hits, cache.clip_stats.misses) == (1, 1)
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Test that the disk budget evicts the oldest-used clips first."""
+    cache = RenderCache(tmp_path, max_bytes=25, image_ttl_seconds=60)
+    for age, key in enumerate(["old", "used", "mid"]):
+        path = store_clip(cache, key, b"x" * 10)
+        os.utime(path, (1000 + age, 1000 + age))
+    cache.fetch_clip("used", tmp_path / "scene.mp4")
+
+    store_clip(cache, "new", b"x" * 10)
+
+    remaining = sorted(path.stem for path in cache.clips_dir.glob("*.mp4"))
+    assert remaining == ["new", "used"]
+    assert cache.size_bytes() <= 25
+
+
+def test_hits_leave_clip_mtime_alone(tmp_path: Path) -> None:
+    """Test that a hit does not touch the clip, which is hard-linked into job directories."""
+    cache = RenderCache(tmp_path / "cache", max_bytes=1000, image_ttl_seconds=60)
+    path = store_clip(cache, "k", b"clip")
+    os.utime(path, (1000, 1000))
+
+    cache.fetch_clip("k", tmp_path / "out" / "scene_000.mp4")
+
+    assert path.stat().st_mtime == 1000
+    assert (tmp_path / "out" / "scene_000.mp4").stat().st_mtime == 1000
+
+
+def test_image_urls_expire(tmp_path: Path) -> None:
+    """Test the keyframe image URL TTL."""
+    cache = RenderCache(tmp_path, max_bytes=1000, image_ttl_seconds=0)
+    cache.put_image("k", "https://example.com/image.png")
+
+    assert cache.get_image("k") is None
+    cache.image_ttl_seconds = 60
+    cache.put_image("k", "https://example.com/image.png")
+    assert cache.get_image("k") == "https://example.com/image.png"
+
+
+async def test_concurrent_identical_renders_share_one_runway_job(tmp_path: Path) -> None:
+    """Test single-flight deduplication of identical scene renders."""
+    fake = FakeRunway(polls_until_done=2)
+    generator = make_generator(fake, tmp_path)
+
+    first, second = await asyncio.gather(
+        generator.generate_scene_video_runway(make_scene(), 0),
+        generator.generate_scene_video_runway(make_scene(), 1),
+    )
+
+    assert first.status == second.status == VideoStatus.COMPLETED
+    assert Path(first.visual_path).read_bytes() == Path(second.visual_path).read_bytes()
+    assert len(fake.tasks) == 2  # one text-to-image and one image-to-video task
+    await generator.aclose()
+
+
+async def test_repeated_render_is_served_from_cache(tmp_path: Path) -> None:
+    """Test that clips and keyframe images are reused across requests."""
+    fake = FakeRunway()
+    generator = make_generator(fake, tmp_path)
+
+    await generator.generate_scene_video_runway(make_scene(), 0)
+    cached = await generator.generate_scene_video_runway(make_scene(), 0)
+    assert cached.status == VideoStatus.COMPLETED
+    assert len(fake.tasks) == 2
+
+    # A new duration needs a new clip, but the keyframe image is reused
+    await generator.generate_scene_video_runway(make_scene(duration=8), 0)
+    kinds = [task.kind for task in fake.tasks.values()]
+    assert kinds == ["text_to_image", "image_to_video", "image_to_video"]
+    await generator.aclose()
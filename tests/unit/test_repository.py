@@ -0,0 +1,156 @@
+"""Unit tests for the script and video repositories."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from script_to_film.db import (
+    InvalidCursorError,
+    ScriptRepository,
+    VideoRepository,
+    create_engine,
+    init_db,
+)
+from script_to_film.models.script import Script, ScriptScene
+from script_to_film.models.video import Video, VideoScene, VideoStatus
+
+
+def make_script(index: int, scene_count: int = 2, status: str = "draft") -> Script:
+    """Create a script whose creation time increases with ``index``."""
+    created_at = datetime(2024, 1, 1) + timedelta(minutes=index)
+    return Script(
+        id=f"script_{index:03d}",
+        title=f"Script {index}",
+        content="INT. ROOM - DAY",
+        status=status,
+        scenes=[
+            ScriptScene(
+                scene_number=n,
+                location="ROOM",
+                time_of_day="DAY",
+                description="Action.",
+                dialogue=[{"character": "SARAH", "line": "Hi."}],
+                video_prompt="Wide shot.",
+            )
+            for n in range(1, scene_count + 1)
+        ],
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+async def test_script_round_trip(engine: AsyncEngine) -> None:
+    """Test that a stored script and its scenes load back unchanged."""
+    repository = ScriptRepository(engine)
+    script = make_script(1)
+
+    await repository.add(script)
+    loaded = await repository.get(script.id)
+
+    assert loaded == script
+    assert await repository.get("missing") is None
+
+
+async def test_scenes_inserted_in_one_batch(engine: AsyncEngine) -> None:
+    """Test that scene rows of many scripts are written with a single statement."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    await ScriptRepository(engine).add_many([make_script(i, scene_count=5) for i in range(4)])
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    inserts = [s for s in statements if s.startswith("INSERT INTO script_scenes")]
+    assert len(inserts) == 1
+
+
+async def test_keyset_pagination(engine: AsyncEngine) -> None:
+    """Test that pages walk newest first without gaps or repeats."""
+    repository = ScriptRepository(engine)
+    await repository.add_many([make_script(i, scene_count=i % 3) for i in range(7)])
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page, cursor = await repository.list_page(limit=3, cursor=cursor)
+        seen.extend(script.id for script in page)
+        if cursor is None:
+            break
+
+    assert seen == [f"script_{i:03d}" for i in reversed(range(7))]
+    first, _ = await repository.list_page(limit=1)
+    assert first[0].scene_count == 6 % 3
+
+
+async def test_list_filters_by_status(engine: AsyncEngine) -> None:
+    """Test the status filter on the script listing."""
+    repository = ScriptRepository(engine)
+    await repository.add_many([make_script(1), make_script(2, status="final")])
+
+    page, cursor = await repository.list_page(status="final")
+
+    assert [script.id for script in page] == ["script_002"]
+    assert cursor is None
+
+
+async def test_invalid_cursor(engine: AsyncEngine) -> None:
+    """Test that a malformed cursor is rejected."""
+    with pytest.raises(InvalidCursorError):
+        await ScriptRepository(engine).list_page(cursor="not-a-cursor")
+
+
+async def test_video_scene_updates(engine: AsyncEngine) -> None:
+    """Test storing a video and updating individual scenes."""
+    await ScriptRepository(engine).add(make_script(1))
+    repository = VideoRepository(engine)
+    video = Video(
+        id="video_1",
+        script_id="script_001",
+        title="Script 1",
+        resolution="1920x1080",
+        fps=30,
+        scenes=[VideoScene(scene_number=n, duration=5) for n in (1, 2)],
+    )
+    await repository.add(video)
+    video.status = VideoStatus.PROCESSING
+    await repository.save(video)
+
+    await repository.save_scene(
+        "video_1",
+        VideoScene(
+            scene_number=2, visual_path="scene_002.mp4", duration=5, status=VideoStatus.COMPLETED
+        ),
+    )
+    loaded = await repository.get("video_1")
+    processing, _ = await repository.list_page(status=VideoStatus.PROCESSING)
+
+    assert loaded.status == VideoStatus.PROCESSING
+    assert [s.status for s in loaded.scenes] == [VideoStatus.PENDING, VideoStatus.COMPLETED]
+    assert loaded.scenes[1].visual_path == "scene_002.mp4"
+    assert [v.id for v in processing] == ["video_1"]
+
+
+async def test_init_db_adds_missing_columns() -> None:
+    """Test that a table created before a column was added gains that column."""
+    engine = create_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "CREATE TABLE video_scenes (video_id VARCHAR(64) NOT NULL, "
+            "scene_number INTEGER NOT NULL, visual_path TEXT, audio_path TEXT, "
+            "duration FLOAT NOT NULL, status VARCHAR(32) NOT NULL, "
+            "PRIMARY KEY (video_id, scene_number))"
+        )
+
+    await init_db(engine)
+    await init_db(engine)
+
+    async with engine.connect() as conn:
+        columns = await conn.run_sync(
+            lambda sync_conn: {c["name"] for c in inspect(sync_conn).get_columns("video_scenes")}
+        )
+    await engine.dispose()
+    assert {"thumbnail_path", "preview_path", "error"} <= columns
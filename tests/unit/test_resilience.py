@@ -0,0 +1,143 @@
+"""Unit tests for provider retries and circuit breaking."""
+
+import time
+
+import httpx
+import pytest
+
+from script_to_film.models.script import ScriptScene
+from script_to_film.models.video import VideoStatus
+from script_to_film.services.resilience import (
+    CircuitBreaker,
+    ProviderUnavailableError,
+    Resilience,
+    is_retryable,
+)
+from script_to_film.services.runway_client import RunwayAPIError, RunwayClient
+from script_to_film.services.task_poller import TaskPoller
+from script_to_film.services.video_generator import VideoGenerator
+from tests.fakes.runway_api import FAKE_RUNWAY_URL, FakeRunway
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_policy(threshold: int = 2, attempts: int = 3, clock: _Clock = None) -> Resilience:
+    """Create a retry policy with no backoff and its own breaker."""
+    breaker = CircuitBreaker(failure_threshold=threshold, reset_timeout=10, clock=clock or _Clock())
+    return Resilience("runway", breaker, max_attempts=attempts, initial_delay=0)
+
+
+def make_client(fake: FakeRunway, resilience: Resilience) -> RunwayClient:
+    """Create a Runway client wired to a fake server and a given policy."""
+    return RunwayClient(
+        api_secret="secret",
+        base_url=FAKE_RUNWAY_URL,
+        transport=httpx.ASGITransport(app=fake.app),
+        resilience=resilience,
+    )
+
+
+def test_error_classification() -> None:
+    """Test which errors are worth retrying."""
+    assert is_retryable(httpx.ConnectError("refused"))
+    assert is_retryable(RunwayAPIError("throttled", status_code=429))
+    assert is_retryable(RunwayAPIError("bad gateway", status_code=502))
+    assert not is_retryable(RunwayAPIError("bad request", status_code=400))
+    assert not is_retryable(ValueError("bug"))
+    assert not is_retryable(ProviderUnavailableError("runway", "down"))
+
+
+def test_breaker_opens_then_probes() -> None:
+    """Test the closed, open and half-open transitions."""
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.allow()
+    assert not breaker.allow()  # one probe at a time
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.retry_after() == 10
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+async def test_transient_errors_are_retried() -> None:
+    """Test that 5xx responses are retried until the request goes through."""
+    fake = FakeRunway(unavailable_requests=2)
+    client = make_client(fake, make_policy(threshold=5))
+
+    task_id = await client.create_text_to_image(prompt_text="A coffee shop")
+    await client.aclose()
+
+    assert task_id in fake.tasks
+    assert client.resilience.breaker.state == "closed"
+
+
+async def test_open_circuit_fails_fast() -> None:
+    """Test that once Runway is marked down, calls fail without reaching it."""
+    fake = FakeRunway(unavailable_requests=100)
+    client = make_client(fake, make_policy(threshold=2, attempts=3))
+
+    with pytest.raises(ProviderUnavailableError):
+        await client.create_text_to_image(prompt_text="A coffee shop")
+    requests = len(fake.requests)
+    with pytest.raises(ProviderUnavailableError) as exc_info:
+        await client.get_task("task_1")
+    await client.aclose()
+
+    assert requests == 2
+    assert len(fake.requests) == requests
+    assert exc_info.value.retry_after == 10
+
+
+async def test_poll_fails_wait_when_provider_down() -> None:
+    """Test that waiters stop waiting for tasks once Runway is unavailable."""
+    fake = FakeRunway(polls_until_done=100)
+    client = make_client(fake, make_policy(threshold=1, attempts=1))
+    poller = TaskPoller(client, initial_interval=0.005, rng=lambda: 0.5)
+
+    task_id = await client.create_text_to_image(prompt_text="A park")
+    fake.unavailable_requests = 100
+    with pytest.raises(ProviderUnavailableError):
+        await poller.wait(task_id, deadline=time.monotonic() + 5)
+    await client.aclose()
+
+
+async def test_scene_reports_why_it_failed(tmp_path) -> None:
+    """Test that a scene rendered while Runway is down fails at once with a reason."""
+    fake = FakeRunway()
+    policy = make_policy(threshold=1)
+    policy.breaker.record_failure()
+    generator = VideoGenerator(output_dir=str(tmp_path), runway_client=make_client(fake, policy))
+    scene = ScriptScene(
+        scene_number=0,
+        location="PARK",
+        time_of_day="DAY",
+        description="",
+        video_prompt="A sunny park",
+    )
+
+    result = await generator.generate_scene_video_runway(scene, 0)
+    await generator.aclose()
+
+    assert result.status == VideoStatus.FAILED
+    assert "circuit open" in result.error
+    assert fake.requests == []
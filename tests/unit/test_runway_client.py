@@ -0,0 +1,152 @@
+"""Unit tests for the async Runway client against the fake Runway server."""
+
+import asyncio
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from script_to_film.models.script import Script, ScriptScene
+from script_to_film.models.video import VideoStatus
+from script_to_film.services.runway_client import RunwayAPIError, RunwayClient
+from script_to_film.services.scene_scheduler import SceneScheduler
+from script_to_film.services.task_poller import TaskPoller
+from script_to_film.services.video_generator import VideoGenerator
+from tests.fakes.runway_api import FAKE_RUNWAY_URL, FakeRunway
+
+
+def make_client(fake: FakeRunway, api_secret: str = "secret") -> RunwayClient:
+    """Create a Runway client wired to a fake server."""
+    return RunwayClient(
+        api_secret=api_secret,
+        base_url=FAKE_RUNWAY_URL,
+        transport=httpx.ASGITransport(app=fake.app),
+    )
+
+
+def make_generator(fake: FakeRunway, output_dir: Path) -> VideoGenerator:
+    """Create a video generator that polls the fake server without delay."""
+    client = make_client(fake)
+    return VideoGenerator(
+        output_dir=str(output_dir),
+        runway_client=client,
+        task_poller=TaskPoller(client, initial_interval=0.0, max_interval=0.0),
+    )
+
+
+@pytest.fixture
+def scene() -> ScriptScene:
+    """A scene with a video prompt."""
+    return ScriptScene(
+        scene_number=0,
+        location="COFFEE SHOP",
+        time_of_day="DAY",
+        description="Sarah types on her laptop.",
+        duration_seconds=6,
+        video_prompt="Medium shot: Interior of coffee shop during day.",
+    )
+
+
+async def test_task_lifecycle() -> None:
+    """Test creating a task and polling it to completion."""
+    fake = FakeRunway(polls_until_done=2)
+    client = make_client(fake)
+
+    task_id = await client.create_text_to_image(prompt_text="A coffee shop")
+    first = await client.get_task(task_id)
+    second = await client.get_task(task_id)
+    await client.aclose()
+
+    assert first.status == "RUNNING"
+    assert second.status == "SUCCEEDED"
+    assert second.output[0].endswith(f"{task_id}.png")
+    assert fake.tasks[task_id].payload["promptText"] == "A coffee shop"
+
+
+async def test_api_error_raised() -> None:
+    """Test that error responses surface as RunwayAPIError."""
+    client = make_client(FakeRunway(api_secret="secret"), api_secret="wrong")
+
+    with pytest.raises(RunwayAPIError) as exc_info:
+        await client.create_text_to_image(prompt_text="A coffee shop")
+    await client.aclose()
+
+    assert exc_info.value.status_code == 401
+
+
+async def test_generate_scene_video(tmp_path: Path, scene: ScriptScene) -> None:
+    """Test the two-step render against the fake server."""
+    fake = FakeRunway()
+    generator = make_generator(fake, tmp_path)
+
+    video_scene = await generator.generate_scene_video_runway(scene, 0)
+    await generator.aclose()
+
+    assert video_scene is not None
+    assert video_scene.status == VideoStatus.COMPLETED
+    assert Path(video_scene.visual_path).read_bytes() == fake.video_bytes
+    kinds = [task.kind for task in fake.tasks.values()]
+    assert kinds == ["text_to_image", "image_to_video"]
+
+
+async def test_generate_scene_video_failure(tmp_path: Path, scene: ScriptScene) -> None:
+    """Test that a failed Runway task yields a failed scene."""
+    generator = make_generator(FakeRunway(fail_kind="image_to_video"), tmp_path)
+
+    video_scene = await generator.generate_scene_video_runway(scene, 0)
+    await generator.aclose()
+
+    assert video_scene.status == VideoStatus.FAILED
+    assert video_scene.visual_path is None
+
+
+async def test_render_does_not_block_event_loop(tmp_path: Path, scene: ScriptScene) -> None:
+    """Test that other coroutines keep running while Runway calls are slow."""
+    generator = make_generator(FakeRunway(response_delay=0.05), tmp_path)
+    lags: list[float] = []
+
+    async def heartbeat() -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - started)
+
+    ticker = asyncio.create_task(heartbeat())
+    await generator.generate_scene_video_runway(scene, 0)
+    ticker.cancel()
+    await generator.aclose()
+
+    assert len(lags) > 10
+    assert max(lags) < 0.05
+
+
+async def test_keyframes_requested_up_front(tmp_path: Path) -> None:
+    """Test that every scene's image task starts before the video stage frees up."""
+    fake = FakeRunway(polls_until_done=2)
+    generator = make_generator(fake, tmp_path)
+    generator.scene_scheduler = SceneScheduler(max_in_flight=1, max_in_flight_per_job=1)
+    script = Script(
+        id="script_1",
+        title="Test",
+        content="",
+        scenes=[
+            ScriptScene(
+                scene_number=i,
+                location="ROOM",
+                time_of_day="DAY",
+                description="",
+                duration_seconds=5,
+                video_prompt=f"Shot {i}",
+            )
+            for i in range(3)
+        ],
+    )
+
+    video = await generator.generate_from_script(script)
+    await generator.aclose()
+
+    assert video.status == VideoStatus.COMPLETED
+    kinds = [task.kind for task in fake.tasks.values()]
+    assert kinds[:3] == ["text_to_image"] * 3
+    assert kinds.count("image_to_video") == 3
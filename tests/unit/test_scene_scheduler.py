@@ -0,0 +1,165 @@
+"""Unit tests for the scene scheduler and concurrent script rendering."""
+
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from script_to_film.models.script import Script, ScriptScene
+from script_to_film.models.video import VideoScene, VideoStatus
+from script_to_film.services.artifacts import SceneCheckpoint
+from script_to_film.services.scene_scheduler import SceneProgress, SceneScheduler
+from script_to_film.services.video_generator import Keyframe, VideoGenerator
+
+
+class _ConcurrencyProbe:
+    """Worker that records how many calls overlap."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, index: int, delay: float) -> int:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(delay)
+        self.active -= 1
+        return index
+
+
+async def test_results_keep_input_order() -> None:
+    """Test that results come back in input order even when later items finish first."""
+    scheduler = SceneScheduler(max_in_flight=4, max_in_flight_per_job=4)
+    probe = _ConcurrencyProbe()
+
+    results = await scheduler.run([0.03, 0.02, 0.01, 0.0], probe)
+
+    assert results == [0, 1, 2, 3]
+
+
+async def test_per_job_limit() -> None:
+    """Test that a job never exceeds its own concurrency limit."""
+    scheduler = SceneScheduler(max_in_flight=10, max_in_flight_per_job=2)
+    probe = _ConcurrencyProbe()
+
+    await scheduler.run([0.01] * 6, probe)
+
+    assert probe.peak == 2
+
+
+async def test_global_limit_spans_jobs() -> None:
+    """Test that the process-wide limit is shared by concurrent jobs."""
+    scheduler = SceneScheduler(max_in_flight=3, max_in_flight_per_job=3)
+    probe = _ConcurrencyProbe()
+
+    await asyncio.gather(scheduler.run([0.01] * 4, probe), scheduler.run([0.01] * 4, probe))
+
+    assert probe.peak == 3
+    assert scheduler.in_flight == 0
+
+
+async def test_progress_reported_per_item() -> None:
+    """Test that progress is reported once per completed item."""
+    scheduler = SceneScheduler(max_in_flight=2, max_in_flight_per_job=2)
+    updates: list[SceneProgress] = []
+
+    async def record(progress: SceneProgress) -> None:
+        updates.append(progress)
+
+    await scheduler.run([0.0, 0.0, 0.0], _ConcurrencyProbe(), on_progress=record)
+
+    assert [u.completed for u in updates] == [1, 2, 3]
+    assert sorted(u.index for u in updates) == [0, 1, 2]
+    assert all(u.total == 3 for u in updates)
+
+
+async def test_failing_progress_callback_does_not_cancel_scenes() -> None:
+    """Test that an error from the progress callback leaves the other scenes running."""
+    scheduler = SceneScheduler(max_in_flight=3, max_in_flight_per_job=3)
+    reported: list[int] = []
+
+    async def flaky(progress: SceneProgress) -> None:
+        if progress.index == 0:
+            raise OSError("disk full")
+        reported.append(progress.index)
+
+    results = await scheduler.run([0.0, 0.02, 0.04], _ConcurrencyProbe(), on_progress=flaky)
+
+    assert results == [0, 1, 2]
+    assert reported == [1, 2]
+
+
+def test_invalid_limits() -> None:
+    """Test that non-positive limits are rejected."""
+    with pytest.raises(ValueError):
+        SceneScheduler(max_in_flight=0, max_in_flight_per_job=1)
+
+
+async def test_generate_from_script_renders_concurrently(tmp_path) -> None:
+    """Test that scenes render in parallel and keep script order."""
+    probe = _ConcurrencyProbe()
+
+    class _StubGenerator(VideoGenerator):
+        async def request_keyframe(
+            self,
+            scene: ScriptScene,
+            scene_number: int,
+            checkpoint: Optional[SceneCheckpoint] = None,
+        ) -> Keyframe:
+            return Keyframe()
+
+        async def generate_scene_video_runway(
+            self,
+            scene: ScriptScene,
+            scene_number: int,
+            destination: Optional[Path] = None,
+            keyframe: Optional[Keyframe] = None,
+            checkpoint: Optional[SceneCheckpoint] = None,
+        ) -> Optional[VideoScene]:
+            await probe(scene_number, 0.01 * (3 - scene_number))
+            return VideoScene(scene_number=scene_number, duration=5, status=VideoStatus.COMPLETED)
+
+    generator = _StubGenerator(
+        output_dir=str(tmp_path),
+        scene_scheduler=SceneScheduler(max_in_flight=4, max_in_flight_per_job=3),
+    )
+    script = Script(
+        id="script_1",
+        title="Test",
+        content="",
+        scenes=[
+            ScriptScene(scene_number=i, location="ROOM", time_of_day="DAY", description="")
+            for i in range(3)
+        ],
+    )
+
+    video = await generator.generate_from_script(script)
+
+    assert probe.peak == 3
+    assert [s.scene_number for s in video.scenes] == [0, 1, 2]
+    assert video.status == VideoStatus.COMPLETED
+    assert video.duration == 15
+
+
+async def test_prepare_stage_runs_ahead() -> None:
+    """Test that every item is prepared up front and enters the main stage when ready."""
+    scheduler = SceneScheduler(max_in_flight=1, max_in_flight_per_job=1, max_preparing=8)
+    started: list[int] = []
+    preparing: list[int] = []
+
+    async def prepare(index: int, delay: float) -> int:
+        preparing.append(scheduler.preparing)
+        await asyncio.sleep(delay)
+        return index
+
+    async def work(index: int, prepared: int) -> int:
+        started.append(prepared)
+        await asyncio.sleep(0.01)
+        return prepared
+
+    results = await scheduler.run([0.03, 0.0, 0.015], work, prepare=prepare)
+
+    assert results == [0, 1, 2]
+    assert preparing == [1, 2, 3]
+    assert started == [1, 2, 0]
@@ -1,8 +1,10 @@
 """Unit tests for script parser."""
 
+import time
+
 import pytest
 
-from script_to_film.services.script_parser import ScriptParser
+from script_to_film.services.script_parser import LineKind, ScriptParser
 
 
 @pytest.fixture
@@ -105,3 +107,122 @@ def test_empty_script(script_parser: ScriptParser) -> None:
     assert script.title == "Empty Script"
     assert len(script.scenes) == 0
     assert script.total_duration is None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 10_000])
+def test_incremental_matches_parse(
+    script_parser: ScriptParser, sample_script: str, chunk_size: int
+) -> None:
+    """Test that chunk-fed parsing yields the same scenes as parsing the whole text."""
+    incremental = script_parser.incremental(keep_content=True)
+    scenes = []
+    for start in range(0, len(sample_script), chunk_size):
+        scenes.extend(incremental.feed(sample_script[start : start + chunk_size]))
+    scenes.extend(incremental.close())
+
+    assert scenes == script_parser.parse(sample_script, "Test Script").scenes
+    assert incremental.content == sample_script
+
+
+def test_incremental_emits_scene_when_next_heading_arrives(
+    script_parser: ScriptParser, sample_script: str
+) -> None:
+    """Test that a scene is emitted as soon as the following heading is complete."""
+    heading = "EXT. PARK - EVENING\n"
+    before, after = sample_script.split(heading)
+    incremental = script_parser.incremental()
+
+    assert list(incremental.feed(before)) == []
+    first = list(incremental.feed(heading))
+
+    assert [scene.location for scene in first] == ["COFFEE SHOP"]
+    rest = [*incremental.feed(after), *incremental.close()]
+    assert [scene.location for scene in rest] == ["PARK"]
+
+
+def test_iter_scenes_from_file(script_parser: ScriptParser, sample_script: str, tmp_path) -> None:
+    """Test lazily parsing a script file read in fixed-size chunks."""
+    path = tmp_path / "script.txt"
+    path.write_text(sample_script)
+
+    with path.open() as script_file:
+        scenes = list(script_parser.iter_scenes(iter(lambda: script_file.read(16), "")))
+
+    assert scenes == script_parser.parse(sample_script, "Test Script").scenes
+
+
+def test_incremental_edge_cases(script_parser: ScriptParser) -> None:
+    """Test preamble text, CRLF line endings, bold headings and a missing final newline."""
+    content = (
+        "FADE IN:\r\n**INT. HOUSE - DAY**\r\nRain.\r\nMOM\r\n(softly)\r\nHush.\r\n"
+        "EXT. GARDEN - NIGHT - CONTINUOUS\r\nCrickets."
+    )
+    whole = script_parser.parse(content, "Edge Cases").scenes
+    incremental = script_parser.incremental()
+    chunked = [scene for char in content for scene in incremental.feed(char)]
+    chunked.extend(incremental.close())
+
+    assert chunked == whole
+    assert [(s.location, s.time_of_day) for s in whole] == [
+        ("HOUSE", "DAY"),
+        ("GARDEN - NIGHT", "CONTINUOUS"),
+    ]
+    assert whole[0].dialogue == [{"character": "MOM", "line": "Hush."}]
+    assert whole[0].description == "Rain."
+
+
+@pytest.mark.parametrize(
+    ("line", "after_cue", "kind"),
+    [
+        ("SARAH", False, LineKind.CHARACTER),
+        ("JOHN (CONT'D)", True, LineKind.CHARACTER),
+        ("(beat)", True, LineKind.PARENTHETICAL),
+        ("(beat)", False, LineKind.ACTION),
+        ("Hello there.", True, LineKind.DIALOGUE),
+        ("CUT TO:", False, LineKind.TRANSITION),
+        ("FADE OUT.", True, LineKind.TRANSITION),
+        ("THE DOOR SLAMS SHUT.", False, LineKind.ACTION),
+    ],
+)
+def test_classify_lines(
+    script_parser: ScriptParser, line: str, after_cue: bool, kind: LineKind
+) -> None:
+    """Test the role assigned to each kind of screenplay line."""
+    assert script_parser.classify(line, after_cue=after_cue) is kind
+
+
+@pytest.mark.parametrize(
+    ("line", "heading"),
+    [
+        ("INT. HOUSE - DAY", ("HOUSE", "DAY")),
+        ("**ext. beach -  morning**", ("beach", "morning")),
+        ("INT. A - DAY - CONTINUOUS", ("A - DAY", "CONTINUOUS")),
+        ("INT. a -- b - 9", None),
+        ("INT.   - DAY", ("", "DAY")),
+        ("INT.  - DAY", None),
+        ("INT. ROOM -DAY", None),
+        ("***INT. ROOM - DAY", None),
+    ],
+)
+def test_match_heading(script_parser: ScriptParser, line: str, heading: tuple) -> None:
+    """Test heading recognition, including the greedy location and degenerate lines."""
+    assert script_parser.match_heading(line) == heading
+
+
+def test_long_heading_like_line_is_linear(script_parser: ScriptParser) -> None:
+    """Test that a long line that almost looks like a heading is rejected quickly."""
+    line = "INT." + " " * 20_000 + "- " * 20_000 + "9"
+
+    started = time.perf_counter()
+    assert script_parser.match_heading(line) is None
+    assert time.perf_counter() - started < 0.5
+
+
+def test_parentheticals_and_transitions(script_parser: ScriptParser) -> None:
+    """Test that parentheticals keep the cue and transitions are not scene content."""
+    content = "INT. ROOM - DAY\n\nSARAH\n(to herself)\nNot again.\n\nCUT TO:\n\nShe leaves.\n"
+
+    scene = script_parser.parse(content, "Transitions").scenes[0]
+
+    assert scene.dialogue == [{"character": "SARAH", "line": "Not again."}]
+    assert scene.description == "She leaves."
@@ -0,0 +1,242 @@
+"""Unit tests for dialogue speech synthesis."""
+
+import io
+import json
+import time
+import wave
+from pathlib import Path
+from typing import Optional
+
+import httpx
+import pytest
+
+from script_to_film.models.script import Script, ScriptScene
+from script_to_film.models.video import VideoScene, VideoStatus
+from script_to_film.services.artifacts import SceneCheckpoint
+from script_to_film.services.ai_service import AIService
+from script_to_film.services.rate_limiter import Quota, RateLimiter
+from script_to_film.services.speech import (
+    LineCache,
+    OpenAIVoiceBackend,
+    SpeechError,
+    SpeechSynthesizer,
+    StubVoiceBackend,
+    VoiceBackend,
+    mix_track,
+    pcm_duration,
+    silence,
+)
+from script_to_film.services.video_generator import Keyframe, VideoGenerator
+
+
+def wav_seconds(path: str) -> float:
+    """Length of a WAV file in seconds."""
+    with wave.open(path, "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def make_synthesizer(
+    backend: StubVoiceBackend, cache_dir: Optional[Path] = None, **kwargs
+) -> SpeechSynthesizer:
+    """Create a synthesizer, optionally caching lines in ``cache_dir``."""
+    cache = LineCache(cache_dir) if cache_dir is not None else None
+    return SpeechSynthesizer(backend, cache=cache, **kwargs)
+
+
+def test_mix_track_spaces_and_pads_lines() -> None:
+    """Test that lines are separated by the gap and padded to the scene length."""
+    lines = [silence(1.0), silence(0.5)]
+
+    assert pcm_duration(mix_track(lines, 5.0, gap=0.25)) == pytest.approx(5.0)
+    assert pcm_duration(mix_track(lines, 1.0, gap=0.25)) == pytest.approx(1.75)
+
+
+def test_voice_assignment_is_stable() -> None:
+    """Test that characters keep their voice across synthesizers unless overridden."""
+    first = make_synthesizer(StubVoiceBackend())
+    second = make_synthesizer(StubVoiceBackend())
+
+    assert first.voice_for("SARAH") == second.voice_for("sarah ")
+    assert first.voice_for("SARAH", {"SARAH": "bright"}) == "bright"
+
+
+async def test_all_lines_fan_out_through_shared_pool(tmp_path: Path) -> None:
+    """Test that lines of every scene are synthesized concurrently, capped by the pool."""
+    backend = StubVoiceBackend(delay=0.02)
+    speech = make_synthesizer(backend, max_concurrent_requests=4)
+    scenes = [
+        (
+            [{"character": "SARAH", "line": f"Line {i} a"}, {"character": "TOM", "line": f"{i} b"}],
+            3.0,
+            tmp_path / f"scene_{i}.wav",
+        )
+        for i in range(3)
+    ]
+
+    tracks = await speech.synthesize_scenes(scenes)
+
+    assert len(backend.calls) == 6
+    assert backend.peak_in_flight == 4
+    assert tracks == [str(tmp_path / f"scene_{i}.wav") for i in range(3)]
+    assert wav_seconds(tracks[0]) == pytest.approx(3.0)
+
+
+async def test_rerender_only_synthesizes_edited_lines(tmp_path: Path) -> None:
+    """Test that cached lines are reused and only changed lines hit the backend."""
+    dialogue = [
+        {"character": "SARAH", "line": "I'd know that voice anywhere."},
+        {"character": "TOM", "line": "Sarah? Is that really you?"},
+    ]
+    await make_synthesizer(StubVoiceBackend(), tmp_path / "cache").synthesize_track(
+        dialogue, 5.0, tmp_path / "first.wav"
+    )
+
+    backend = StubVoiceBackend()
+    edited = [dialogue[0], {"character": "TOM", "line": "Sarah? Is it you?"}]
+    await make_synthesizer(backend, tmp_path / "cache").synthesize_track(
+        edited, 5.0, tmp_path / "second.wav"
+    )
+
+    assert backend.calls == [("Sarah? Is it you?", backend.calls[0][1], None)]
+
+
+async def test_emotion_is_part_of_the_key(tmp_path: Path) -> None:
+    """Test that the same line with a different delivery is synthesized again."""
+    backend = StubVoiceBackend()
+    speech = make_synthesizer(backend, tmp_path / "cache")
+
+    await speech.synthesize_line("Get out.", "low")
+    await speech.synthesize_line("Get out.", "low")
+    await speech.synthesize_line("Get out.", "low", emotion="whispering")
+
+    assert len(backend.calls) == 2
+
+
+async def test_requests_draw_on_provider_quota(tmp_path: Path) -> None:
+    """Test that backend requests are spaced by the provider's shared quota."""
+    limiter = RateLimiter({"stub": Quota(rate=50, burst=1)})
+    speech = make_synthesizer(StubVoiceBackend(), limiter=limiter)
+    dialogue = [{"character": "SARAH", "line": f"Line {i}"} for i in range(5)]
+
+    started = time.perf_counter()
+    await speech.synthesize_track(dialogue, 1.0, tmp_path / "scene.wav")
+
+    assert time.perf_counter() - started >= 0.08
+
+
+async def test_failed_scene_does_not_fail_others(tmp_path: Path) -> None:
+    """Test that a scene whose line fails gets no track while others still do."""
+
+    class _FlakyBackend(StubVoiceBackend):
+        async def synthesize(self, text: str, voice: str, emotion: Optional[str] = None) -> bytes:
+            if text == "boom":
+                raise SpeechError("synthesis failed")
+            return await super().synthesize(text, voice, emotion)
+
+    speech = make_synthesizer(_FlakyBackend())
+
+    tracks = await speech.synthesize_scenes(
+        [
+            ([{"character": "SARAH", "line": "boom"}], 2.0, tmp_path / "a.wav"),
+            ([{"character": "SARAH", "line": "fine"}], 2.0, tmp_path / "b.wav"),
+        ]
+    )
+
+    assert tracks == [None, str(tmp_path / "b.wav")]
+
+
+def test_voice_backend_must_implement_synthesize() -> None:
+    """Test that a backend without ``synthesize`` fails when constructed."""
+
+    class _SilentBackend(VoiceBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        _SilentBackend()
+
+
+async def test_openai_backend_requests_pcm() -> None:
+    """Test the OpenAI speech request body and error handling."""
+    requests: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        if body["input"] == "fail":
+            return httpx.Response(429, text="rate limited")
+        return httpx.Response(200, content=silence(0.5))
+
+    backend = OpenAIVoiceBackend(
+        api_key="key", base_url="https://tts.test/v1", transport=httpx.MockTransport(handler)
+    )
+
+    pcm = await backend.synthesize("Hello.", "nova", emotion="warmly")
+    with pytest.raises(SpeechError):
+        await backend.synthesize("fail", "nova")
+    await backend.aclose()
+
+    assert pcm_duration(pcm) == pytest.approx(0.5)
+    assert requests[0]["response_format"] == "pcm"
+    assert requests[0]["instructions"] == "Speak warmly."
+
+
+async def test_generate_audio_returns_wav() -> None:
+    """Test that AIService.generate_audio returns a playable WAV."""
+    service = AIService(speech=make_synthesizer(StubVoiceBackend()))
+
+    audio = await service.generate_audio("Two friends reunite.", emotion="happy")
+    await service.aclose()
+
+    with wave.open(io.BytesIO(audio), "rb") as wav:
+        assert wav.getnframes() > 0
+
+
+async def test_generate_from_script_attaches_scene_tracks(tmp_path: Path) -> None:
+    """Test that rendered scenes with dialogue get an audio track in the job directory."""
+
+    class _StubGenerator(VideoGenerator):
+        async def request_keyframe(
+            self,
+            scene: ScriptScene,
+            scene_number: int,
+            checkpoint: Optional[SceneCheckpoint] = None,
+        ) -> Keyframe:
+            return Keyframe()
+
+        async def generate_scene_video_runway(
+            self,
+            scene: ScriptScene,
+            scene_number: int,
+            destination: Optional[Path] = None,
+            keyframe: Optional[Keyframe] = None,
+            checkpoint: Optional[SceneCheckpoint] = None,
+        ) -> Optional[VideoScene]:
+            return VideoScene(scene_number=scene_number, duration=5, status=VideoStatus.COMPLETED)
+
+    generator = _StubGenerator(
+        output_dir=str(tmp_path), speech=make_synthesizer(StubVoiceBackend())
+    )
+    script = Script(
+        id="script_1",
+        title="Test",
+        content="",
+        scenes=[
+            ScriptScene(
+                scene_number=0,
+                location="ROOM",
+                time_of_day="DAY",
+                description="",
+                dialogue=[{"character": "SARAH", "line": "Hello there."}],
+                duration_seconds=5,
+            ),
+            ScriptScene(scene_number=1, location="ROOM", time_of_day="NIGHT", description=""),
+        ],
+    )
+
+    video = await generator.generate_from_script(script, job_id="job_1")
+    await generator.aclose()
+
+    track = tmp_path / "jobs" / "job_1" / "scenes" / "scene_000.wav"
+    assert video.scenes[0].audio_path == str(track)
+    assert video.scenes[1].audio_path is None
+    assert wav_seconds(str(track)) == pytest.approx(5.0)
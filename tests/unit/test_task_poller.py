@@ -0,0 +1,175 @@
+"""Unit tests for the shared Runway task poller."""
+
+import asyncio
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from script_to_film.services.runway_client import RunwayAPIError, RunwayClient
+from script_to_film.services.task_poller import TaskPoller, TaskTimeoutError
+from tests.fakes.runway_api import FakeRunway
+from tests.unit.test_runway_client import make_client
+
+
+class RecordingClient:
+    """Wraps a Runway client, recording when and how concurrently tasks are checked."""
+
+    def __init__(self, client: RunwayClient) -> None:
+        self.client = client
+        self.check_times: list[float] = []
+        self.active = 0
+        self.peak = 0
+
+    async def get_task(self, task_id: str):
+        self.check_times.append(time.monotonic())
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            return await self.client.get_task(task_id)
+        finally:
+            self.active -= 1
+
+    async def cancel_task(self, task_id: str) -> None:
+        await self.client.cancel_task(task_id)
+
+
+def make_poller(client, **kwargs) -> TaskPoller:
+    """Create a poller with fast intervals and no jitter."""
+    options = {"initial_interval": 0.005, "max_interval": 0.05, "rng": lambda: 0.5}
+    options.update(kwargs)
+    return TaskPoller(client, **options)
+
+
+async def test_backoff_between_checks() -> None:
+    """Test that the delay between checks of a task grows exponentially."""
+    fake = FakeRunway(polls_until_done=4)
+    client = make_client(fake)
+    recorder = RecordingClient(client)
+    poller = make_poller(recorder, initial_interval=0.01, multiplier=2.0, max_interval=1.0)
+
+    task_id = await client.create_text_to_image(prompt_text="A park")
+    task = await poller.wait(task_id, deadline=time.monotonic() + 5)
+    await client.aclose()
+
+    assert task.status == "SUCCEEDED"
+    gaps = [b - a for a, b in zip(recorder.check_times, recorder.check_times[1:])]
+    assert len(gaps) == 3
+    assert gaps[0] < gaps[1] < gaps[2]
+
+
+async def test_one_loop_checks_every_task() -> None:
+    """Test that concurrent waits share one polling loop with bounded check concurrency."""
+    fake = FakeRunway(polls_until_done=2)
+    client = make_client(fake)
+    recorder = RecordingClient(client)
+    poller = make_poller(recorder, jitter=0.0, max_concurrent_checks=4)
+
+    task_ids = [await client.create_text_to_image(prompt_text=f"Shot {i}") for i in range(12)]
+    deadline = time.monotonic() + 5
+    waits = [asyncio.ensure_future(poller.wait(task_id, deadline)) for task_id in task_ids]
+    await asyncio.sleep(0)
+    loop_task = poller._loop_task
+    results = await asyncio.gather(*waits)
+    await client.aclose()
+
+    assert all(task.status == "SUCCEEDED" for task in results)
+    assert loop_task is not None and loop_task.done()
+    assert len(recorder.check_times) == 24
+    assert recorder.peak <= 4
+    assert poller.in_flight == 0
+
+
+async def test_deadline_cancels_task() -> None:
+    """Test that a missed deadline raises and cancels the Runway task."""
+    fake = FakeRunway(polls_until_done=1000)
+    client = make_client(fake)
+    poller = make_poller(client)
+
+    task_id = await client.create_text_to_image(prompt_text="A park")
+    with pytest.raises(TaskTimeoutError):
+        await poller.wait(task_id, deadline=time.monotonic() + 0.05)
+    await asyncio.sleep(0.01)
+    await client.aclose()
+
+    assert fake.tasks[task_id].cancelled
+    assert poller.in_flight == 0
+
+
+async def test_caller_cancellation_leaves_task_running() -> None:
+    """Test that cancelling the waiter stops polling but leaves the Runway task running."""
+    fake = FakeRunway(polls_until_done=1000)
+    client = make_client(fake)
+    poller = make_poller(client)
+
+    task_id = await client.create_text_to_image(prompt_text="A park")
+    waiter = asyncio.ensure_future(poller.wait(task_id, deadline=time.monotonic() + 5))
+    await asyncio.sleep(0.02)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.sleep(0.01)
+    await client.aclose()
+
+    assert not fake.tasks[task_id].cancelled
+    assert poller.in_flight == 0
+
+
+async def test_unknown_task_raises() -> None:
+    """Test that a task the API does not know fails the wait immediately."""
+    client = make_client(FakeRunway())
+    poller = make_poller(client)
+
+    with pytest.raises(RunwayAPIError) as exc_info:
+        await poller.wait("missing", deadline=time.monotonic() + 5)
+    await client.aclose()
+
+    assert exc_info.value.status_code == 404
+
+
+async def test_check_failing_after_waiter_left_keeps_loop_running() -> None:
+    """Test that a poll error for an abandoned task does not stop checks of other tasks."""
+    client = make_client(FakeRunway(polls_until_done=3))
+    release = asyncio.Event()
+
+    class BlockingClient(RecordingClient):
+        async def get_task(self, task_id: str):
+            if task_id == "blocked":
+                await release.wait()
+                raise RunwayAPIError("Task not found", status_code=404)
+            return await super().get_task(task_id)
+
+    poller = make_poller(BlockingClient(client))
+    task_id = await client.create_text_to_image(prompt_text="A park")
+    abandoned = asyncio.ensure_future(poller.wait("blocked", deadline=time.monotonic() + 5))
+    waiter = asyncio.ensure_future(poller.wait(task_id, deadline=time.monotonic() + 2))
+    await asyncio.sleep(0.02)
+    abandoned.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await abandoned
+    release.set()
+
+    task = await waiter
+    await client.aclose()
+
+    assert task.status == "SUCCEEDED"
+    assert poller.in_flight == 0
+
+
+async def test_records_queue_and_render_time() -> None:
+    """Test that a finished task's queued and rendering time are recorded per step."""
+    client = make_client(FakeRunway(polls_until_done=3))
+    poller = make_poller(client)
+
+    def count(phase: str) -> float:
+        labels = {"step": "poller-test", "phase": phase}
+        return REGISTRY.get_sample_value("runway_task_seconds_count", labels) or 0.0
+
+    task_id = await client.create_text_to_image(prompt_text="A park")
+    await poller.wait(task_id, deadline=time.monotonic() + 5, step="poller-test")
+    await client.aclose()
+    succeeded = {"step": "poller-test", "status": "SUCCEEDED"}
+
+    assert count("queued") == 1
+    assert count("render") == 1
+    assert REGISTRY.get_sample_value("runway_tasks_total", succeeded) == 1
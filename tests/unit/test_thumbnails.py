@@ -0,0 +1,115 @@
+"""Unit tests for thumbnail and preview-strip extraction."""
+
+import os
+import subprocess
+from pathlib import Path
+
+from script_to_film.models.video import Video, VideoScene, VideoStatus
+from script_to_film.services import thumbnails
+from script_to_film.services.compositor import Compositor
+from script_to_film.services.thumbnails import (
+    Thumbnailer,
+    extract_previews,
+    strip_command,
+    thumbnail_command,
+)
+from tests.unit.test_compositor import make_clip, requires_ffmpeg
+
+
+def test_seek_happens_before_input(tmp_path: Path) -> None:
+    """Test that thumbnails use a keyframe input seek rather than decoding from the start."""
+    command = thumbnail_command(tmp_path / "a.mp4", tmp_path / "a.jpg", 2.5, 480)
+
+    assert command.index("-ss") < command.index("-noaccurate_seek") < command.index("-i")
+    assert command[command.index("-ss") + 1] == "2.500"
+    assert command[command.index("-frames:v") + 1] == "1"
+
+
+def test_strip_tiles_one_input_per_frame(tmp_path: Path) -> None:
+    """Test that a preview strip is one ffmpeg run with a seeked input per frame."""
+    command = strip_command(tmp_path / "a.mp4", tmp_path / "a.jpg", [0.5, 1.5, 2.5], 240)
+
+    assert command.count("-i") == 3
+    assert command.count("-ss") == 3
+    assert "tile=3x1" in command[command.index("-filter_complex") + 1]
+
+
+def _fake_ffmpeg(calls: list[list[str]]):
+    """Stand-in for subprocess.run that writes the command's output file."""
+
+    def run(command: list[str], **kwargs) -> subprocess.CompletedProcess:
+        calls.append(command)
+        Path(command[-1]).write_bytes(b"jpeg")
+        return subprocess.CompletedProcess(command, 0)
+
+    return run
+
+
+def test_previews_cached_next_to_clip(tmp_path: Path, monkeypatch) -> None:
+    """Test that previews are reused until the clip changes."""
+    calls: list[list[str]] = []
+    monkeypatch.setattr(thumbnails.subprocess, "run", _fake_ffmpeg(calls))
+    clip = tmp_path / "scene_000.mp4"
+    clip.write_bytes(b"clip")
+
+    thumb, strip = extract_previews(str(clip), 4.0, 480, 4, 240)
+    extract_previews(str(clip), 4.0, 480, 4, 240)
+
+    assert thumb == str(tmp_path / "scene_000.thumb.jpg")
+    assert strip == str(tmp_path / "scene_000.strip.jpg")
+    assert len(calls) == 2
+
+    newer = os.stat(thumb).st_mtime + 10
+    os.utime(clip, (newer, newer))
+    extract_previews(str(clip), 4.0, 480, 4, 240)
+
+    assert len(calls) == 4
+
+
+async def test_previews_for_video(tmp_path: Path, monkeypatch) -> None:
+    """Test that every completed scene gets previews and the video a thumbnail."""
+    monkeypatch.setattr(thumbnails.subprocess, "run", _fake_ffmpeg([]))
+    scenes = []
+    for number in range(3):
+        clip = tmp_path / f"scene_{number:03d}.mp4"
+        clip.write_bytes(b"clip")
+        scenes.append(
+            VideoScene(
+                scene_number=number,
+                visual_path=str(clip),
+                duration=5,
+                status=VideoStatus.FAILED if number == 1 else VideoStatus.COMPLETED,
+            )
+        )
+    video = Video(
+        id="video_1",
+        script_id="script_1",
+        title="Test",
+        resolution="1920x1080",
+        fps=24,
+        scenes=scenes,
+    )
+    compositor = Compositor(max_workers=2, use_processes=False)
+
+    await Thumbnailer(compositor).previews_for_video(video)
+    compositor.shutdown()
+
+    assert video.thumbnail_path == str(tmp_path / "scene_000.thumb.jpg")
+    assert [scene.preview_path is not None for scene in video.scenes] == [True, False, True]
+
+
+@requires_ffmpeg
+def test_extract_real_previews(tmp_path: Path) -> None:
+    """Test thumbnail and strip dimensions with a real clip."""
+    clip = make_clip(tmp_path / "scene_000.mp4")
+
+    thumb, strip = extract_previews(str(clip), 1.0, 160, 4, 80)
+
+    probe = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "stream=width,height", "-of", "csv=p=0", strip],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert Path(thumb).stat().st_size > 0
+    assert probe.stdout.strip() == "320,60"